@@ -78,10 +78,12 @@ def parse_args():
         "-ep",
         "--endpoint",
         type=str,
+        nargs="+",
+        action=SplitArguments,
         required=True,
-        help="fqdn/ip:port of s3 endpoint for io operations without http/https."
-        "protocol in endpoint is based on use_ssl flag.",
-        default="s3.seagate.com",
+        help="One or more(space/comma separated) fqdn/ip:port of s3 endpoints for io operations "
+        "without http/https. protocol in endpoint is based on use_ssl flag.",
+        default=["s3.seagate.com"],
     )
     parser.add_argument(
         "-nn",
@@ -139,7 +141,7 @@ class SplitArguments(Action):
             namespace,
             self.dest,
             [
-                value.strip(",")
+                item.strip()
                 for value in (
                     values
                     if isinstance(values, list)
@@ -147,6 +149,8 @@ class SplitArguments(Action):
                     if isinstance(values, str)
                     else values
                 )
+                for item in value.split(",")
+                if item.strip()
             ],
         )
 
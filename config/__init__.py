@@ -56,18 +56,7 @@ _USE_SSL = (
     else None
 )
 SSL_FLG = IO_DRIVER_ARGS[IO_DRIVER_ARGS.index(_USE_SSL) + 1] if _USE_SSL else True
-_ENDPOINT = (
-    "-ep"
-    if "-ep" in IO_DRIVER_ARGS
-    else "--endpoint"
-    if "--endpoint" in IO_DRIVER_ARGS
-    else None
-)
-S3_URL = (
-    IO_DRIVER_ARGS[IO_DRIVER_ARGS.index(_ENDPOINT) + 1]
-    if _ENDPOINT
-    else "s3.seagate.com"
-)
+S3_URLS = opts.endpoint
 _S3MAX_RETRY = (
     "-mr"
     if "-mr" in IO_DRIVER_ARGS
@@ -79,12 +68,18 @@ S3MAX_RETRY = (
     IO_DRIVER_ARGS[IO_DRIVER_ARGS.index(_S3MAX_RETRY) + 1] if _S3MAX_RETRY else 1
 )
 USE_SSL = ast.literal_eval(str(SSL_FLG).title())
-S3_ENDPOINT = f"{'https' if USE_SSL else 'http'}://{S3_URL}"
+S3_ENDPOINTS = [f"{'https' if USE_SSL else 'http'}://{s3_url}" for s3_url in S3_URLS]
+# Endpoints(with http/https) from s3 config are used along with endpoints from commandline.
+S3_ENDPOINTS.extend(
+    [s3_url for s3_url in S3_CFG.get("endpoints") or [] if s3_url not in S3_ENDPOINTS]
+)
+S3_ENDPOINT = S3_ENDPOINTS[0]
 
 S3_CFG["access_key"] = opts.access_key
 S3_CFG["secret_key"] = opts.secret_key
 S3_CFG["use_ssl"] = USE_SSL
 S3_CFG["endpoint"] = S3_ENDPOINT
+S3_CFG["endpoints"] = S3_ENDPOINTS
 S3_CFG["s3max_retry"] = int(S3MAX_RETRY)
 
 # Munched configs. These can be used by dot "." operator.
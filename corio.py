@@ -43,6 +43,8 @@ from src.commons.exception import HealthCheckError
 from src.commons.logger import initialize_loghandler
 from src.commons.utils import corio_utils
 from src.commons.utils.alerts import SendMailNotification
+from src.commons.utils.data_pool import get_data_pool
+from src.commons.utils.data_pool import remove_data_pools
 from src.commons.utils.jira_utils import JiraApp
 from src.commons.utils.resource_util import collect_resource_utilisation
 from src.commons.workload_mapping import SCRIPT_MAPPING
@@ -139,12 +141,15 @@ def main(options):
     corio_start_time = datetime.now()
     LOGGER.info("Parsed files data:\n %s", pformat(parsed_input))
     return_dict = multiprocessing.Manager().dict()
+    # Create random data pool once, workload processes map the same pool.
+    get_data_pool()
     processes = scheduler.schedule_execution_plan(parsed_input, options, return_dict)
     sched = scheduler.schedule_test_status_update(
         parsed_input,
         corio_start_time,
         periodic_time=CORIO_CFG.report_interval_mins,
         sequential_run=options.sequential_run,
+        client_metrics=return_dict,
     )
     mobj = SendMailNotification(
         corio_start_time,
@@ -182,6 +187,7 @@ def main(options):
         terminated_tp = type(err).__name__
     finally:
         scheduler.terminate_processes(processes)
+        remove_data_pools()
         scheduler.terminate_update_test_status(
             parsed_input,
             corio_start_time,
@@ -190,6 +196,7 @@ def main(options):
             sched,
             action="final",
             sequential_run=options.sequential_run,
+            client_metrics=return_dict,
         )
         if jira_obj:
             jira_obj.update_jira_status(
@@ -0,0 +1,113 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""
+Benchmark fixed vs adaptive chunk size of get object reads.
+
+Body is received as network chunks and copied into read buffers of chunk size which are hashed,
+as done by get_s3object_checksum. Adaptive chunk size is picked after reads at given stream
+bandwidth, buffer memory is of two buffers per read session.
+usage: python3 -m scripts.benchmark.chunk_size --bandwidth-mbps 50 1000 --sessions 100
+"""
+
+import argparse
+import hashlib
+import os
+import time
+
+from src.commons.utils.chunk_sizer import ChunkSizer
+
+KIB = 1024
+MIB = 1024**2
+NETWORK_CHUNK_SIZE = 256 * KIB
+OBJECT_SIZES = (4 * KIB, 64 * KIB, MIB, 16 * MIB, 256 * MIB)
+
+
+def read_object(network_chunk: memoryview, size: int, buffer: memoryview) -> int:
+    """Copy body of size from network chunks into read buffer, hash it and get read count."""
+    chunk_size = len(buffer)
+    hasher = hashlib.sha256()
+    received, filled, reads = 0, 0, 0
+    while received < size:
+        chunk = network_chunk[: min(len(network_chunk), size - received)]
+        received += len(chunk)
+        while chunk:
+            count = min(len(chunk), chunk_size - filled)
+            buffer[filled : filled + count] = chunk[:count]
+            chunk = chunk[count:]
+            filled += count
+            if filled == chunk_size or received == size:
+                hasher.update(buffer[:filled])
+                filled, reads = 0, reads + 1
+    hasher.hexdigest()
+    return reads
+
+
+def run(network_chunk: memoryview, size: int, chunk_size: int, total_mb: int) -> tuple:
+    """Read objects of size till total_mb is read and get reads per object and MB/s."""
+    count = max(1, total_mb * MIB // size)
+    # Read buffer is reused by the reads as in buffer pool.
+    buffer = memoryview(bytearray(chunk_size))
+    start = time.perf_counter()
+    for _ in range(count):
+        reads = read_object(network_chunk, size, buffer)
+    elapsed = time.perf_counter() - start
+    return reads, size * count / MIB / elapsed
+
+
+def main():
+    """Run the chunk size benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--bandwidth-mbps",
+        type=int,
+        nargs="+",
+        default=[50, 1000],
+        help="Per stream bandwidth in MB/s of earlier reads.",
+    )
+    parser.add_argument("--sessions", type=int, default=100, help="Concurrent read sessions.")
+    parser.add_argument("--total-mb", type=int, default=512, help="Data read per object size.")
+    parser.add_argument("--fixed-chunk-size", type=int, default=4 * MIB, help="Fixed chunk size.")
+    args = parser.parse_args()
+    network_chunk = memoryview(os.urandom(NETWORK_CHUNK_SIZE))
+    print(
+        f"{'bandwidth':>10}{'object':>12}{'mode':>10}{'chunk':>10}{'reads':>8}"
+        f"{'MB/s':>10}{'buffers MB':>12}"
+    )
+    for bandwidth in args.bandwidth_mbps:
+        sizer = ChunkSizer(default_chunk_size=args.fixed_chunk_size)
+        for _ in range(20):
+            sizer.record(64 * MIB, 64 / bandwidth)
+        for size in OBJECT_SIZES:
+            for mode, chunk_size in (
+                ("fixed", args.fixed_chunk_size),
+                ("adaptive", sizer.get_chunk_size(size)),
+            ):
+                reads, mbps = run(network_chunk, size, chunk_size, args.total_mb)
+                buffers_mb = 2 * chunk_size * args.sessions / MIB
+                print(
+                    f"{bandwidth:>10}{size // KIB:>10}KB{mode:>10}{chunk_size // KIB:>8}KB"
+                    f"{reads:>8}{mbps:>10.1f}{buffers_mb:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
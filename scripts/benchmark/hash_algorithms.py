@@ -0,0 +1,76 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""
+Benchmark single thread throughput of hash algorithms used for data integrity checks.
+
+Data is hashed in chunks of s3 chunk size as done by get_s3object_checksum and checksum_file.
+usage: python3 -m scripts.benchmark.hash_algorithms --size-mb 1024 --chunk-size-mb 4
+"""
+
+import argparse
+import hashlib
+import os
+import time
+
+try:
+    import crc32c
+except ImportError:
+    crc32c = None
+
+MIB = 1024**2
+ALGORITHMS = ("sha256", "blake2b", "md5", "crc32c")
+
+
+def hash_chunks(algorithm: str, chunk: bytes, count: int) -> None:
+    """Hash the chunk count times with algorithm."""
+    if algorithm == "crc32c":
+        value = 0
+        for _ in range(count):
+            value = crc32c.crc32c(chunk, value)
+    else:
+        hasher = hashlib.new(algorithm)
+        for _ in range(count):
+            hasher.update(chunk)
+        hasher.hexdigest()
+
+
+def main():
+    """Run the hash algorithms benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=1024, help="Data hashed per algorithm.")
+    parser.add_argument("--chunk-size-mb", type=int, default=4, help="Chunk size in MiB.")
+    args = parser.parse_args()
+    chunk = os.urandom(args.chunk_size_mb * MIB)
+    count = max(1, args.size_mb // args.chunk_size_mb)
+    print(f"{'algorithm':<12}{'MB/s':>12}")
+    for algorithm in ALGORITHMS:
+        if algorithm == "crc32c" and crc32c is None:
+            print(f"{algorithm:<12}{'n/a':>12} (pip install crc32c)")
+            continue
+        start = time.perf_counter()
+        hash_chunks(algorithm, chunk, count)
+        elapsed = time.perf_counter() - start
+        print(f"{algorithm:<12}{len(chunk) * count / MIB / elapsed:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
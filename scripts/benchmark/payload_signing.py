@@ -0,0 +1,104 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""
+Benchmark client CPU per GB of put_object/upload_part for signed and unsigned payload.
+
+Requests are signed exactly as sent to s3 but are short-circuited before send, so only client
+side cost(serialization, Content-MD5, payload SHA256 and signing) is measured.
+usage: python3 -m scripts.benchmark.payload_signing --size-mb 64 --count 16
+"""
+
+import argparse
+import os
+import time
+
+import boto3
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+
+GIB = 1024**3
+
+
+class _Raw:
+    """Empty raw http response body."""
+
+    @staticmethod
+    def stream():
+        """Empty stream."""
+        yield b""
+
+
+def stub_send(**_kwargs) -> AWSResponse:
+    """Return successful response without sending the request."""
+    return AWSResponse("", 200, {"ETag": '"etag"'}, _Raw())
+
+
+def get_client(endpoint: str, payload_signing: str):
+    """Get s3 client with given payload signing and stubbed send."""
+    client = boto3.client(
+        "s3",
+        endpoint_url=endpoint,
+        aws_access_key_id="access",
+        aws_secret_access_key="secret",
+        region_name="us-east-1",
+        config=Config(
+            s3={"payload_signing_enabled": False} if payload_signing == "unsigned" else None
+        ),
+    )
+    client.meta.events.register("before-send.s3", stub_send)
+    return client
+
+
+def cpu_secs_per_gib(client, operation: str, body: bytes, count: int) -> float:
+    """Get process cpu seconds per GiB for count requests of the body."""
+    start = time.process_time()
+    for part in range(1, count + 1):
+        if operation == "upload_part":
+            client.upload_part(
+                Bucket="bucket", Key="key", UploadId="upload-id", PartNumber=part, Body=body
+            )
+        else:
+            client.put_object(Bucket="bucket", Key="key", Body=body)
+    return (time.process_time() - start) * GIB / (len(body) * count)
+
+
+def main():
+    """Run the payload signing benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=64, help="Request body size in MiB.")
+    parser.add_argument("--count", type=int, default=16, help="Number of requests per mode.")
+    parser.add_argument("--endpoint", default="https://s3.seagate.com", help="Endpoint url.")
+    args = parser.parse_args()
+    body = os.urandom(args.size_mb * 1024 * 1024)
+    print(f"{'operation':<12}{'mode':<10}{'cpu_secs_per_gib':>18}")
+    for operation in ("put_object", "upload_part"):
+        results = {}
+        for mode in ("signed", "unsigned"):
+            client = get_client(args.endpoint, mode)
+            results[mode] = cpu_secs_per_gib(client, operation, body, args.count)
+            print(f"{operation:<12}{mode:<10}{results[mode]:>18.3f}")
+        saved = results["signed"] - results["unsigned"]
+        print(f"{operation:<12}{'saved':<10}{saved:>18.3f} ({saved / results['signed']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
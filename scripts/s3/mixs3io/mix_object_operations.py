@@ -128,11 +128,11 @@ class TestMixObjectOps(S3Bucket, S3Object):
 
     # pylint: disable=broad-except
 
-    def execute_mix_object_workload(self):
+    async def execute_mix_object_workload(self):
         """Execute mix object operations workload for specific duration."""
         # pylint: disable=W0511
         # TODO: disable_background_delete/enable_background_delete
-        self.create_s3_bucket(self.bucket_name)
+        await self.create_bucket(self.bucket_name)
         self.log.info("Created bucket: %s", self.bucket_name)
         self.s3_url = f"s3://{self.bucket_name}"
         while True:
@@ -152,13 +152,16 @@ class TestMixObjectOps(S3Bucket, S3Object):
                     # Write data to fill storage as per write percentage.
                     written_data = 0
                     while self.storage_size_to_fill > written_data:
-                        self.write_data(self.file_size, self.write_samples)
+                        # s3bench runs as blocking subprocess, so run it off the event loop.
+                        await self.run_sync(self.write_data, self.file_size, self.write_samples)
                         written_data += self.write_samples * self.file_size
                     self.display_storage_consumed()
                 # Read data as per read percentage.
                 read_data, read_iter = 0, 0
                 while self.storage_size_to_read > read_data:
-                    self.read_data(self.file_size, self.read_samples, validate=True)
+                    await self.run_sync(
+                        self.read_data, self.file_size, self.read_samples, validate=True
+                    )
                     read_data += self.read_samples * self.file_size
                     read_iter += 1
                 read_percentage = int(read_data / self.total_storage * 100)
@@ -171,7 +174,7 @@ class TestMixObjectOps(S3Bucket, S3Object):
                 if self.storage_size_to_delete:
                     deleted_data = 0
                     while self.storage_size_to_delete > deleted_data:
-                        self.delete_data(self.file_size, self.delete_samples)
+                        await self.run_sync(self.delete_data, self.file_size, self.delete_samples)
                         deleted_data += self.file_size * self.delete_samples
                     self.display_storage_consumed(operation="delete")
                 # Cleanup data as per cleanup percentage.
@@ -183,7 +186,12 @@ class TestMixObjectOps(S3Bucket, S3Object):
                             self.s3_url,
                             self.cleanup_percentage,
                         )
-                        self.delete_s3_objects(self.bucket_name)
+                        # Listed objects are deleted by concurrent delete objects batches.
+                        response = await self.delete_prefix_objects(self.bucket_name)
+                        assert not response["Errors"], (
+                            f"Failed to delete {len(response['Errors'])} objects "
+                            f"from {self.s3_url}"
+                        )
                         self.total_written_data *= 0
                         self.log.info("Data cleanup competed...")
                 self.display_storage_consumed(operation="")
@@ -194,7 +202,7 @@ class TestMixObjectOps(S3Bucket, S3Object):
                 )
                 assert False, f"bucket url: {self.s3_url}\nException: {err}"
             if (self.finish_time - datetime.now()).total_seconds() < MIN_DURATION:
-                self.delete_s3_bucket(self.bucket_name, force=True)
+                await self.delete_bucket(self.bucket_name, force=True)
                 return True, "Bucket operation execution completed successfully."
             self.iteration += 1
 
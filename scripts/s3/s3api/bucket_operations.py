@@ -22,8 +22,8 @@ import random
 from datetime import datetime, timedelta
 from time import perf_counter_ns
 
+from src.commons.constants import DATA_DIR_PATH
 from src.commons.constants import MIN_DURATION
-from src.commons.utils import corio_utils
 from src.libs import IAMClient
 from src.libs.s3api import S3Api
 
@@ -63,6 +63,7 @@ class TestBucketOps(S3Api):
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
             test_id=f"{test_id}_bucket_operations",
+            seed=kwargs.get("seed"),
         )
         random.seed(kwargs.get("seed"))
         self.test_id = test_id
@@ -88,6 +89,7 @@ class TestBucketOps(S3Api):
                     endpoint_url=self.kwargs.get("endpoint_url"),
                     use_ssl=self.kwargs.get("use_ssl"),
                     test_id=f"{self.test_id}_bucket_operations",
+                    seed=self.kwargs.get("seed"),
                 )
                 buckets = await self.create_number_of_buckets(bops_obj, number_of_buckets)
             while True:
@@ -101,13 +103,15 @@ class TestBucketOps(S3Api):
                 if number_of_buckets:
                     bucket_name = random.choice(buckets)  # nosec
                     file_name = f"object-{self.test_id.lower()}-{perf_counter_ns()}"
-                    file_path = corio_utils.create_file(file_name, file_size)
-                    sha256_in = bops_obj.checksum_file(file_path)
+                    file_path = os.path.join(DATA_DIR_PATH, file_name)
                     self.s3_url = bops_obj.s3_url
-                    await bops_obj.upload_object(bucket_name, file_name, file_path=file_path)
-                    os.remove(file_path)
+                    response = await bops_obj.upload_generated_object(
+                        bucket_name, file_name, file_size
+                    )
+                    sha256_in = response["Checksum"]
                     await bops_obj.download_object(bucket_name, file_name, file_path)
-                    sha256_out = bops_obj.checksum_file(file_path)
+                    sha256_out = await bops_obj.run_sync(bops_obj.checksum_file, file_path)
+                    os.remove(file_path)
                     if sha256_in != sha256_out:
                         raise AssertionError(
                             f"Failed to match checksum for {bops_obj.s3_url}. "
@@ -149,12 +153,10 @@ class TestBucketOps(S3Api):
         for i in range(1, number_of_objects + 1):
             file_name = f"object-{i}-{perf_counter_ns()}"
             self.log.info("Object '%s', object size %s bytes", file_name, file_size)
-            file_path = corio_utils.create_file(file_name, file_size)
-            await self.upload_object(bucket_name, file_name, file_path=file_path)
+            await self.upload_object(
+                bucket_name, file_name, body=self.data_generator.get_body(file_name, file_size)
+            )
             self.log.info("'%s' uploaded successfully.", self.s3_url)
-            self.log.info("Delete generated file")
-            if os.path.exists(file_path):
-                os.remove(file_path)
 
     async def create_number_of_buckets(self, bkt_ops_obj, number_of_buckets):
         """Create s3 buckets as per number_of_buckets."""
@@ -18,7 +18,6 @@
 #
 """s3 Copy Object workload for io stability."""
 
-import os
 import random
 from datetime import datetime
 from datetime import timedelta
@@ -58,6 +57,7 @@ class TestS3CopyObjects(S3Api):
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
             test_id=f"{test_id}_copy_object_operations",
+            seed=kwargs.get("seed"),
         )
         random.seed(kwargs.get("seed"))
         self.object_size = kwargs.get("object_size")
@@ -97,14 +97,17 @@ class TestS3CopyObjects(S3Api):
                 )
                 # Put object in bucket_name1
                 file_size = await self.get_workload_size()
-                file_path = corio_utils.create_file(object_name1, file_size)
                 self.log.info(
                     "Object1 '%s', object size %s",
                     object_name1,
                     corio_utils.convert_size(file_size),
                 )
                 await self.upload_object(
-                    bucket_name1, object_name1, file_path=file_path
+                    bucket_name1,
+                    object_name1,
+                    body=self.data_generator.get_body(
+                        f"{object_name1}-{self.iteration}", file_size
+                    ),
                 )
                 self.log.info("Objects '%s' uploaded successfully.", self.s3_url)
                 ret1 = await self.head_object(bucket_name1, object_name1)
@@ -148,7 +151,6 @@ class TestS3CopyObjects(S3Api):
                 await self.head_object(bucket_name2, object_name2)
                 self.log.info("Delete destination object from bucket-2.")
                 await self.delete_object(bucket_name2, object_name2)
-                os.remove(file_path)
                 self.log.info(
                     "Iteration %s is completed of %s...",
                     self.iteration,
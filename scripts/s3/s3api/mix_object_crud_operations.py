@@ -47,6 +47,9 @@ class TestTypeXObjectOps(S3ApiParallelIO):
         :param use_ssl: To use secure connection.
         :param object_size: Object size to be used for bucket operation
         :param seed: Seed to be used for random data generator
+        :param validation_mode: Data validation mode checksum/regenerate.
+        :param data_profile: Content profile of data ex: {compress: 2.0, dedup: 0.3}.
+        :param hash_algorithm: Hash algorithm of checksums sha256/blake2b/md5/crc32c.
         :param session: session name.
         :param duration: Duration timedelta object, if not given will run for 100 days.
         """
@@ -56,6 +59,9 @@ class TestTypeXObjectOps(S3ApiParallelIO):
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
             test_id=f"{kwargs.get('test_id')}_mix_s3io_operations",
+            validation_mode=kwargs.get("validation_mode"),
+            data_profile=kwargs.get("data_profile"),
+            hash_algorithm=kwargs.get("hash_algorithm"),
         )
         random.seed(kwargs.get("seed"))
         self.access_key = access_key
@@ -224,7 +230,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     write_object_distribution = await self.get_object_distribution(
                         object_size, operation="write"
                     )
-                    self.execute_workload(
+                    await self.execute_workload(
                         operations="write",
                         distribution=write_object_distribution,
                         sessions=self.sessions,
@@ -238,7 +244,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     read_object_distribution = await self.get_object_distribution(
                         object_size, operation="read"
                     )
-                    self.execute_workload(
+                    await self.execute_workload(
                         operations="read",
                         distribution=read_object_distribution,
                         sessions=self.sessions,
@@ -257,7 +263,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     delete_object_distribution = await self.get_object_distribution(
                         object_size, operation="delete"
                     )
-                    self.execute_workload(
+                    await self.execute_workload(
                         operations="delete",
                         distribution=delete_object_distribution,
                         sessions=self.sessions,
@@ -275,7 +281,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                             self.s3_url,
                             self.cleanup_percentage,
                         )
-                        self.execute_workload(
+                        await self.execute_workload(
                             operations="cleanup", sessions=self.sessions
                         )
                         self.total_written_data *= 0
@@ -291,7 +297,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                 self.log.exception(exception)
                 assert False, exception
             if (self.finish_time - datetime.now()).total_seconds() < MIN_DURATION:
-                self.execute_workload(operations="cleanup", sessions=self.sessions)
+                await self.execute_workload(operations="cleanup", sessions=self.sessions)
                 return True, "Object workload execution completed successfully."
             self.iteration += 1
 
@@ -301,7 +307,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
             try:
                 self.log.info("iteration %s is started...", self.iteration)
                 # Write data to fill storage as per write percentage/distribution.
-                self.execute_workload(
+                await self.execute_workload(
                     operations="write",
                     distribution=self.distribution,
                     sessions=self.sessions,
@@ -312,7 +318,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     self.distribution.values(),
                 )
                 # Read data as per read percentage/distribution.
-                self.execute_workload(
+                await self.execute_workload(
                     operations="read",
                     distribution=self.distribution,
                     sessions=self.sessions,
@@ -324,7 +330,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     self.distribution.values(),
                 )
                 # Delete data as per delete percentage.
-                self.execute_workload(
+                await self.execute_workload(
                     operations="delete",
                     distribution=self.distribution,
                     sessions=self.sessions,
@@ -335,7 +341,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                     self.distribution.values(),
                 )
                 self.log.info("Cleaning up remaining buckets and objects")
-                self.execute_workload(operations="cleanup", sessions=self.sessions)
+                await self.execute_workload(operations="cleanup", sessions=self.sessions)
                 await asyncio.sleep(0)
             except Exception as err:
                 self.log.exception(
@@ -343,7 +349,7 @@ class TestTypeXObjectOps(S3ApiParallelIO):
                 )
                 assert False, f"bucket url: {self.s3_url}\nException: {err}"
             if (self.finish_time - datetime.now()).total_seconds() < MIN_DURATION:
-                self.execute_workload(operations="cleanup", sessions=self.sessions)
+                await self.execute_workload(operations="cleanup", sessions=self.sessions)
                 return True, "Bucket operation execution completed successfully."
             self.log.info("iteration %s is completed...", self.iteration)
             self.iteration += 1
@@ -17,7 +17,6 @@
 #
 """Script type5 s3 object operation negative scenario workload for io stability."""
 
-import os
 import random
 from datetime import timedelta, datetime
 from time import perf_counter_ns
@@ -50,6 +49,7 @@ class TestType5ObjectRRNegative(S3Api):
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
             test_id=f"{kwargs.get('test_id')}_object_negative",
+            seed=kwargs.get("seed"),
         )
         random.seed(kwargs.get("seed"))
         self.test_id = test_id
@@ -80,8 +80,11 @@ class TestType5ObjectRRNegative(S3Api):
                 response = await self.create_multipart_upload(mpart_bucket, s3mpart_object)
                 mpu_id = response["UploadId"]
                 for i in range(1, number_of_parts + 1):
-                    byte_s = os.urandom(round(single_part_size))
-                    await self.upload_part(byte_s, mpart_bucket, s3mpart_object,
+                    # Part data is generated in memory from the key and offset of the part.
+                    body = self.data_generator.get_body(
+                        s3mpart_object, single_part_size, (i - 1) * single_part_size
+                    )
+                    await self.upload_part(body, mpart_bucket, s3mpart_object,
                                            upload_id=mpu_id, part_number=i)
                 parts = await self.list_parts(mpart_bucket, s3mpart_object, mpu_id)
                 while parts:
@@ -20,15 +20,21 @@
 #
 """File contains s3 multipart test script for io stability."""
 
-import hashlib
-import os
+import asyncio
 import random
 from datetime import datetime, timedelta
+from functools import partial
 from time import perf_counter_ns
 
 from src.commons.constants import MIN_DURATION
 from src.commons.utils import corio_utils
+from src.commons.utils.hash_utils import MD5
+from src.commons.utils.hash_utils import new_hash
 from src.libs.s3api import S3Api
+from src.libs.s3api.s3_multipart_ops import ETAG_VALIDATION
+from src.libs.s3api.s3_multipart_ops import MULTIPART_CFG
+from src.libs.s3api.s3_multipart_ops import PARTS_VALIDATION
+from src.libs.s3api.s3_object_ops import CHECKSUM_VALIDATION
 
 
 # pylint: disable=too-many-instance-attributes
@@ -54,6 +60,14 @@ class TestMultiParts(S3Api):
         :param session: session name.
         :param part_range: Number of parts to be uploaded from given range.
         :param part_copy: Perform part copy if True else normal part upload.
+        :param hash_algorithm: Hash algorithm of checksums sha256/blake2b/md5/crc32c.
+        :param parts_in_flight: Max parts of an object uploaded at once.
+        :param parallel_read: Byte range size and ranges in flight of parallel object reads.
+        :param validation_mode: checksum(compare checksum of download), etag(compare ETag of
+            head object with ETag calculated on upload) or parts(compare checksum of every part
+            read concurrently as byte range with part manifest of upload).
+        :param full_validation_fraction: Fraction of objects validated by checksum of download
+            in etag or parts validation mode, default is full_validation_fraction of s3 config.
         :param duration: Duration timedelta object, if not given will run for 100 days.
         """
         self.part_copy = kwargs.get("part_copy", False)
@@ -67,10 +81,26 @@ class TestMultiParts(S3Api):
                 if self.part_copy
                 else f"{test_id}_multipart_operations"
             ),
+            seed=kwargs.get("seed"),
+            hash_algorithm=kwargs.get("hash_algorithm"),
+            parallel_read=kwargs.get("parallel_read"),
         )
         random.seed(kwargs.get("seed"))
         self.object_size = kwargs.get("object_size")
         self.part_range = kwargs.get("part_range")
+        self.parts_in_flight = kwargs.get("parts_in_flight")
+        self.multipart_validation = kwargs.get("validation_mode") or CHECKSUM_VALIDATION
+        if self.multipart_validation not in (
+            CHECKSUM_VALIDATION,
+            ETAG_VALIDATION,
+            PARTS_VALIDATION,
+        ):
+            raise ValueError(f"Unsupported validation mode: {self.multipart_validation}")
+        self.full_validation_fraction = kwargs.get("full_validation_fraction")
+        if self.full_validation_fraction is None:
+            self.full_validation_fraction = MULTIPART_CFG.get("full_validation_fraction", 0.1)
+        # Own generator so that sampling does not change sizes drawn from seeded random.
+        self.validation_sampler = random.Random(kwargs.get("seed"))
         self.range_read = kwargs.get("range_read")
         self.session_id = kwargs.get("session")
         self.iteration = 1
@@ -101,21 +131,20 @@ class TestMultiParts(S3Api):
                 self.log.info(
                     "single part size: %s", corio_utils.convert_size(single_part_size)
                 )
-                upload_obj_checksum = await self.create_upload_list_completed_mpart(
+                (
+                    object_size,
+                    multipart_etag,
+                    upload_obj_checksum,
+                ) = await self.create_upload_list_completed_mpart(
                     number_of_parts, mpart_bucket, s3mpart_object, s3_object
                 )
                 all_object = await self.list_objects(mpart_bucket)
                 assert (
                     s3mpart_object in all_object
                 ), f"Failed to upload object {s3mpart_object}"
-                await self.head_object(mpart_bucket, s3mpart_object)
-                download_obj_checksum = await self.get_s3object_checksum(
-                    mpart_bucket, s3mpart_object, single_part_size
+                await self.validate_mpart_object(
+                    mpart_bucket, s3mpart_object, object_size, multipart_etag, upload_obj_checksum
                 )
-                self.log.info("Checksum of s3 object: %s", download_obj_checksum)
-                assert (
-                    upload_obj_checksum == download_obj_checksum
-                ), f"Failed to match checksum: {upload_obj_checksum}, {download_obj_checksum}"
                 if self.range_read:
                     await self.range_read_mpart_object(mpart_bucket, s3mpart_object)
                 if self.part_copy:
@@ -130,8 +159,15 @@ class TestMultiParts(S3Api):
                 self.log.exception(
                     "bucket url: {%s} \nException: {%s}", self.s3_url, err
                 )
-                assert False, f"bucket url: {self.s3_url} \n Exception: {err}"
+                try:
+                    await self.abort_multipart_uploads(mpart_bucket)
+                except Exception as abort_err:
+                    self.log.warning(
+                        "Failed to abort uploads of %s: %s", mpart_bucket, abort_err
+                    )
+                raise AssertionError(f"bucket url: {self.s3_url} \n Exception: {err}") from err
             if (self.finish_time - datetime.now()).total_seconds() < MIN_DURATION:
+                await self.abort_multipart_uploads(mpart_bucket)
                 await self.delete_bucket(mpart_bucket, force=True)
                 self.log.info("Deleted bucket %s with all objects in it.", mpart_bucket)
                 return True, "Multipart execution completed successfully."
@@ -174,48 +210,152 @@ class TestMultiParts(S3Api):
             resp
         ), f"Failed to read bytes {self.range_read} from s3://{s3bucket}/{s3object}"
 
+    # pylint: disable=too-many-arguments
+    def iter_parts(
+        self, s3mpart_object, part_sizes, copy_source=None, copy_part=None, part_bodies=None
+    ):
+        """
+        Generate parts of multipart object lazily as they are uploaded.
+
+        Part data is sliced from shared data pool at its offset in multipart object, copy_part is
+        copied from copy_source. If part_bodies is given then bodies of the parts hashing the
+        part as it is uploaded are added to it i.e. md5 in etag validation mode else hash
+        algorithm, checksum of copied part is of generated data.
+        """
+        algorithm = MD5 if self.multipart_validation == ETAG_VALIDATION else self.hash_algorithm
+        offset = 0
+        for part_number, part_size in enumerate(part_sizes, 1):
+            body = self.data_generator.get_body(
+                s3mpart_object,
+                part_size,
+                offset,
+                hasher=new_hash(algorithm) if part_bodies is not None else None,
+            )
+            if part_bodies is not None:
+                part_bodies[part_number] = body
+            if part_number == copy_part:
+                yield {"PartNumber": part_number, "CopySource": copy_source, "Size": part_size}
+            else:
+                yield {"PartNumber": part_number, "Body": body}
+            offset += part_size
+
+    # pylint: disable=too-many-arguments
+    async def validate_mpart_object(
+        self, s3bucket, s3object, object_size, multipart_etag, upload_obj_checksum
+    ):
+        """
+        Validate multipart object as per validation mode.
+
+        In etag mode ETag of head object is compared with ETag calculated on upload, in parts
+        mode checksum of every part is compared with part manifest. Object is downloaded to
+        compare checksum only if its checksum was calculated on upload i.e. in checksum mode or
+        for sampled full_validation_fraction of the objects.
+        """
+        response = await self.head_object(s3bucket, s3object)
+        if self.multipart_validation == ETAG_VALIDATION:
+            assert (
+                response["ETag"] == multipart_etag
+            ), f"Failed to match ETag: {multipart_etag}, {response['ETag']}"
+            self.log.info("ETag of s3 object matched: %s", multipart_etag)
+        elif self.multipart_validation == PARTS_VALIDATION:
+            await self.validate_parts(s3bucket, s3object, self.parts_in_flight)
+        if upload_obj_checksum is None:
+            return
+        self.log.info("Checksum of uploaded object: %s", upload_obj_checksum)
+        # Object is read in adaptive(or configured) chunk size, not in random part size.
+        download_obj_checksum = await self.get_s3object_checksum(
+            s3bucket, s3object, size=object_size
+        )
+        self.log.info("Checksum of s3 object: %s", download_obj_checksum)
+        assert (
+            upload_obj_checksum == download_obj_checksum
+        ), f"Failed to match checksum: {upload_obj_checksum}, {download_obj_checksum}"
+
     async def create_upload_list_completed_mpart(
         self, number_of_parts, mpart_bucket, s3mpart_object, s3_object
-    ) -> str:
-        """Upload, list and complete multipart operations."""
+    ) -> tuple:
+        """
+        Upload parts concurrently, list and complete multipart operations.
+
+        Checksum of the object is calculated from generated data while the parts are uploaded
+        in checksum mode or if object is sampled for full validation.
+        :return: Size of the object, its ETag calculated on upload in etag validation mode and
+            its checksum calculated on upload or None.
+        """
         response = await self.create_multipart_upload(mpart_bucket, s3mpart_object)
         random_part = random.randrange(1, number_of_parts + 1)
-        parts = []
-        file_hash = hashlib.sha256()
-        for i in range(1, number_of_parts + 1):
-            byte_s = os.urandom(round(await self.get_workload_size() / number_of_parts))
-            if self.part_copy and i == random_part:
-                await self.upload_object(
-                    body=byte_s, bucket=mpart_bucket, key=s3_object
-                )
-                assert s3_object in await self.list_objects(mpart_bucket), (
-                    f"Failed to upload " f"object {s3_object}"
-                )
-                upload_resp = await self.upload_part_copy(
-                    f"{mpart_bucket}/{s3_object}",
-                    mpart_bucket,
-                    s3_object,
-                    part_number=i,
-                    upload_id=response["UploadId"],
-                )
-            else:
-                upload_resp = await self.upload_part(
-                    byte_s,
+        part_sizes = [
+            round(await self.get_workload_size() / number_of_parts)
+            for _ in range(number_of_parts)
+        ]
+        copy_part = None
+        if self.part_copy:
+            copy_part = random_part
+            await self.upload_object(
+                body=self.data_generator.get_body(
+                    s3mpart_object, part_sizes[copy_part - 1], sum(part_sizes[: copy_part - 1])
+                ),
+                bucket=mpart_bucket,
+                key=s3_object,
+            )
+            assert s3_object in await self.list_objects(mpart_bucket), (
+                f"Failed to upload " f"object {s3_object}"
+            )
+        part_bodies = {} if self.multipart_validation != CHECKSUM_VALIDATION else None
+        full_validation = (
+            self.multipart_validation == CHECKSUM_VALIDATION
+            or self.validation_sampler.random() < self.full_validation_fraction
+        )
+        # Upload is resumed from the parts recorded in journal if a part failed.
+        tasks = [
+            asyncio.ensure_future(
+                self.resume_upload_parts(
                     mpart_bucket,
                     s3mpart_object,
-                    upload_id=response["UploadId"],
-                    part_number=i,
+                    response["UploadId"],
+                    partial(
+                        self.iter_parts,
+                        s3mpart_object,
+                        part_sizes,
+                        f"{mpart_bucket}/{s3_object}",
+                        copy_part,
+                        part_bodies,
+                    ),
+                    self.parts_in_flight,
                 )
-            etag = (
-                upload_resp["CopyPartResult"]["ETag"]
-                if self.part_copy
-                else upload_resp["ETag"]
             )
-            assert etag is not None, f"Failed upload part: {upload_resp}"
-            parts.append({"PartNumber": i, "ETag": etag})
-            file_hash.update(byte_s)
-        upload_obj_checksum = file_hash.hexdigest()
-        self.log.info("Checksum of uploaded object: %s", upload_obj_checksum)
+        ]
+        if full_validation:
+            # Parts are uploaded concurrently, so data is hashed in order meanwhile.
+            tasks.append(
+                asyncio.ensure_future(self.get_data_checksum(s3mpart_object, sum(part_sizes)))
+            )
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            # Sibling of failed task is cancelled, its result or error is retrieved.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        parts = results[0]
+        upload_obj_checksum = results[1] if full_validation else None
+        multipart_etag = None
+        # Checksum of the parts not read while uploading i.e. copied part is of generated data.
+        if self.multipart_validation == ETAG_VALIDATION:
+            multipart_etag = self.get_multipart_etag(
+                part_bodies[part_number].hexdigest() for part_number in sorted(part_bodies)
+            )
+            self.log.info("ETag of uploaded object: %s", multipart_etag)
+        elif self.multipart_validation == PARTS_VALIDATION:
+            self.store_part_manifest(
+                mpart_bucket,
+                s3mpart_object,
+                self.hash_algorithm,
+                (
+                    (part_sizes[part_number - 1], part_bodies[part_number].hexdigest())
+                    for part_number in sorted(part_bodies)
+                ),
+            )
         await self.list_parts(response["UploadId"], mpart_bucket, s3mpart_object)
         await self.list_multipart_uploads(mpart_bucket)
         await self.complete_multipart_upload(
@@ -224,4 +364,4 @@ class TestMultiParts(S3Api):
         self.log.info(
             "'s3://%s/%s' uploaded successfully.", mpart_bucket, s3mpart_object
         )
-        return upload_obj_checksum
+        return sum(part_sizes), multipart_etag, upload_obj_checksum
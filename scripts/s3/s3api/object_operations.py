@@ -24,7 +24,6 @@ from datetime import timedelta, datetime
 from time import perf_counter_ns
 
 from src.commons.constants import MIN_DURATION
-from src.commons.utils import corio_utils
 from src.libs.s3api import S3Api
 
 
@@ -50,6 +49,10 @@ class TestS3Object(S3Api):
         :param seed: Seed for random number generator.
         :param session: session name.
         :param range_read: Range read size
+        :param validation_mode: Data validation mode checksum/regenerate.
+        :param data_profile: Content profile of data ex: {compress: 2.0, dedup: 0.3}.
+        :param hash_algorithm: Hash algorithm of checksums sha256/blake2b/md5/crc32c.
+        :param parallel_read: Byte range size and ranges in flight of parallel object reads.
         :param duration: Duration timedelta object, if not given will run for 100 days.
         """
         super().__init__(
@@ -58,6 +61,11 @@ class TestS3Object(S3Api):
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
             test_id=f"{test_id}_object_operations",
+            seed=kwargs.get("seed"),
+            validation_mode=kwargs.get("validation_mode"),
+            data_profile=kwargs.get("data_profile"),
+            hash_algorithm=kwargs.get("hash_algorithm"),
+            parallel_read=kwargs.get("parallel_read"),
         )
         random.seed(kwargs.get("seed"))
         self.test_id = test_id
@@ -88,11 +96,8 @@ class TestS3Object(S3Api):
                 else:
                     range_read = self.range_read
                 file_name = f"object-bucket-op-{perf_counter_ns()}"
-                file_path = corio_utils.create_file(file_name, file_size)
                 self.log.info("Object '%s', object size %s bytes", file_name, file_size)
-                checksum_in = self.checksum_file(file_path)
-                self.log.debug("Checksum IN = %s", checksum_in)
-                await self.upload_object(bucket, file_name, file_path=file_path)
+                response = await self.upload_generated_object(bucket, file_name, file_size)
                 self.log.info("s3://%s/%s uploaded successfully.", bucket, file_name)
                 self.log.info("Perform Head bucket.")
                 await self.head_object(bucket, file_name)
@@ -116,29 +121,20 @@ class TestS3Object(S3Api):
                             file_size,
                             f'bytes={f"{start_loc}-{end_loc}"}',
                         )
-                        assert await self.get_s3object_checksum(
-                            bucket,
-                            file_name,
-                            ranges=f'bytes={f"{start_loc}-{end_loc}"}',
-                        ) == self.checksum_part_file(file_path, start_loc, range_read), (
-                            f"Checksum of downloaded part for range  "
-                            f"({f'{start_loc}-{end_loc}'}) does not "
-                            f"match for s3://{bucket}/{file_name}."
+                        await self.validate_s3object(
+                            bucket, file_name, range_read, offset=start_loc
                         )
                         self.log.info(
-                            "Able to read and match byte range '{%s}' for %s with original file "
-                            "%s",
+                            "Able to read and match byte range '{%s}' for %s with original data.",
                             f"{start_loc}-{end_loc}",
                             f"s3://{bucket}/{file_name}.",
-                            file_path,
                         )
                 else:
-                    assert checksum_in == await self.get_s3object_checksum(
-                        bucket, file_name
-                    ), f"Data integrity failed for object: {file_name}."
+                    await self.validate_s3object(
+                        bucket, file_name, file_size, checksum=response["Checksum"]
+                    )
                 self.log.info("Delete object.")
                 await self.delete_object(bucket, file_name)
-                os.remove(file_path)
                 self.log.info("Iteration %s is completed of %s...", self.iteration, self.session_id)
             except Exception as err:
                 self.log.exception("bucket url: {%s}\nException: {%s}", self.s3_url, err)
@@ -17,7 +17,6 @@
 #
 """Script type5 s3 object operation negative scenario workload for io stability."""
 
-import os
 import random
 from datetime import timedelta, datetime
 from time import perf_counter_ns
@@ -25,7 +24,6 @@ from time import perf_counter_ns
 from src.commons.constants import MIN_DURATION
 from src.libs.s3api import S3Api
 from botocore.exceptions import ClientError
-from src.commons.utils import corio_utils
 
 class TestType5ObjectReadNegative(S3Api):
     """S3 objects type5 operations negative scenario class."""
@@ -50,6 +48,7 @@ class TestType5ObjectReadNegative(S3Api):
             endpoint_url=endpoint_url,
             use_ssl=kwargs.get("use_ssl"),
             test_id=f"{kwargs.get('test_id')}_object_negative",
+            seed=kwargs.get("seed"),
         )
         random.seed(kwargs.get("seed"))
         self.test_id = test_id
@@ -100,9 +99,8 @@ class TestType5ObjectReadNegative(S3Api):
         for i in range(1, number_of_objects + 1):
             file_name = f"object-{i}-{perf_counter_ns()}"
             self.log.info("Object '%s', object size %s bytes", file_name, file_size)
-            file_path = corio_utils.create_file(file_name, file_size)
-            await self.upload_object(bucket_name, file_name, file_path=file_path)
+            # Object data is generated in memory from the key instead of local file.
+            await self.upload_object(
+                bucket_name, file_name, body=self.data_generator.get_body(file_name, file_size)
+            )
             self.log.info("'%s' uploaded successfully.", self.s3_url)
-            self.log.info("Delete generated file")
-            if os.path.exists(file_path):
-                os.remove(file_path)
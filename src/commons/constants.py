@@ -36,6 +36,7 @@ CORIO_CFG_PATH = os.path.join(CONFIG_DIR, "corio_config.yaml")
 S3_TOOL_PATH = os.path.join(CONFIG_DIR, "s3", "s3_tools.yaml")
 MOUNT_DIR = os.path.join("/mnt", "nfs_share")
 DATA_DIR_PATH = os.path.join(CORIO_ROOT, DATA_DIR)
+MULTIPART_JOURNAL_DIR = os.path.join(DATA_DIR_PATH, "multipart_journal")
 LOG_DIR = os.path.join(CORIO_ROOT, "log")
 REPORTS_DIR = os.path.join(CORIO_ROOT, "reports")
 CMN_LOG_DIR = os.path.join(MOUNT_DIR, "CorIO-Execution", socket.gethostname())
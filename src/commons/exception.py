@@ -73,6 +73,10 @@ class CorIOException(Exception):
     """General exception class for corio tool."""
 
 
+class CircuitBreakerOpenError(CorIOException):
+    """Exception class for request rejected by open circuit breaker of endpoint."""
+
+
 class CreateBucketException(ClientError,
                             ParamValidationError,
                             Boto3Error):
@@ -0,0 +1,122 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Client side metrics collected by workload processes and reported in summary report."""
+
+import copy
+import logging
+import threading
+from datetime import datetime
+
+from src.commons.constants import ROOT
+
+LOGGER = logging.getLogger(ROOT)
+
+METRICS_PREFIX = "client_metrics_"
+METRICS_LOCK = threading.Lock()
+# {section: {name: {field: value}}} of the current process.
+CLIENT_METRICS = {}
+
+
+def update_metrics(section: str, name: str, **fields) -> None:
+    """
+    Set the field values of named metric in a section.
+
+    :param section: Section of the metrics ex: connection_pool.
+    :param name: Name of the metric ex: endpoint url.
+    :param fields: Field, value of the metric to be set.
+    """
+    with METRICS_LOCK:
+        CLIENT_METRICS.setdefault(section, {}).setdefault(name, {}).update(fields)
+
+
+def increment_metrics(section: str, name: str, **fields) -> None:
+    """
+    Add values to the fields of named metric in a section.
+
+    :param section: Section of the metrics ex: retries.
+    :param name: Name of the metric ex: operation name.
+    :param fields: Field, value to be added to the metric.
+    """
+    with METRICS_LOCK:
+        metric = CLIENT_METRICS.setdefault(section, {}).setdefault(name, {})
+        for field, value in fields.items():
+            metric[field] = metric.get(field, 0) + value
+
+
+def add_event(section: str, **fields) -> None:
+    """
+    Append timestamped event to the timeline section.
+
+    :param section: Section of the events ex: circuit_breaker.
+    :param fields: Field, value of the event.
+    """
+    with METRICS_LOCK:
+        CLIENT_METRICS.setdefault(section, []).append(
+            {"time": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f"), **fields}
+        )
+
+
+def get_metrics() -> dict:
+    """Get the copy of all metrics collected by the current process."""
+    with METRICS_LOCK:
+        return copy.deepcopy(CLIENT_METRICS)
+
+
+def publish_metrics(shared_dict, name: str) -> None:
+    """
+    Publish metrics of the current process to dict shared with main process.
+
+    :param shared_dict: multiprocessing manager dict.
+    :param name: Name of the process/test plan.
+    """
+    try:
+        shared_dict[f"{METRICS_PREFIX}{name}"] = get_metrics()
+    except (OSError, EOFError) as error:
+        LOGGER.warning("Failed to publish client metrics of %s: %s", name, error)
+
+
+class MetricsPublisher(threading.Thread):
+    """Publish client metrics of the process periodically in background."""
+
+    def __init__(self, shared_dict, name: str, interval: int):
+        """
+        Initialize metrics publisher.
+
+        :param shared_dict: multiprocessing manager dict.
+        :param name: Name of the process/test plan.
+        :param interval: Publish interval in seconds.
+        """
+        super().__init__(name=f"metrics_{name}", daemon=True)
+        self.shared_dict = shared_dict
+        self.metrics_name = name
+        self.interval = interval
+        self.stop_event = threading.Event()
+
+    def run(self) -> None:
+        """Publish metrics till publisher is stopped."""
+        while not self.stop_event.wait(self.interval):
+            publish_metrics(self.shared_dict, self.metrics_name)
+
+    def stop(self) -> None:
+        """Stop publisher and publish latest metrics."""
+        self.stop_event.set()
+        publish_metrics(self.shared_dict, self.metrics_name)
@@ -27,6 +27,7 @@ from typing import Union
 import pandas as pd
 
 from src.commons.constants import ROOT
+from src.commons.metrics import METRICS_PREFIX
 from src.commons.utils.corio_utils import convert_size
 from src.commons.utils.corio_utils import get_report_file_path
 from src.commons.utils.corio_utils import monitor_sessions_iterations
@@ -42,6 +43,7 @@ def log_status(parsed_input: dict, corio_start_time: datetime, **kwargs):
     :param corio_start_time: Start time for main process.
     # :param test_failed: Reason for failure is any.
     # :param terminated_tests: terminated tests from workload.
+    # :param client_metrics: client metrics published by workload processes.
     """
     test_failed = kwargs.get("test_failed")
     action = kwargs.get("action", "")
@@ -84,6 +86,29 @@ def log_status(parsed_input: dict, corio_start_time: datetime, **kwargs):
             dataframe = dataframe.astype({"SESSIONS": "int"})
             status_file.write(f"\n\nTEST YAML FILE : {key}\n")
             dataframe.to_string(status_file)
+        log_client_metrics(status_file, kwargs.get("client_metrics"))
+
+
+def log_client_metrics(status_file, client_metrics: dict) -> None:
+    """
+    Log client side metrics published by workload processes.
+
+    :param status_file: Report file object.
+    :param client_metrics: Dict shared with workload processes containing client metrics.
+    """
+    if not client_metrics:
+        return
+    for key in sorted(client_metrics.keys()):
+        if not key.startswith(METRICS_PREFIX):
+            continue
+        status_file.write(f"\n\nCLIENT METRICS : {key[len(METRICS_PREFIX):]}")
+        for section, values in client_metrics[key].items():
+            if isinstance(values, dict):
+                dataframe = pd.DataFrame.from_dict(values, orient="index").fillna(0)
+            else:
+                dataframe = pd.DataFrame(values)
+            status_file.write(f"\n\n{section.upper()}:\n")
+            dataframe.to_string(status_file)
 
 
 def convert_object_size(input_dict: dict, value: Union[dict, list]) -> None:
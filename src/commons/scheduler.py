@@ -39,6 +39,7 @@ from src.commons import support_bundle
 from src.commons.constants import ROOT
 from src.commons.exception import DegradedModeError
 from src.commons.exception import HealthCheckError
+from src.commons.metrics import MetricsPublisher
 from src.commons.report import log_status
 from src.commons.utils.asyncio_utils import (
     run_event_loop_until_complete,
@@ -49,6 +50,7 @@ from src.commons.utils.corio_utils import (
     get_s3_keys,
     set_s3_access_secret_key,
 )
+from src.libs.s3api.connection_pool import CONNECTION_POOL
 
 LOGGER = logging.getLogger(ROOT)
 
@@ -133,12 +135,16 @@ async def schedule_sessions(
         else:
             raise NotImplementedError(f"Tool is not supported: {params['tool']}")
         LOGGER.debug(iter_keys)
-    await schedule_tasks(LOGGER, tasks)
+    try:
+        await schedule_tasks(LOGGER, tasks)
+    finally:
+        # Close s3 clients shared by all the sessions of the process.
+        await CONNECTION_POOL.close()
     LOGGER.info("Execution completed for process: %s", process_name)
 
 
 def schedule_test_plan(
-    test_plan: str, test_plan_values: dict, common_params: dict
+    test_plan: str, test_plan_values: dict, common_params: dict, return_dict: dict = None
 ) -> None:
     """
     Create event loop for each test plan.
@@ -146,12 +152,23 @@ def schedule_test_plan(
     :param test_plan: YAML file name for specific S3 operation.
     :param test_plan_values: Parsed yaml file values.
     :param common_params: Common arguments to be passed to function.
+    :param return_dict: Dictionary shared with main process to publish client metrics.
     """
     process_name = f"TestPlan: Process {os.getpid()}, topic {test_plan}"
     LOGGER.info("%s Started ", process_name)
-    run_event_loop_until_complete(
-        LOGGER, schedule_sessions, test_plan, test_plan_values, common_params
-    )
+    publisher = None
+    if return_dict is not None:
+        publisher = MetricsPublisher(
+            return_dict, os.path.basename(test_plan), CORIO_CFG.metrics_interval_mins * 60
+        )
+        publisher.start()
+    try:
+        run_event_loop_until_complete(
+            LOGGER, schedule_sessions, test_plan, test_plan_values, common_params
+        )
+    finally:
+        if publisher:
+            publisher.stop()
     LOGGER.info("%s completed successfully", process_name)
 
 
@@ -284,6 +301,7 @@ def schedule_execution_plan(
     commons_params = {
         "access_secret_keys": get_s3_keys(S3_CFG.access_key, S3_CFG.secret_key),
         "endpoint_url": S3_CFG.endpoint,
+        "endpoints": S3_CFG.endpoints,
         "use_ssl": S3_CFG.use_ssl,
         "seed": options.seed,
         "sequential_run": options.sequential_run,
@@ -296,6 +314,7 @@ def schedule_execution_plan(
                 test_plan,
                 test_plan_value,
                 commons_params,
+                return_dict,
             ),
         )
     LOGGER.info("scheduled execution plan. Processes: %s", processes)
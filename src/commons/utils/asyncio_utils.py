@@ -21,11 +21,15 @@ import asyncio
 
 
 def run_event_loop_until_complete(logger, func, *args, **kwargs):
-    """Run the event."""
+    """Run the event and return result of the coroutine function."""
+    try:
+        previous_loop = asyncio.get_event_loop()
+    except RuntimeError:
+        previous_loop = None
     new_loop = asyncio.new_event_loop()
     asyncio.set_event_loop(new_loop)
     try:
-        new_loop.run_until_complete(func(*args, **kwargs))
+        return new_loop.run_until_complete(func(*args, **kwargs))
     except KeyboardInterrupt:
         logger.warning("Loop interrupted for %s", func.__name__)
     except Exception as err:
@@ -38,6 +42,8 @@ def run_event_loop_until_complete(logger, func, *args, **kwargs):
         if not new_loop.is_closed():
             new_loop.close()
             logger.info("Event loop closed: %s", new_loop.is_closed())
+        # Closed loop is not left as current loop of the thread e.g. for sync callers.
+        asyncio.set_event_loop(previous_loop)
 
 
 async def schedule_tasks(logger, tasks):
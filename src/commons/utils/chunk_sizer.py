@@ -0,0 +1,97 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Adaptive chunk size of reads as per object size and observed bandwidth."""
+
+import threading
+
+KIB = 1024
+MIB = 1024 * KIB
+
+
+class ChunkSizer:
+    """
+    Pick read/hash chunk size per request from object size and running bandwidth estimate.
+
+    Chunk size is the data received in target_chunk_ms at the moving average bandwidth of recent
+    reads, capped to object size, bounded by min/max chunk size and rounded up to power of two so
+    that buffers of few sizes are reused.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        min_chunk_size: int = 64 * KIB,
+        max_chunk_size: int = 16 * MIB,
+        target_chunk_ms: int = 100,
+        default_chunk_size: int = 4 * MIB,
+        smoothing: float = 0.2,
+    ):
+        """
+        Initialize chunk sizer.
+
+        :param min_chunk_size: Minimum chunk size in bytes.
+        :param max_chunk_size: Maximum chunk size in bytes.
+        :param target_chunk_ms: Time in ms to receive one chunk at estimated bandwidth.
+        :param default_chunk_size: Chunk size till bandwidth is estimated.
+        :param smoothing: Weight of latest read in moving average of bandwidth.
+        """
+        if not 0 < min_chunk_size <= max_chunk_size:
+            raise ValueError(f"Invalid chunk size bounds: {min_chunk_size}, {max_chunk_size}")
+        self.min_chunk_size = min_chunk_size
+        self.max_chunk_size = max_chunk_size
+        self.target_chunk_ms = target_chunk_ms
+        self.default_chunk_size = default_chunk_size
+        self.smoothing = smoothing
+        self.bandwidth = 0.0
+        self.lock = threading.Lock()
+
+    def get_chunk_size(self, object_size: int = None) -> int:
+        """
+        Get chunk size for reading object.
+
+        :param object_size: Size of object or byte range to be read if known.
+        """
+        if self.bandwidth:
+            chunk_size = int(self.bandwidth * self.target_chunk_ms / 1000)
+        else:
+            chunk_size = self.default_chunk_size
+        if object_size is not None:
+            chunk_size = min(chunk_size, object_size)
+        chunk_size = min(max(chunk_size, self.min_chunk_size), self.max_chunk_size)
+        return min(1 << (chunk_size - 1).bit_length(), self.max_chunk_size)
+
+    def record(self, nbytes: int, seconds: float) -> None:
+        """
+        Update bandwidth estimate with completed read.
+
+        Reads smaller than min chunk size are skipped as their time is mostly latency.
+        :param nbytes: Number of bytes read.
+        :param seconds: Time taken to read the bytes.
+        """
+        if nbytes < self.min_chunk_size or seconds <= 0:
+            return
+        with self.lock:
+            bandwidth = nbytes / seconds
+            if self.bandwidth:
+                self.bandwidth += self.smoothing * (bandwidth - self.bandwidth)
+            else:
+                self.bandwidth = bandwidth
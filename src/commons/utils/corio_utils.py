@@ -21,25 +21,38 @@
 
 """common operations/methods from corio tool."""
 
+import asyncio
 import glob
 import logging
 import math
 import os
+import random
 import re
 import shutil
+import threading
 import time
+from asyncio import sleep as async_sleep
 from base64 import b64encode
 from datetime import datetime
+from functools import wraps
 from subprocess import Popen, PIPE, CalledProcessError
 from typing import Union
 
+import aiohttp
+import botocore.exceptions
 import psutil as ps
+from botocore.exceptions import ClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
+from botocore.exceptions import HTTPClientError
+from botocore.exceptions import IncompleteReadError
 
 from config import CLUSTER_CFG
 from config import CORIO_CFG
 from config import S3_CFG
 from src.commons import commands as cmd
 from src.commons import constants as const
+from src.commons.metrics import increment_metrics
+from src.commons.utils.data_pool import get_data_pool
 
 LOGGER = logging.getLogger(const.ROOT)
 
@@ -147,25 +160,20 @@ def create_file(file_name: str, size: int, data_type: Union[str, bytes] = bytes)
     :param file_name: File name or file path.
     :param data_type: supported data type string(str)/byte(bytes) while create file.
     """
-    base = const.KIB**2
     if os.path.isdir(os.path.split(file_name)[0]):
         file_path = file_name
     else:
         file_path = os.path.join(const.DATA_DIR_PATH, file_name)
-    while size > base:
-        if issubclass(data_type, bytes):
-            with open(file_path, "ab+") as bf_out:
-                bf_out.write(os.urandom(base))
-        else:
-            with open(file_path, "a+", encoding="utf-8") as sf_out:
-                sf_out.write(b64encode(os.urandom(base)).decode("utf-8")[:base])
-        size -= base
+    # Data is sliced from shared random data pool instead of os.urandom per MiB.
+    data_pool = get_data_pool()
     if issubclass(data_type, bytes):
         with open(file_path, "ab+") as bf_out:
-            bf_out.write(os.urandom(size))
+            for chunk in data_pool.iter_random_data(size):
+                bf_out.write(chunk)
     else:
         with open(file_path, "a+", encoding="utf-8") as sf_out:
-            sf_out.write(b64encode(os.urandom(size)).decode("utf-8")[:size])
+            for chunk in data_pool.iter_random_data(size):
+                sf_out.write(b64encode(chunk).decode("utf-8")[: len(chunk)])
     return file_path
 
 
@@ -372,48 +380,191 @@ def get_test_file_path(test_id: str) -> str:
     return fpath
 
 
-# pylint: disable=broad-except
+THROTTLING_ERROR_CODES = (
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottled",
+    "RequestThrottledException",
+    "SlowDown",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "RequestTimeout",
+)
+# Errors of truncated response body, ResponseStreamingError is not in older botocore.
+STREAMING_ERRORS = tuple(
+    error
+    for error in (
+        IncompleteReadError,
+        getattr(botocore.exceptions, "ResponseStreamingError", None),
+    )
+    if error is not None
+)
+
+
+def get_error_status(error: Exception) -> int:
+    """Get http status code from s3 client error, 0 if not available."""
+    response = getattr(error, "response", None) or {}
+    return response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+
+
+def is_server_error(error: Exception) -> bool:
+    """
+    Check error is caused by server failure.
+
+    Server failures are 5xx responses, connection failures and timeouts.
+    :param error: Exception raised by s3 operation.
+    """
+    if isinstance(error, ClientError):
+        return get_error_status(error) >= 500
+    return isinstance(
+        error,
+        (
+            BotoConnectionError,
+            HTTPClientError,
+            ConnectionError,
+            asyncio.TimeoutError,
+            aiohttp.ClientError,
+        ),
+    )
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    Check s3 operation can be retried on error.
+
+    Throttling, 5xx, connection failures, timeouts and truncated response bodies are retryable,
+    other errors i.e. 4xx are fatal.
+    :param error: Exception raised by s3 operation.
+    """
+    if isinstance(error, ClientError):
+        status = get_error_status(error)
+        code = error.response.get("Error", {}).get("Code", "")
+        return status >= 500 or status == 429 or code in THROTTLING_ERROR_CODES
+    return isinstance(error, STREAMING_ERRORS) or is_server_error(error)
+
+
+class RetryBudget:
+    """
+    Per process budget of retries to avoid retry storms during server degradation.
+
+    Budget is a token bucket holding max reserve tokens. Every call deposits ratio token and
+    every retry withdraws one token, so retries are limited to ratio of the calls over time.
+    """
+
+    def __init__(self, ratio: float = None, reserve: int = None):
+        """
+        Initialize retry budget.
+
+        :param ratio: Fraction of calls which can be retried.
+        :param reserve: Max retries allowed in burst.
+        """
+        budget_cfg = S3_CFG.get("retry_budget") or {}
+        self.ratio = budget_cfg.get("ratio", 0.1) if ratio is None else ratio
+        self.reserve = budget_cfg.get("reserve", 100) if reserve is None else reserve
+        self.tokens = float(self.reserve)
+        self.lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Deposit token for a call."""
+        with self.lock:
+            self.tokens = min(self.reserve, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Withdraw token for a retry, False if budget is exhausted."""
+        with self.lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+RETRY_BUDGET = RetryBudget()
+
+
+def get_retry_delay(attempt: int, retry_delay: float, max_delay: float) -> float:
+    """
+    Get exponential backoff delay with full jitter.
+
+    :param attempt: Number of retry starting from 0.
+    :param retry_delay: Base delay in seconds.
+    :param max_delay: Max delay in seconds.
+    """
+    return random.uniform(0, min(max_delay, retry_delay * 2**attempt))
+
+
+def can_retry(func_name: str, error: Exception, attempt: int, max_retry: int) -> bool:
+    """
+    Check failed call can be retried and record retry metrics of the operation.
+
+    :param func_name: Name of the operation.
+    :param error: Exception raised by operation.
+    :param attempt: Number of failed attempt starting from 1.
+    :param max_retry: Max number of attempts.
+    """
+    LOGGER.info("Function name: %s", func_name)
+    LOGGER.error(error, exc_info=True)
+    if not is_retryable_error(error):
+        increment_metrics("retries", func_name, fatal_errors=1)
+        return False
+    if attempt >= max_retry:
+        increment_metrics("retries", func_name, exhausted=1)
+        return False
+    if not RETRY_BUDGET.withdraw():
+        LOGGER.warning("Retry budget exhausted, not retrying %s.", func_name)
+        increment_metrics("retries", func_name, budget_exhausted=1)
+        return False
+    increment_metrics("retries", func_name, retries=1)
+    return True
+
+
 def retries(asyncio=True, max_retry=S3_CFG.s3max_retry, retry_delay=S3_CFG.retry_delay):
     """
-    Retry/polling in case all types of failures.
+    Retry on retryable failures with exponential backoff and full jitter.
 
+    Throttling, 5xx and timeouts are retried within the per process retry budget, fatal errors
+    are raised immediately. Retry counts per operation are reported in client metrics.
     :param asyncio: True if wrapper used for asyncio else for normal function.
-    :param max_retry: Max number of times retires on failure.
-    :param retry_delay: Delay between two retries.
+    :param max_retry: Max number of attempts on failure.
+    :param retry_delay: Base delay between two retries.
     """
+    max_delay = S3_CFG.get("retry_max_delay", 60)
+
     def outer_wrapper(func):
         """Outer wrapper method."""
         if asyncio:
 
+            @wraps(func)
             async def inner_wrapper(*args, **kwargs):
                 """Inner wrapper method."""
-                for i in reversed(range(max_retry + 1)):
+                RETRY_BUDGET.deposit()
+                attempt = 0
+                while True:
                     try:
                         return await func(*args, **kwargs)
-                    except Exception as err:
-                        LOGGER.info("AsyncIO Function name: %s", func.__name__)
-                        LOGGER.error(err, exc_info=True)
-                        if i <= 1:
+                    except Exception as err:  # pylint: disable=broad-except
+                        attempt += 1
+                        if not can_retry(func.__name__, err, attempt, max_retry):
                             raise err
-                    # Delay between each retry in seconds.
-                    time.sleep(retry_delay)
-                return await func(*args, **kwargs)
+                    # Non blocking delay between each retry in seconds.
+                    await async_sleep(get_retry_delay(attempt - 1, retry_delay, max_delay))
 
         else:
 
+            @wraps(func)
             def inner_wrapper(*args, **kwargs):
                 """Inner wrapper method."""
-                for j in reversed(range(max_retry + 1)):
+                RETRY_BUDGET.deposit()
+                attempt = 0
+                while True:
                     try:
                         return func(*args, **kwargs)
-                    except Exception as err:
-                        LOGGER.info("Function name: %s", func.__name__)
-                        LOGGER.error(err, exc_info=True)
-                        if j <= 1:
+                    except Exception as err:  # pylint: disable=broad-except
+                        attempt += 1
+                        if not can_retry(func.__name__, err, attempt, max_retry):
                             raise err
                     # Delay between each retry in seconds.
-                    time.sleep(retry_delay)
-                return func(*args, **kwargs)
+                    time.sleep(get_retry_delay(attempt - 1, retry_delay, max_delay))
 
         return inner_wrapper
 
@@ -0,0 +1,296 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""In memory deterministic data generator for s3 object bodies."""
+
+import hashlib
+import io
+import random
+import struct
+import threading
+
+import numpy as np
+
+from src.commons.utils.data_pool import get_data_pool
+from src.commons.utils.hash_utils import SHA256
+from src.commons.utils.hash_utils import new_hash
+
+# Data is generated in fixed size blocks, so any offset can be generated independently.
+BLOCK_SIZE = 1024 * 1024
+# Every block starts with unique header of seed, key and block index followed by pool data.
+HEADER_SIZE = 16
+
+# Content types of the data profile.
+RANDOM_DATA = "random"
+ZERO_DATA = "zero"
+TEXT_DATA = "text"
+# Compressible data keeps 1/compress random bytes of every chunk and zero fills the rest.
+COMPRESS_CHUNK_SIZE = 4096
+# Size of the per process buffer of profiled data sliced by the blocks.
+PROFILE_BUFFER_SIZE = 32 * 1024 * 1024
+# Duplicate blocks of dedupable data are selected from these many distinct blocks per seed.
+DEDUP_BLOCKS = 64
+DEDUP_KEY_HASH = 0
+# Printable characters i.e. pool byte value is mapped to a character of text data.
+TEXT_CHARS = np.frombuffer(
+    b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ,.\n", dtype=np.uint8
+)
+PROFILE_BUFFERS = {}
+PROFILE_BUFFERS_LOCK = threading.Lock()
+
+
+def get_profile_buffer(data_type: str, compress: float) -> memoryview:
+    """
+    Get process wide read only buffer of data as per content type and compression ratio.
+
+    Buffer is derived from data pool once using vectorised numpy operations.
+    :param data_type: Content type random/zero/text.
+    :param compress: Target compression ratio of the data.
+    """
+    pool = get_data_pool()
+    if data_type == RANDOM_DATA and compress == 1:
+        return pool.view
+    with PROFILE_BUFFERS_LOCK:
+        if (data_type, compress) not in PROFILE_BUFFERS:
+            size = min(pool.size, PROFILE_BUFFER_SIZE)
+            size -= size % COMPRESS_CHUNK_SIZE
+            if data_type == ZERO_DATA:
+                buffer = np.zeros(size, dtype=np.uint8)
+            else:
+                buffer = np.frombuffer(pool.view[:size], dtype=np.uint8).copy()
+                if data_type == TEXT_DATA:
+                    buffer = TEXT_CHARS[buffer % len(TEXT_CHARS)]
+                if compress > 1:
+                    chunks = buffer.reshape(-1, COMPRESS_CHUNK_SIZE)
+                    chunks[:, max(1, round(COMPRESS_CHUNK_SIZE / compress)) :] = 0
+            buffer.setflags(write=False)
+            PROFILE_BUFFERS[(data_type, compress)] = memoryview(buffer).cast("B")
+        return PROFILE_BUFFERS[(data_type, compress)]
+
+
+class DataGenerator:
+    """
+    Generate deterministic object data from seed, key and offset.
+
+    Same seed and key always produce same bytes, so object data need not be stored on local disk
+    to upload or to verify it later. Block data is a slice of shared data pool at pseudo random
+    offset, so it is neither generated nor copied per object.
+
+    Content of data is selected by data profile ex: {compress: 2.0, dedup: 0.3}
+        type: random(default)/zero/text.
+        compress: Target compression ratio, default 1 i.e. incompressible.
+        dedup: Fraction of blocks duplicate of other blocks, default 0.
+    """
+
+    def __init__(self, seed: int = None, profile: dict = None):
+        """
+        Initialize data generator.
+
+        :param seed: Seed of the data, random if not given.
+        :param profile: Data profile i.e. content type, compression and dedup ratio.
+        """
+        self.seed = abs(int(seed)) if seed is not None else random.getrandbits(63)
+        profile = profile or {}
+        self.data_type = profile.get("type", RANDOM_DATA)
+        self.compress = float(profile.get("compress", 1))
+        self.dedup = float(profile.get("dedup", 0))
+        if self.data_type not in (RANDOM_DATA, ZERO_DATA, TEXT_DATA):
+            raise ValueError(f"Unsupported data type: {self.data_type}")
+        if self.compress < 1:
+            raise ValueError(f"Compression ratio should be >= 1: {self.compress}")
+        if not 0 <= self.dedup < 1:
+            raise ValueError(f"Dedup ratio should be in range [0, 1): {self.dedup}")
+        self.data = get_profile_buffer(self.data_type, self.compress)
+
+    @staticmethod
+    def get_key_hash(key: str) -> int:
+        """Get 64 bit hash of the key."""
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little")
+
+    def get_block(self, key_hash: int, index: int) -> tuple:
+        """
+        Get header and profiled data of block.
+
+        :param key_hash: Hash of the key.
+        :param index: Index of the block in object.
+        :return: header bytes and memoryview of the data.
+        """
+        digest = self.get_block_digest(key_hash, index)
+        if self.dedup and int.from_bytes(digest[24:], "little") < self.dedup * 2**64:
+            # Duplicate block, same for all the keys of the seed.
+            digest = self.get_block_digest(
+                DEDUP_KEY_HASH, int.from_bytes(digest[24:], "little") % DEDUP_BLOCKS
+            )
+        if self.data_type == ZERO_DATA:
+            header = bytes(HEADER_SIZE)
+        elif self.data_type == TEXT_DATA:
+            header = digest[: HEADER_SIZE // 2].hex().encode()
+        else:
+            header = digest[:HEADER_SIZE]
+        length = BLOCK_SIZE - HEADER_SIZE
+        offset = int.from_bytes(digest[HEADER_SIZE:24], "little") % (len(self.data) - length + 1)
+        return header, self.data[offset : offset + length]
+
+    def get_block_digest(self, key_hash: int, index: int) -> bytes:
+        """Get 32 bytes digest of seed, key and block index i.e. header, offset and selector."""
+        return hashlib.blake2b(
+            struct.pack("<QQQ", self.seed & (2**64 - 1), key_hash, index), digest_size=32
+        ).digest()
+
+    def iter_block(self, key_hash: int, index: int, start: int, length: int):
+        """
+        Yield length bytes of block starting from start offset in the block.
+
+        :param key_hash: Hash of the key.
+        :param index: Index of the block in object.
+        :param start: Offset in the block.
+        :param length: Number of bytes.
+        """
+        header, data = self.get_block(key_hash, index)
+        end = start + length
+        if start < HEADER_SIZE:
+            yield memoryview(header)[start : min(end, HEADER_SIZE)]
+        if end > HEADER_SIZE:
+            yield data[max(start, HEADER_SIZE) - HEADER_SIZE : end - HEADER_SIZE]
+
+    def iter_data(self, key: str, size: int, offset: int = 0):
+        """
+        Generate size bytes of key starting from offset in chunks.
+
+        :param key: Key of the data.
+        :param size: Number of bytes.
+        :param offset: Starting offset.
+        """
+        key_hash = self.get_key_hash(key)
+        end = offset + size
+        while offset < end:
+            index, start = divmod(offset, BLOCK_SIZE)
+            length = min(BLOCK_SIZE - start, end - offset)
+            yield from self.iter_block(key_hash, index, start, length)
+            offset += length
+
+    def read(self, key: str, size: int, offset: int = 0) -> bytes:
+        """Get size bytes of key starting from offset."""
+        return b"".join(self.iter_data(key, size, offset))
+
+    def checksum(self, key: str, size: int, offset: int = 0, algorithm: str = SHA256) -> str:
+        """Get checksum of size bytes of key starting from offset, default is sha256."""
+        file_hash = new_hash(algorithm)
+        for chunk in self.iter_data(key, size, offset):
+            file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    def get_body(self, key: str, size: int, offset: int = 0, hasher=None) -> "ObjectBody":
+        """
+        Get file like object body of size bytes of the key starting from offset.
+
+        :param key: Key of the data.
+        :param size: Size of the body in bytes.
+        :param offset: Starting offset.
+        :param hasher: hash object ex: new_hash() updated with the data as it is read from body.
+        """
+        return ObjectBody(self, key, size, offset, hasher)
+
+
+class ObjectBody(io.RawIOBase):
+    """
+    Seekable file like object body streaming generated data of a key.
+
+    aiohttp streams it chunk by chunk off the event loop, data is generated on the fly and never
+    written to local disk. Body is rewound by botocore on retries. If hasher is given then data is
+    hashed in the same read as it is sent, bytes read again on rewind are not hashed again.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, generator: DataGenerator, key: str, size: int, offset: int = 0,
+                 hasher=None):
+        """
+        Initialize object body.
+
+        :param generator: Data generator.
+        :param key: Key of the data.
+        :param size: Size of the body in bytes.
+        :param offset: Offset of the body in data of the key i.e. part of multipart object.
+        :param hasher: hash object ex: new_hash() to be updated with data of the body.
+        """
+        super().__init__()
+        self.generator = generator
+        self.key = key
+        self.size = size
+        self.offset = offset
+        self.key_hash = generator.get_key_hash(key)
+        self.position = 0
+        self.hasher = hasher
+        self.hashed = 0
+
+    def __len__(self) -> int:
+        """Size of the body."""
+        return self.size
+
+    def readable(self) -> bool:
+        """Body is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Body is seekable."""
+        return True
+
+    def tell(self) -> int:
+        """Current position of the body."""
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Change position of the body."""
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self.position = offset
+        return self.position
+
+    def readinto(self, buffer) -> int:
+        """Read generated data into buffer and return number of bytes read."""
+        view = memoryview(buffer).cast("B")
+        length = max(0, min(len(view), self.size - self.position))
+        filled = 0
+        while filled < length:
+            index, start = divmod(self.offset + self.position, BLOCK_SIZE)
+            count = min(BLOCK_SIZE - start, length - filled)
+            for chunk in self.generator.iter_block(self.key_hash, index, start, count):
+                view[filled : filled + len(chunk)] = chunk
+                filled += len(chunk)
+            self.position += count
+        if self.hasher and self.position - filled <= self.hashed < self.position:
+            self.hasher.update(view[self.hashed - self.position + filled : filled])
+            self.hashed = self.position
+        return filled
+
+    def hexdigest(self) -> str:
+        """Get digest of body data, data not read from body yet is hashed from generator."""
+        if self.hashed < self.size:
+            for chunk in self.generator.iter_data(
+                self.key, self.size - self.hashed, self.offset + self.hashed
+            ):
+                self.hasher.update(chunk)
+            self.hashed = self.size
+        return self.hasher.hexdigest()
@@ -0,0 +1,128 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Memory mapped random data pool shared by all the workload processes."""
+
+import glob
+import logging
+import mmap
+import os
+import random
+import threading
+
+import numpy as np
+
+from config import CORIO_CFG
+from src.commons.constants import DATA_DIR_PATH
+from src.commons.constants import ROOT
+
+LOGGER = logging.getLogger(ROOT)
+
+DATA_POOL_PREFIX = "corio_data_pool"
+# Pool is created in tmpfs if available, so that it is backed by shared memory.
+DATA_POOL_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else DATA_DIR_PATH
+# Fixed seed of pool data, same pool file is shared by all the processes and runs.
+DATA_POOL_SEED = 0x5EA6A7E
+
+
+class DataPool:
+    """
+    Read only random data pool mapped in memory.
+
+    Pool is generated once and written to a file, every process maps the same file so that data
+    is shared through page cache. Data is returned as memoryview slices of the pool without any
+    allocation or copy.
+    """
+
+    def __init__(self, size: int):
+        """
+        Create or attach the data pool.
+
+        :param size: Size of the pool in bytes.
+        """
+        self.size = size
+        self.path = os.path.join(DATA_POOL_DIR, f"{DATA_POOL_PREFIX}_{size}")
+        if not os.path.exists(self.path):
+            self.create()
+        with open(self.path, "rb") as pool_file:
+            self.mmap = mmap.mmap(pool_file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mmap) != size:
+            raise ValueError(f"Data pool {self.path} size is not {size} bytes.")
+        self.view = memoryview(self.mmap)
+        # Offsets are drawn from own generator, so seeded global random of workload is untouched.
+        self.random = random.Random()
+
+    def create(self) -> None:
+        """Generate pool data and publish it atomically, concurrent creators write same data."""
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}"
+        generator = np.random.Generator(np.random.PCG64(DATA_POOL_SEED))
+        with open(temp_path, "wb") as pool_file:
+            remaining = self.size
+            while remaining:
+                length = min(remaining, 64 * 1024 * 1024)
+                pool_file.write(generator.bytes(length))
+                remaining -= length
+        os.replace(temp_path, self.path)
+        LOGGER.info("Created data pool %s of %s bytes.", self.path, self.size)
+
+    def get_data(self, offset: int, length: int) -> memoryview:
+        """
+        Get data of length bytes from pool starting at offset, offset wraps around pool.
+
+        :param offset: Offset in pool.
+        :param length: Number of bytes, should not be more than size of the pool.
+        """
+        offset %= self.size - length + 1
+        return self.view[offset : offset + length]
+
+    def iter_random_data(self, size: int, chunk_size: int = 1024 * 1024):
+        """
+        Yield size bytes of data from pool slices at random offsets.
+
+        :param size: Number of bytes.
+        :param chunk_size: Size of the slices.
+        """
+        while size > 0:
+            length = min(size, chunk_size)
+            yield self.get_data(self.random.randrange(self.size), length)
+            size -= length
+
+
+DATA_POOLS = {}
+DATA_POOLS_LOCK = threading.Lock()
+
+
+def get_data_pool(size: int = None) -> DataPool:
+    """Get process wide data pool of given size, default is data_pool_size from corio config."""
+    size = size or CORIO_CFG.get("data_pool_size", 128 * 1024 * 1024)
+    with DATA_POOLS_LOCK:
+        if size not in DATA_POOLS:
+            DATA_POOLS[size] = DataPool(size)
+        return DATA_POOLS[size]
+
+
+def remove_data_pools() -> None:
+    """Remove the data pool files, already mapped pools remain valid till process exits."""
+    for path in glob.glob(os.path.join(DATA_POOL_DIR, f"{DATA_POOL_PREFIX}_*")):
+        try:
+            os.remove(path)
+        except OSError as error:
+            LOGGER.warning("Failed to remove data pool %s: %s", path, error)
@@ -0,0 +1,174 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Hashing of data integrity checks on bounded thread pool off the event loop."""
+
+import asyncio
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import S3_CFG
+from src.commons.metrics import update_metrics
+
+try:
+    import crc32c
+except ImportError:
+    crc32c = None
+
+# Hash algorithms of integrity checks, crc32c is supported if crc32c package is installed.
+SHA256 = "sha256"
+BLAKE2B = "blake2b"
+MD5 = "md5"
+CRC32C = "crc32c"
+HASH_ALGORITHMS = (SHA256, BLAKE2B, MD5, CRC32C)
+
+# hashlib releases GIL while hashing large buffers, so hashing threads run in parallel.
+HASH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=S3_CFG.get("hash_workers", 4), thread_name_prefix="hash"
+)
+# Chunks smaller than this are hashed inline as thread handoff costs more than hashing them.
+MIN_OFFLOAD_SIZE = 256 * 1024
+HASH_STATS = {}
+HASH_STATS_LOCK = threading.Lock()
+
+
+class Crc32cHash:
+    """hashlib like interface of crc32c checksum."""
+
+    name = CRC32C
+
+    def __init__(self):
+        """Initialize crc32c checksum."""
+        self.value = 0
+
+    def update(self, data) -> None:
+        """Update checksum with data."""
+        self.value = crc32c.crc32c(data, self.value)
+
+    def hexdigest(self) -> str:
+        """Get checksum as hex string."""
+        return f"{self.value:08x}"
+
+
+def new_hash(name: str = SHA256):
+    """
+    Create hash object of the algorithm.
+
+    :param name: Name of the hash algorithm sha256/blake2b/md5/crc32c.
+    """
+    if name not in HASH_ALGORITHMS:
+        raise ValueError(f"Unsupported hash algorithm: {name}, supported: {HASH_ALGORITHMS}")
+    if name == CRC32C:
+        if crc32c is None:
+            raise ValueError("Hash algorithm crc32c needs crc32c package: pip install crc32c")
+        return Crc32cHash()
+    return hashlib.new(name)
+
+
+def get_hash_algorithms() -> list:
+    """Get hash algorithms available on the host."""
+    return [name for name in HASH_ALGORITHMS if name != CRC32C or crc32c is not None]
+
+
+def record_hashing(name: str, nbytes: int, seconds: float) -> None:
+    """
+    Update hashing throughput of the process in client metrics.
+
+    :param name: Name of the hash algorithm.
+    :param nbytes: Number of bytes hashed.
+    :param seconds: Time taken to hash the bytes.
+    """
+    with HASH_STATS_LOCK:
+        stats = HASH_STATS.setdefault(name, {"bytes": 0, "seconds": 0.0})
+        stats["bytes"] += nbytes
+        stats["seconds"] += seconds
+        total_bytes, total_seconds = stats["bytes"], stats["seconds"]
+    update_metrics(
+        "hashing",
+        name,
+        hashed_mb=round(total_bytes / 1024**2, 3),
+        busy_sec=round(total_seconds, 3),
+        throughput_mbps=round(total_bytes / 1024**2 / total_seconds, 3) if total_seconds else 0,
+    )
+
+
+class ChunkHasher:
+    """
+    Hash chunks in order on hash thread pool, one chunk at a time per hasher.
+
+    update returns once the previous chunk is hashed and current chunk is submitted, so caller
+    reads chunk N+1 while chunk N is being hashed.
+    """
+
+    def __init__(self, name: str = SHA256):
+        """
+        Initialize chunk hasher.
+
+        :param name: Name of the hash algorithm.
+        """
+        self.name = name
+        self.hasher = new_hash(name)
+        self.pending = None
+
+    def hash_chunk(self, chunk) -> None:
+        """Hash the chunk and record throughput."""
+        start_time = time.perf_counter()
+        self.hasher.update(chunk)
+        record_hashing(self.name, len(chunk), time.perf_counter() - start_time)
+
+    def submit(self, chunk) -> None:
+        """Hash chunk inline if it is small else submit it to hash thread pool."""
+        if len(chunk) < MIN_OFFLOAD_SIZE:
+            self.hash_chunk(chunk)
+        else:
+            self.pending = HASH_EXECUTOR.submit(self.hash_chunk, chunk)
+
+    def update(self, chunk) -> None:
+        """Wait for previous chunk and hash the chunk, chunk should not be modified till done."""
+        if self.pending:
+            self.pending.result()
+            self.pending = None
+        self.submit(chunk)
+
+    async def wait_async(self) -> None:
+        """Await pending chunk without blocking event loop, chunk can be modified once done."""
+        if self.pending:
+            await asyncio.wrap_future(self.pending)
+            self.pending = None
+
+    async def update_async(self, chunk) -> None:
+        """Await previous chunk without blocking event loop and hash the chunk."""
+        await self.wait_async()
+        self.submit(chunk)
+
+    def hexdigest(self) -> str:
+        """Wait for pending chunk and get hex digest."""
+        if self.pending:
+            self.pending.result()
+            self.pending = None
+        return self.hasher.hexdigest()
+
+    async def hexdigest_async(self) -> str:
+        """Await pending chunk without blocking event loop and get hex digest."""
+        await self.wait_async()
+        return self.hasher.hexdigest()
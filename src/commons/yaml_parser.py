@@ -167,6 +167,7 @@ def test_parser(yaml_file: str, number_of_nodes: int) -> dict:
         else:
             convert_object_part_size_to_bytes(data)
             convert_range_read_to_bytes(data)
+            convert_parallel_read_to_bytes(data)
             convert_min_runtime_to_time_delta(test, delta_list, data)
         convert_delay_to_seconds(data)
         # Convert sessions per node to sessions.
@@ -247,6 +248,15 @@ def convert_range_read_to_bytes(data):
             data["range_read"] = convert_to_bytes(data["range_read"])
 
 
+def convert_parallel_read_to_bytes(data):
+    """Convert range_size of parallel_read to bytes."""
+    if isinstance(data.get("parallel_read"), dict):
+        if isinstance(data["parallel_read"].get("range_size"), str):
+            data["parallel_read"]["range_size"] = convert_to_bytes(
+                data["parallel_read"]["range_size"]
+            )
+
+
 def convert_object_size_to_bytes_samples(data):
     """Convert object_operations_type1 to bytes and distribution to samples.
 
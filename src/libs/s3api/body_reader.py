@@ -0,0 +1,166 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Read s3 object body into reusable buffers without allocation per chunk."""
+
+import threading
+from contextlib import contextmanager
+
+from botocore.exceptions import IncompleteReadError
+
+from config import S3_CFG
+
+BUFFER_POOL_CFG = S3_CFG.get("buffer_pool") or {}
+
+
+class BufferPool:
+    """
+    Free list of preallocated bytearrays reused by read sessions of the process.
+
+    Requested sizes are rounded up to power of two size classes, so buffers of few sizes are
+    kept whatever the object and part sizes are. Buffers larger than max_buffer_size are not
+    pooled and free buffers are capped per size class and in total bytes, extra buffers are
+    released when returned.
+    """
+
+    def __init__(
+        self,
+        max_buffer_size: int = 16 * 1024**2,
+        max_free_buffers: int = 8,
+        max_free_bytes: int = 256 * 1024**2,
+    ):
+        """
+        Initialize buffer pool.
+
+        :param max_buffer_size: Largest size class kept in pool.
+        :param max_free_buffers: Free buffers kept per size class.
+        :param max_free_bytes: Total bytes of free buffers kept in pool.
+        """
+        self.max_buffer_size = max_buffer_size
+        self.max_free_buffers = max_free_buffers
+        self.max_free_bytes = max_free_bytes
+        self.free = {}
+        self.free_bytes = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_size_class(size: int) -> int:
+        """Get power of two size class of buffer of size bytes."""
+        return 1 << max(size - 1, 0).bit_length()
+
+    @contextmanager
+    def get_buffers(self, size: int, count: int = 1):
+        """
+        Get count buffers of size bytes, pooled buffers are returned to pool on exit.
+
+        :param size: Size of the buffer.
+        :param count: Number of buffers ex: 2 to read a chunk while other chunk is hashed.
+        """
+        size_class = self.get_size_class(size)
+        pooled = size_class <= self.max_buffer_size
+        buffers = []
+        with self.lock:
+            free = self.free.setdefault(size_class, []) if pooled else []
+            while free and len(buffers) < count:
+                buffers.append(free.pop())
+                self.free_bytes -= size_class
+        buffers += [bytearray(size_class if pooled else size) for _ in range(count - len(buffers))]
+        try:
+            yield [memoryview(buffer)[:size] for buffer in buffers]
+        finally:
+            if pooled:
+                with self.lock:
+                    for buffer in buffers:
+                        if (
+                            len(free) >= self.max_free_buffers
+                            or self.free_bytes + size_class > self.max_free_bytes
+                        ):
+                            break
+                        free.append(buffer)
+                        self.free_bytes += size_class
+
+
+# Pooled size classes are up to max chunk size of adaptive chunk size of get object reads.
+BUFFER_POOL = BufferPool(
+    max_buffer_size=BUFFER_POOL_CFG.get(
+        "max_buffer_size",
+        (S3_CFG.get("adaptive_chunk_size") or {}).get("max_chunk_size", 16 * 1024**2),
+    ),
+    max_free_buffers=BUFFER_POOL_CFG.get("max_free_buffers", 8),
+    max_free_bytes=BUFFER_POOL_CFG.get("max_free_bytes", 256 * 1024**2),
+)
+
+
+class BodyReader:
+    """
+    Read aiohttp stream of s3 object body as received chunks.
+
+    Received chunks are copied into caller's buffer(readinto) or just counted(discard), so large
+    bytes objects are not created per read like stream.read(chunk_size).
+    """
+
+    def __init__(self, stream, content_length: int = None):
+        """
+        Initialize body reader.
+
+        :param stream: Body stream of get_object response.
+        :param content_length: Expected length of the body, verified at end of stream.
+        """
+        self.stream = stream
+        self.content_length = content_length
+        self.amount_read = 0
+        self.pending = memoryview(b"")
+
+    async def read_chunk(self) -> memoryview:
+        """Get next received chunk, empty at end of stream."""
+        if self.pending:
+            chunk, self.pending = self.pending, memoryview(b"")
+            return chunk
+        chunk = memoryview(await self.stream.readany())
+        self.amount_read += len(chunk)
+        if not chunk and self.content_length is not None:
+            if self.amount_read != self.content_length:
+                raise IncompleteReadError(
+                    actual_bytes=self.amount_read, expected_bytes=self.content_length
+                )
+        return chunk
+
+    async def readinto(self, buffer: memoryview) -> int:
+        """Fill buffer from body and return number of bytes filled, less only at end of body."""
+        filled = 0
+        while filled < len(buffer):
+            chunk = await self.read_chunk()
+            if not chunk:
+                break
+            count = min(len(chunk), len(buffer) - filled)
+            buffer[filled : filled + count] = chunk[:count]
+            self.pending = chunk[count:]
+            filled += count
+        return filled
+
+    async def discard(self) -> int:
+        """Read remaining body without keeping it and return number of bytes read."""
+        total = 0
+        while True:
+            chunk = await self.read_chunk()
+            if not chunk:
+                return total
+            total += len(chunk)
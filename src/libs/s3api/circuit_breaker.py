@@ -0,0 +1,161 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Per endpoint circuit breaker to fail fast while s3 endpoint is down."""
+
+import asyncio
+import logging
+import time
+
+from config import S3_CFG
+from src.commons.constants import ROOT
+from src.commons.exception import CircuitBreakerOpenError
+from src.commons.metrics import add_event
+from src.commons.metrics import update_metrics
+from src.commons.utils.corio_utils import is_server_error
+
+LOGGER = logging.getLogger(ROOT)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of an endpoint.
+
+    Breaker opens after failure_threshold consecutive 5xx/timeouts and rejects the requests till
+    reset_timeout seconds. Then it is half opened and allows a probe request, breaker is closed
+    if probe succeeds else opened again. State transitions are recorded as timeline events.
+    """
+
+    def __init__(self, endpoint: str, **kwargs):
+        """
+        Initialize circuit breaker.
+
+        :param endpoint: Endpoint url.
+        :keyword failure_threshold: Consecutive server failures to open the breaker.
+        :keyword reset_timeout: Duration in seconds breaker stays open before probing.
+        """
+        cb_cfg = S3_CFG.get("circuit_breaker") or {}
+        self.endpoint = endpoint
+        self.failure_threshold = kwargs.get(
+            "failure_threshold", cb_cfg.get("failure_threshold", 5)
+        )
+        self.reset_timeout = kwargs.get("reset_timeout", cb_cfg.get("reset_timeout", 30))
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.stats = {"state": CLOSED, "opened": 0, "rejected": 0, "open_duration_secs": 0.0}
+
+    def set_state(self, state: str, reason: str = "") -> None:
+        """Change breaker state and record the transition."""
+        if state == self.state:
+            return
+        now = time.monotonic()
+        if self.state == OPEN:
+            self.stats["open_duration_secs"] = round(
+                self.stats["open_duration_secs"] + now - self.opened_at, 3
+            )
+        if state == OPEN:
+            self.opened_at = now
+            self.stats["opened"] += 1
+        LOGGER.warning(
+            "Circuit breaker of %s changed from %s to %s. %s", self.endpoint, self.state, state,
+            reason,
+        )
+        add_event(
+            "circuit_breaker_events",
+            endpoint=self.endpoint,
+            from_state=self.state,
+            to_state=state,
+            reason=reason,
+        )
+        self.state = self.stats["state"] = state
+        update_metrics("circuit_breakers", self.endpoint, **self.stats)
+
+    def is_open(self) -> bool:
+        """Check requests to the endpoint will be rejected."""
+        if self.state == OPEN:
+            return time.monotonic() - self.opened_at < self.reset_timeout
+        return self.state == HALF_OPEN and self.probing
+
+    def before_request(self) -> bool:
+        """
+        Allow request to the endpoint or raise CircuitBreakerOpenError.
+
+        :return: True if the request is the probe of half open breaker, to be passed to
+            after_request.
+        """
+        if self.state == OPEN and not self.is_open():
+            self.set_state(HALF_OPEN, f"Probing after {self.reset_timeout} seconds.")
+        if self.is_open():
+            self.stats["rejected"] += 1
+            update_metrics("circuit_breakers", self.endpoint, **self.stats)
+            raise CircuitBreakerOpenError(
+                f"Circuit breaker of {self.endpoint} is {self.state}, request rejected."
+            )
+        if self.state == HALF_OPEN:
+            self.probing = True
+            return True
+        return False
+
+    def after_request(self, error: Exception = None, probe: bool = False) -> None:
+        """
+        Record request result of the endpoint.
+
+        Only result of the probe changes state of half open breaker, requests started before
+        the breaker was opened are just counted.
+        :param error: Exception raised by request if any.
+        :param probe: True if the request is the probe returned by before_request.
+        """
+        if probe:
+            self.probing = False
+        if isinstance(error, asyncio.CancelledError) or (
+            error is not None and not isinstance(error, Exception)
+        ):
+            # Request is cancelled(CancelledError is an Exception till python 3.7), result of
+            # the endpoint is unknown.
+            return
+        if error is not None and is_server_error(error):
+            self.consecutive_failures += 1
+            if probe:
+                self.set_state(OPEN, f"Probe failed: {error}")
+            elif self.state == CLOSED and self.consecutive_failures >= self.failure_threshold:
+                self.set_state(
+                    OPEN, f"{self.consecutive_failures} consecutive failures: {error}"
+                )
+        else:
+            self.consecutive_failures = 0
+            if probe:
+                self.set_state(CLOSED, "Probe succeeded.")
+
+
+CIRCUIT_BREAKERS = {}
+
+
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """Get process wide circuit breaker of the endpoint."""
+    if endpoint not in CIRCUIT_BREAKERS:
+        CIRCUIT_BREAKERS[endpoint] = CircuitBreaker(endpoint)
+    return CIRCUIT_BREAKERS[endpoint]
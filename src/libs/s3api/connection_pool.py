@@ -0,0 +1,149 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Process wide s3 connection pool shared by all the sessions of a workload."""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+
+from config import S3_CFG
+from src.commons.constants import ROOT
+from src.commons.metrics import update_metrics
+
+LOGGER = logging.getLogger(ROOT)
+
+
+class S3ConnectionPool:
+    """
+    Cache of aiobotocore clients and per endpoint connection slots.
+
+    Clients are shared by all the sessions of the process having same service, credentials and
+    endpoint. Number of in-flight requests per endpoint is capped by max_connections_per_endpoint,
+    requests exceeding the cap wait for a free slot which is reported as client side queueing.
+    """
+
+    def __init__(self, max_connections_per_endpoint: int = 0):
+        """
+        Initialize connection pool.
+
+        :param max_connections_per_endpoint: Max in-flight requests per endpoint in process.
+        """
+        self.max_connections = (
+            max_connections_per_endpoint or S3_CFG.max_connections_per_endpoint
+        )
+        self.clients = {}
+        self.semaphores = {}
+        self.stats = {}
+
+    def get_stats(self, endpoint: str) -> dict:
+        """Get the utilisation stats of an endpoint."""
+        if endpoint not in self.stats:
+            self.stats[endpoint] = {
+                "limit": self.max_connections,
+                "in_use": 0,
+                "idle": self.max_connections,
+                "waiters": 0,
+                "peak_in_use": 0,
+                "peak_waiters": 0,
+                "requests": 0,
+                "total_wait_ms": 0.0,
+                "avg_wait_ms": 0.0,
+                "max_wait_ms": 0.0,
+            }
+        return self.stats[endpoint]
+
+    def publish_stats(self, endpoint: str) -> None:
+        """Update utilisation stats of an endpoint in client metrics."""
+        update_metrics("connection_pool", endpoint, **self.stats[endpoint])
+
+    @asynccontextmanager
+    async def acquire(self, endpoint: str):
+        """
+        Acquire connection slot of the endpoint.
+
+        :param endpoint: Endpoint url.
+        """
+        loop = asyncio.get_running_loop()
+        if (loop, endpoint) not in self.semaphores:
+            self.semaphores[(loop, endpoint)] = asyncio.Semaphore(self.max_connections)
+        semaphore = self.semaphores[(loop, endpoint)]
+        stats = self.get_stats(endpoint)
+        start_time = time.perf_counter()
+        stats["waiters"] += 1
+        stats["peak_waiters"] = max(stats["peak_waiters"], stats["waiters"])
+        try:
+            await semaphore.acquire()
+        finally:
+            stats["waiters"] -= 1
+        wait_ms = (time.perf_counter() - start_time) * 1000
+        stats["in_use"] += 1
+        stats["idle"] = stats["limit"] - stats["in_use"]
+        stats["peak_in_use"] = max(stats["peak_in_use"], stats["in_use"])
+        stats["requests"] += 1
+        stats["total_wait_ms"] += wait_ms
+        stats["avg_wait_ms"] = round(stats["total_wait_ms"] / stats["requests"], 3)
+        stats["max_wait_ms"] = round(max(stats["max_wait_ms"], wait_ms), 3)
+        try:
+            yield
+        finally:
+            stats["in_use"] -= 1
+            stats["idle"] = stats["limit"] - stats["in_use"]
+            semaphore.release()
+            self.publish_stats(endpoint)
+
+    async def get_client(self, key: tuple, client_creator):
+        """
+        Get the cached client of the running event loop or create new one.
+
+        :param key: Unique key of client i.e. service, credentials and endpoint.
+        :param client_creator: Coroutine function to create and open the client.
+        """
+        key = (asyncio.get_running_loop(), *key)
+        if key not in self.clients:
+            self.clients[key] = asyncio.ensure_future(client_creator())
+        future = self.clients[key]
+        try:
+            # Creation is shared by all the waiters, cancelled waiter does not cancel it.
+            return await asyncio.shield(future)
+        except BaseException:
+            # Failed or cancelled creation is evicted so that next caller creates new client.
+            if future.done() and (future.cancelled() or future.exception() is not None):
+                if self.clients.get(key) is future:
+                    self.clients.pop(key)
+            raise
+
+    async def close(self) -> None:
+        """Close all cached clients and connection slots of the running event loop."""
+        loop = asyncio.get_running_loop()
+        for key in [key for key in self.clients if key[0] is loop]:
+            future = self.clients.pop(key)
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled() and not future.exception():
+                await future.result().close()
+                LOGGER.debug("Closed %s client for %s", key[1], key[-1])
+        for key in [key for key in self.semaphores if key[0] is loop]:
+            self.semaphores.pop(key)
+
+
+CONNECTION_POOL = S3ConnectionPool()
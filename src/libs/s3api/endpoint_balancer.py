@@ -0,0 +1,168 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Per request load balancing of s3 traffic across multiple endpoints."""
+
+import asyncio
+import logging
+import time
+
+from config import S3_CFG
+from src.commons.constants import ROOT
+from src.commons.metrics import update_metrics
+from src.commons.utils.corio_utils import is_server_error
+
+LOGGER = logging.getLogger(ROOT)
+
+ROUND_ROBIN = "round_robin"
+LEAST_OUTSTANDING = "least_outstanding"
+
+
+# pylint: disable=too-many-instance-attributes
+class EndpointBalancer:
+    """
+    Select endpoint per request as per round robin or least outstanding requests policy.
+
+    Endpoint returning eject_threshold consecutive 5xx/timeouts is ejected for eject_duration
+    seconds. If all the endpoints are ejected then all of them are used.
+    """
+
+    def __init__(self, endpoints: list, **kwargs):
+        """
+        Initialize endpoint balancer.
+
+        :param endpoints: List of endpoint urls.
+        :keyword policy: Load balancing policy round_robin/least_outstanding.
+        :keyword eject_threshold: Consecutive server failures to eject endpoint.
+        :keyword eject_duration: Duration in seconds for which endpoint is ejected.
+        """
+        if not endpoints:
+            raise ValueError("At least one endpoint is required for load balancing.")
+        lb_cfg = S3_CFG.get("load_balancing") or {}
+        self.endpoints = list(endpoints)
+        self.policy = kwargs.get("policy", lb_cfg.get("policy", ROUND_ROBIN))
+        if self.policy not in (ROUND_ROBIN, LEAST_OUTSTANDING):
+            raise ValueError(f"Unsupported load balancing policy: {self.policy}")
+        self.eject_threshold = kwargs.get("eject_threshold", lb_cfg.get("eject_threshold", 5))
+        self.eject_duration = kwargs.get("eject_duration", lb_cfg.get("eject_duration", 30))
+        self.next_index = 0
+        self.start_time = time.perf_counter()
+        self.stats = {
+            endpoint: {
+                "outstanding": 0,
+                "requests": 0,
+                "errors": 0,
+                "consecutive_failures": 0,
+                "ejections": 0,
+                "ejected_until": 0.0,
+                "total_latency_ms": 0.0,
+                "max_latency_ms": 0.0,
+            }
+            for endpoint in self.endpoints
+        }
+
+    def is_ejected(self, endpoint: str) -> bool:
+        """Check endpoint is ejected currently."""
+        return self.stats[endpoint]["ejected_until"] > time.monotonic()
+
+    def get_endpoint(self, exclude: list = None) -> str:
+        """
+        Select endpoint for the next request as per policy.
+
+        :param exclude: Endpoints to be skipped along with ejected endpoints if possible.
+        """
+        exclude = exclude or []
+        endpoints = [
+            ept for ept in self.endpoints if not self.is_ejected(ept) and ept not in exclude
+        ] or self.endpoints
+        if self.policy == LEAST_OUTSTANDING:
+            return min(endpoints, key=lambda ept: self.stats[ept]["outstanding"])
+        for _ in range(len(self.endpoints)):
+            endpoint = self.endpoints[self.next_index % len(self.endpoints)]
+            self.next_index += 1
+            if endpoint in endpoints:
+                return endpoint
+        return endpoints[0]
+
+    def start_request(self, endpoint: str) -> float:
+        """Mark request started on endpoint and return start time."""
+        self.stats[endpoint]["outstanding"] += 1
+        return time.perf_counter()
+
+    def end_request(self, endpoint: str, start_time: float, error: Exception = None) -> None:
+        """
+        Mark request completed on endpoint and eject endpoint on consecutive server failures.
+
+        :param endpoint: Endpoint url used for request.
+        :param start_time: Start time of request returned by start_request.
+        :param error: Exception raised by request if any.
+        """
+        stats = self.stats[endpoint]
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        stats["outstanding"] -= 1
+        stats["requests"] += 1
+        stats["total_latency_ms"] += latency_ms
+        stats["max_latency_ms"] = max(stats["max_latency_ms"], latency_ms)
+        if error is not None and is_server_error(error):
+            stats["errors"] += 1
+            stats["consecutive_failures"] += 1
+            if stats["consecutive_failures"] >= self.eject_threshold and len(self.endpoints) > 1:
+                stats["ejected_until"] = time.monotonic() + self.eject_duration
+                stats["ejections"] += 1
+                stats["consecutive_failures"] = 0
+                LOGGER.warning(
+                    "Endpoint %s ejected for %s seconds after %s consecutive failures: %s",
+                    endpoint,
+                    self.eject_duration,
+                    self.eject_threshold,
+                    error,
+                )
+        elif not isinstance(error, asyncio.CancelledError):
+            # Result of cancelled request is unknown, consecutive failures are kept as is.
+            stats["consecutive_failures"] = 0
+        self.publish_stats(endpoint)
+
+    def publish_stats(self, endpoint: str) -> None:
+        """Update throughput and latency of endpoint in client metrics."""
+        stats = self.stats[endpoint]
+        elapsed = time.perf_counter() - self.start_time
+        update_metrics(
+            "endpoints",
+            endpoint,
+            requests=stats["requests"],
+            errors=stats["errors"],
+            requests_per_sec=round(stats["requests"] / elapsed, 3) if elapsed else 0,
+            avg_latency_ms=round(stats["total_latency_ms"] / stats["requests"], 3),
+            max_latency_ms=round(stats["max_latency_ms"], 3),
+            ejections=stats["ejections"],
+            ejected=self.is_ejected(endpoint),
+        )
+
+
+BALANCERS = {}
+
+
+def get_endpoint_balancer(endpoints: list) -> EndpointBalancer:
+    """Get process wide endpoint balancer for given endpoints."""
+    key = tuple(endpoints)
+    if key not in BALANCERS:
+        BALANCERS[key] = EndpointBalancer(endpoints)
+    return BALANCERS[key]
@@ -0,0 +1,53 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""Connector settings of asyncio s3 clients."""
+
+from config import S3_CFG
+
+
+def get_connector_args() -> dict:
+    """
+    Get aiohttp connector args of AioConfig as per connector config of s3_config.yaml.
+
+    aiobotocore accepts only keepalive_timeout, use_dns_cache, force_close, ssl_context and
+    resolver as connector args, total connections are bounded by max_pool_connections.
+    force_close is applied by close_connection as aiobotocore always sets keepalive_timeout,
+    which aiohttp rejects along with force_close.
+    """
+    conn_cfg = S3_CFG.get("connector") or {}
+    return {
+        "keepalive_timeout": conn_cfg.get("keepalive_timeout", 12),
+        "use_dns_cache": bool(conn_cfg.get("use_dns_cache", True)),
+    }
+
+
+def close_connection(request, **kwargs) -> None:
+    """Close connection after the response, handler of before-send event of the client."""
+    # pylint: disable=unused-argument
+    request.headers["Connection"] = "close"
+
+
+def register_connection_handlers(client) -> None:
+    """Register connection event handlers of the client as per connector config."""
+    if (S3_CFG.get("connector") or {}).get("force_close", False):
+        # Header is added after the request is signed, so it is not part of the signature.
+        client.meta.events.register("before-send", close_connection)
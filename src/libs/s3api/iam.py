@@ -145,16 +145,15 @@ class IAMUserAPI(S3RestApi):
 
         :param user_name: Name of the IAM user.
         """
-        async with self.get_client(service_name="iam") as client:
-            response = {}
-            # Delete all access keys.
-            resp = await self.list_access_keys(user_name)
-            for ele in resp["AccessKeyMetadata"]:
-                await self.delete_access_key(user_name, ele["AccessKeyId"])
-            # Delete user login profile.
-            resp = await self.delete_user_login_profile(user_name)
-            response.update(resp)
-            # Delete user.
-            resp = await client.delete_user(UserName=user_name)
-            response.update(resp)
+        response = {}
+        # Delete all access keys.
+        resp = await self.list_access_keys(user_name)
+        for ele in resp["AccessKeyMetadata"]:
+            await self.delete_access_key(user_name, ele["AccessKeyId"])
+        # Delete user login profile.
+        resp = await self.delete_user_login_profile(user_name)
+        response.update(resp)
+        # Delete user.
+        resp = await self.delete_user(user_name)
+        response.update(resp)
         return response
@@ -0,0 +1,153 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+"""On disk journal of multipart uploads to resume them from uploaded parts."""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+
+from config import S3_CFG
+from src.commons.constants import MULTIPART_JOURNAL_DIR
+from src.commons.constants import ROOT
+
+LOGGER = logging.getLogger(ROOT)
+
+
+def get_journal_dir() -> str:
+    """Get directory of multipart journals, default is multipart_journal of data directory."""
+    return (S3_CFG.get("multipart") or {}).get("journal_dir") or MULTIPART_JOURNAL_DIR
+
+
+class MultipartJournal:
+    """
+    Append only journal of a multipart upload i.e. upload id and uploaded parts with ETag.
+
+    First line is the upload and every uploaded part is appended as a line, so a part is
+    recorded by one small write and journal is readable after crash except last partial line.
+    """
+
+    def __init__(self, bucket: str, key: str, journal_dir: str = None):
+        """
+        Initialize journal of the multipart upload.
+
+        :param bucket: Name of the bucket.
+        :param key: Name of the object.
+        :param journal_dir: Directory of the journals, default is of s3 config.
+        """
+        self.bucket = bucket
+        self.key = key
+        journal_dir = journal_dir or get_journal_dir()
+        name = hashlib.md5(f"{bucket}/{key}".encode()).hexdigest()  # nosec
+        self.path = os.path.join(journal_dir, f"{bucket}-{name}.journal")
+        self.upload_id = None
+        self.info = {}
+        self.parts = {}
+
+    def start(self, upload_id: str, info: dict = None) -> None:
+        """
+        Start journal of new upload, journal of earlier upload of the object is replaced.
+
+        :param upload_id: upload id of the multipart upload.
+        :param info: Details of the upload recorded with it ex: Size, PartSize.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.upload_id = upload_id
+        self.info = dict(info or {})
+        self.parts = {}
+        with open(self.path, "w", encoding="utf-8") as journal:
+            json.dump(
+                {"Bucket": self.bucket, "Key": self.key, "UploadId": upload_id, **self.info},
+                journal,
+            )
+            journal.write("\n")
+
+    def load(self) -> bool:
+        """
+        Load upload id and uploaded parts from journal.
+
+        :return: False if there is no journal or its upload is not readable e.g. journal is
+            being created by other process.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as journal:
+                lines = journal.read().splitlines()
+            upload = json.loads(lines[0])
+        except FileNotFoundError:
+            return False
+        except (ValueError, IndexError, OSError) as error:
+            LOGGER.warning("Skipped unreadable journal %s: %s", self.path, error)
+            return False
+        self.upload_id = upload.pop("UploadId")
+        self.info = {k: v for k, v in upload.items() if k not in ("Bucket", "Key")}
+        self.parts = {}
+        for line in lines[1:]:
+            try:
+                part = json.loads(line)
+            except ValueError:
+                LOGGER.warning("Skipped partially written part of journal %s", self.path)
+                continue
+            self.parts[part["PartNumber"]] = part["ETag"]
+        return True
+
+    def record_part(self, part_number: int, etag: str) -> None:
+        """
+        Record uploaded part.
+
+        :param part_number: Number of the part.
+        :param etag: ETag of the part.
+        """
+        self.parts[part_number] = etag
+        with open(self.path, "a", encoding="utf-8") as journal:
+            journal.write(json.dumps({"PartNumber": part_number, "ETag": etag}) + "\n")
+
+    def remove(self) -> None:
+        """Remove journal once upload is completed or aborted."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    @classmethod
+    def list_journals(cls, bucket: str, journal_dir: str = None) -> list:
+        """
+        Get journals of the bucket left by uploads which are not completed or aborted.
+
+        Journals being written or removed by other processes are skipped.
+        :param bucket: Name of the bucket.
+        :param journal_dir: Directory of the journals, default is of s3 config.
+        """
+        journals = []
+        for path in glob.glob(os.path.join(journal_dir or get_journal_dir(), "*.journal")):
+            try:
+                with open(path, encoding="utf-8") as journal:
+                    upload = json.loads(journal.readline())
+                if upload["Bucket"] != bucket:
+                    continue
+                journal = cls(upload["Bucket"], upload["Key"], journal_dir)
+            except (ValueError, KeyError, OSError) as error:
+                LOGGER.warning("Skipped unreadable journal %s: %s", path, error)
+                continue
+            if journal.load():
+                journals.append(journal)
+        return journals
@@ -25,10 +25,10 @@ import string
 import time
 
 from src.commons.utils.corio_utils import retries
-from src.libs.s3api.s3_restapi import S3RestApi
+from src.libs.s3api.s3_bulk_delete_ops import S3BulkDelete
 
 
-class S3Bucket(S3RestApi):
+class S3Bucket(S3BulkDelete):
     """Class for bucket operations."""
 
     def __init__(self, *args, **kwargs):
@@ -102,26 +102,24 @@ class S3Bucket(S3RestApi):
         """
         Delete the empty bucket or deleting the buckets along with objects stored in it.
 
+        Objects are deleted by delete objects batches of bulk_delete batch_size keys with up to
+        batches_in_flight batches at once as per s3 config.
         :param bucket_name: Name of the bucket.
         :param force: Value for delete bucket with object or without object.
         :return: Response of delete bucket.
         """
-        async with self.get_client() as client:
-            if force:
-                self.log.info(
-                    "This might cause data loss as you have opted for bucket deletion"
-                    " with objects in it"
-                    )
-                # list s3 objects using paginator
-                paginator = client.get_paginator("list_objects")
-                async for result in paginator.paginate(Bucket=bucket_name):
-                    for content in result.get("Contents", []):
-                        self.s3_url = f"s3://{bucket_name}/{content['Key']}"
-                        resp = await client.delete_object(
-                            Bucket=bucket_name, Key=content["Key"]
-                            )
-                        self.log.debug(resp)
+        if force:
+            self.log.info(
+                "This might cause data loss as you have opted for bucket deletion"
+                " with objects in it"
+                )
+            # Listed pages are deleted by concurrent delete objects batches.
+            result = await self.delete_keys(
+                bucket_name, self.iter_key_pages(bucket_name), operation="delete_bucket"
+            )
+            if not result["Errors"]:
                 self.log.info("All objects deleted successfully.")
+        async with self.get_client() as client:
             self.s3_url = f"s3://{bucket_name}"
             response = await client.delete_bucket(Bucket=bucket_name)
             self.log.info(
@@ -182,23 +180,28 @@ class S3Bucket(S3RestApi):
         :return: response.
         """
         self.s3_url = f"s3://{bucket_name}"
-        bucket = self.get_boto3_resource().Bucket(bucket_name)
+        client = self.get_boto3_client()
         if force:
             self.log.info(
                 "This might cause data loss as you have opted for bucket deletion with "
                 "objects in it"
                 )
-            response = bucket.objects.all().delete()
-            self.log.debug(
-                "Objects deleted successfully from bucket %s, response: %s",
-                bucket_name,
-                response,
-                )
-        response = bucket.delete()
+            # Each page of list objects is deleted in a single delete objects request.
+            for page in client.get_paginator("list_objects").paginate(Bucket=bucket_name):
+                objects = [{"Key": content["Key"]} for content in page.get("Contents", [])]
+                if objects:
+                    response = client.delete_objects(
+                        Bucket=bucket_name, Delete={"Objects": objects}
+                        )
+                    self.log.debug(
+                        "Objects deleted successfully from bucket %s, response: %s",
+                        bucket_name,
+                        response,
+                        )
+        response = client.delete_bucket(Bucket=bucket_name)
         self.log.debug(
             "Bucket '%s' deleted successfully. Response: %s", bucket_name, response
             )
-
         return response
 
     @staticmethod
@@ -0,0 +1,187 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+#
+
+
+"""Python Library to delete objects in concurrent batches using aiobotocore module."""
+
+import asyncio
+import time
+from typing import AsyncIterable
+from typing import List
+
+from config import S3_CFG
+from src.commons.metrics import update_metrics
+from src.commons.utils.corio_utils import retries
+from src.libs.s3api.s3_restapi import S3RestApi
+
+# Batched delete settings of the process.
+BULK_DELETE_CFG = S3_CFG.get("bulk_delete") or {}
+# Maximum number of keys of a delete objects request.
+MAX_DELETE_KEYS = 1000
+
+
+class S3BulkDelete(S3RestApi):
+    """Class for deleting objects in concurrent delete objects batches."""
+
+    @retries()
+    async def list_objects_page(
+        self, bucket_name: str, prefix: str = "", continuation_token: str = None
+    ) -> dict:
+        """
+        List one page of objects.
+
+        :param bucket_name: Name of the bucket.
+        :param prefix: Prefix of the objects.
+        :param continuation_token: Token of the page from previous page, None for first page.
+        :return: Response of list objects v2.
+        """
+        kwargs = {"ContinuationToken": continuation_token} if continuation_token else {}
+        async with self.get_client() as client:
+            self.s3_url = f"s3://{bucket_name}"
+            response = await client.list_objects_v2(Bucket=bucket_name, Prefix=prefix, **kwargs)
+            self.log.debug("list_objects_page: s3://%s, Response: %s", bucket_name, response)
+
+        return response
+
+    async def iter_key_pages(self, bucket_name: str, prefix: str = "") -> AsyncIterable[list]:
+        """
+        Generate keys of the objects page by page.
+
+        Next page is listed only when the keys of current page are consumed, every page is listed
+        by its own request so that connection is not held while the keys are being deleted.
+        :param bucket_name: Name of the bucket.
+        :param prefix: Prefix of the objects.
+        """
+        continuation_token = None
+        while True:
+            response = await self.list_objects_page(bucket_name, prefix, continuation_token)
+            yield [content["Key"] for content in response.get("Contents", [])]
+            if not response.get("IsTruncated"):
+                break
+            continuation_token = response["NextContinuationToken"]
+
+    @retries()
+    async def delete_objects_batch(self, bucket_name: str, keys: List[str]) -> list:
+        """
+        Delete a batch of objects by single quiet delete objects request.
+
+        :param bucket_name: Name of the bucket.
+        :param keys: Names of the objects, up to 1000.
+        :return: Errors of the keys which are not deleted.
+        """
+        async with self.get_client() as client:
+            self.s3_url = f"s3://{bucket_name}"
+            response = await client.delete_objects(
+                Bucket=bucket_name,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+            self.log.debug("delete_objects_batch: s3://%s, Response: %s", bucket_name, response)
+
+        return response.get("Errors", [])
+
+    # pylint: disable=too-many-arguments
+    async def delete_keys(
+        self,
+        bucket_name: str,
+        key_pages: AsyncIterable[list],
+        batch_size: int = 0,
+        batches_in_flight: int = 0,
+        operation: str = "delete_keys",
+    ) -> dict:
+        """
+        Delete keys streamed in pages by delete objects batches with bounded batches in flight.
+
+        Keys of the pages are regrouped in batch_size batches, next page is taken only when a
+        batch can be started so that keys are not accumulated in memory. Keys failed to delete
+        are logged and returned, deleted keys per second is reported in client metrics.
+        :param bucket_name: Name of the bucket.
+        :param key_pages: Pages of the keys ex: iter_key_pages.
+        :param batch_size: Keys per delete objects request up to 1000, default is of s3 config.
+        :param batches_in_flight: Maximum batches deleted at once, default is of s3 config.
+        :param operation: Name of the metric of deletion.
+        :return: Number of deleted keys and errors with Key, Code and Message of failed keys.
+        """
+        batch_size = min(
+            batch_size or BULK_DELETE_CFG.get("batch_size", MAX_DELETE_KEYS), MAX_DELETE_KEYS
+        )
+        batches_in_flight = batches_in_flight or BULK_DELETE_CFG.get("batches_in_flight", 8)
+        result = {"Deleted": 0, "Errors": []}
+        pending, keys = set(), []
+        start_time = time.perf_counter()
+
+        async def delete_batch(batch: list) -> tuple:
+            return len(batch), await self.delete_objects_batch(bucket_name, batch)
+
+        def consume(done: set) -> None:
+            for task in done:
+                count, errors = task.result()
+                result["Deleted"] += count - len(errors)
+                result["Errors"] += errors
+
+        async def start_batch(batch: list) -> None:
+            nonlocal pending
+            if len(pending) >= batches_in_flight:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                consume(done)
+            pending.add(asyncio.ensure_future(delete_batch(batch)))
+
+        try:
+            async for page in key_pages:
+                keys += page
+                while len(keys) >= batch_size:
+                    batch, keys = keys[:batch_size], keys[batch_size:]
+                    await start_batch(batch)
+            if keys:
+                await start_batch(keys)
+            if pending:
+                done, pending = await asyncio.wait(pending)
+                consume(done)
+        finally:
+            for task in pending:
+                task.cancel()
+        elapsed = time.perf_counter() - start_time
+        keys_per_sec = round(result["Deleted"] / elapsed, 3) if elapsed else 0
+        for error in result["Errors"]:
+            self.log.warning(
+                "Failed to delete s3://%s/%s, %s: %s",
+                bucket_name,
+                error.get("Key"),
+                error.get("Code"),
+                error.get("Message"),
+            )
+        update_metrics(
+            "bulk_delete",
+            operation,
+            deleted=result["Deleted"],
+            errors=len(result["Errors"]),
+            keys_per_sec=keys_per_sec,
+        )
+        self.log.info(
+            "%s: deleted %s objects of s3://%s in %.3f s, %s keys/sec, %s errors",
+            operation,
+            result["Deleted"],
+            bucket_name,
+            elapsed,
+            keys_per_sec,
+            len(result["Errors"]),
+        )
+
+        return result
@@ -21,9 +21,62 @@
 
 """Python Library to perform multipart operations using aiobotocore module."""
 
+import asyncio
+import hashlib
+import io
+import threading
+import time
+from typing import Callable
+from typing import Iterable
+
+from botocore.exceptions import ClientError
+
+from config import S3_CFG
+from src.commons.metrics import increment_metrics
+from src.commons.metrics import update_metrics
+from src.commons.utils.corio_utils import get_retry_delay
+from src.commons.utils.corio_utils import is_retryable_error
 from src.commons.utils.corio_utils import retries
+from src.commons.utils.hash_utils import ChunkHasher
+from src.libs.s3api.body_reader import BUFFER_POOL
+from src.libs.s3api.body_reader import BodyReader
+from src.libs.s3api.multipart_journal import MultipartJournal
 from src.libs.s3api.s3_restapi import S3RestApi
 
+# Multipart upload settings of the process.
+MULTIPART_CFG = S3_CFG.get("multipart") or {}
+# Maximum number of parts of a multipart upload.
+MAX_PARTS = 10000
+# Validation of multipart object by comparing its ETag with ETag calculated on upload.
+ETAG_VALIDATION = "etag"
+# Validation of multipart object by comparing checksum of every part read as byte range.
+PARTS_VALIDATION = "parts"
+PART_STATS = {"parts": 0, "bytes": 0, "total_latency_ms": 0.0, "max_latency_ms": 0.0}
+PART_STATS_LOCK = threading.Lock()
+
+
+def record_part_latency(size: int, latency_ms: float) -> None:
+    """
+    Update latency of uploaded parts of the process in client metrics.
+
+    :param size: Size of the part in bytes.
+    :param latency_ms: Time taken to upload the part in ms.
+    """
+    with PART_STATS_LOCK:
+        PART_STATS["parts"] += 1
+        PART_STATS["bytes"] += size
+        PART_STATS["total_latency_ms"] += latency_ms
+        PART_STATS["max_latency_ms"] = max(PART_STATS["max_latency_ms"], latency_ms)
+        stats = dict(PART_STATS)
+    update_metrics(
+        "multipart",
+        "upload_part",
+        parts=stats["parts"],
+        uploaded_mb=round(stats["bytes"] / 1024**2, 3),
+        avg_latency_ms=round(stats["total_latency_ms"] / stats["parts"], 3),
+        max_latency_ms=round(stats["max_latency_ms"], 3),
+    )
+
 
 class S3MultiParts(S3RestApi):
     """Class for Multipart operations."""
@@ -32,6 +85,30 @@ class S3MultiParts(S3RestApi):
         """Initialize S3MultiParts operations."""
         super().__init__(*args, **kwargs)
         self.s3_url = None
+        # Per part checksum manifests of uploaded objects by s3 url, kept till validated.
+        self.part_manifests = {}
+
+    @staticmethod
+    def is_multipart_upload(size: int) -> bool:
+        """Check if object of size is uploaded as multipart upload as per upload threshold."""
+        threshold = MULTIPART_CFG.get("upload_threshold", 0)
+        return bool(threshold) and size is not None and size > threshold
+
+    @staticmethod
+    def get_part_size(size: int) -> int:
+        """Get part size of multipart upload of object of size, object fits in max parts."""
+        return max(MULTIPART_CFG.get("part_size", 64 * 1024**2), -(-size // MAX_PARTS))
+
+    @staticmethod
+    def get_multipart_etag(part_md5s: Iterable[str]) -> str:
+        """
+        Get ETag of multipart object i.e. md5 of md5 of the parts and number of parts.
+
+        :param part_md5s: Hex md5 of the parts in part number order.
+        :return: Quoted ETag same as of head object ex: "<md5>-<number of parts>".
+        """
+        digests = [bytes.fromhex(part_md5) for part_md5 in part_md5s]
+        return f'"{hashlib.md5(b"".join(digests)).hexdigest()}-{len(digests)}"'  # nosec
 
     @retries()
     async def create_multipart_upload(self, bucket_name: str, obj_name: str) -> dict:
@@ -69,6 +146,9 @@ class S3MultiParts(S3RestApi):
         part_number = kwargs.get("part_number")
         async with self.get_client() as client:
             self.s3_url = s3_url = f"s3://{bucket_name}/{object_name}"
+            if isinstance(body, io.IOBase) and body.seekable():
+                # Rewind body on retry.
+                body.seek(0)
             response = await client.upload_part(
                 Body=body,
                 Bucket=bucket_name,
@@ -210,3 +290,345 @@ class S3MultiParts(S3RestApi):
             )
 
         return response
+
+    async def upload_parts(
+        self,
+        bucket_name: str,
+        object_name: str,
+        upload_id: str,
+        parts: Iterable[dict],
+        parts_in_flight: int = 0,
+        journal: MultipartJournal = None,
+    ) -> list:
+        """
+        Upload parts of a multipart upload concurrently with bounded number of parts in flight.
+
+        Next part is taken from parts only when one of the parts in flight is uploaded, so part
+        data generated lazily by parts ex: generator of ObjectBody is backpressured by uploads.
+        On first failure no more parts are started, parts in flight are completed so that they are
+        recorded in journal and then the failure is raised.
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object.
+        :param upload_id: upload id of the multipart upload.
+        :param parts: Parts in any order, dict of PartNumber with Body or CopySource.
+        :param parts_in_flight: Maximum parts uploaded at once, default is of s3 config.
+        :param journal: Journal of the upload, parts in journal are skipped and uploaded parts
+            are recorded in it.
+        :return: Uploaded parts with PartNumber and ETag sorted by part number.
+        """
+        parts_in_flight = parts_in_flight or MULTIPART_CFG.get("parts_in_flight", 8)
+        etags = {}
+        pending = set()
+        parts = iter(parts)
+        try:
+            while True:
+                if len(pending) >= parts_in_flight:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    etags.update(task.result() for task in done)
+                part = next(parts, None)
+                if part is None:
+                    break
+                if journal and part["PartNumber"] in journal.parts:
+                    etags[part["PartNumber"]] = journal.parts[part["PartNumber"]]
+                    continue
+                pending.add(
+                    asyncio.ensure_future(
+                        self.upload_window_part(
+                            bucket_name, object_name, upload_id, part, journal
+                        )
+                    )
+                )
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                etags.update(task.result() for task in done)
+        except Exception:
+            if pending:
+                await asyncio.wait(pending)
+            raise
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return [{"PartNumber": number, "ETag": etags[number]} for number in sorted(etags)]
+
+    # pylint: disable=too-many-arguments
+    async def upload_window_part(
+        self,
+        bucket_name: str,
+        object_name: str,
+        upload_id: str,
+        part: dict,
+        journal: MultipartJournal = None,
+    ) -> tuple:
+        """
+        Upload or copy part of upload_parts and record its latency.
+
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object.
+        :param upload_id: upload id of the multipart upload.
+        :param part: dict of PartNumber with Body or CopySource.
+        :param journal: Journal of the upload to record uploaded part.
+        :return: Part number and ETag of the part.
+        """
+        start_time = time.perf_counter()
+        if "CopySource" in part:
+            response = await self.upload_part_copy(
+                part["CopySource"],
+                bucket_name,
+                object_name,
+                upload_id=upload_id,
+                part_number=part["PartNumber"],
+            )
+            etag, size = response["CopyPartResult"]["ETag"], part.get("Size", 0)
+        else:
+            response = await self.upload_part(
+                part["Body"],
+                bucket_name,
+                object_name,
+                upload_id=upload_id,
+                part_number=part["PartNumber"],
+            )
+            etag, size = response["ETag"], len(part["Body"])
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        record_part_latency(size, latency_ms)
+        self.log.info(
+            "upload_parts: s3://%s/%s, PartNumber: %s, Size: %s, Latency: %.3f ms",
+            bucket_name,
+            object_name,
+            part["PartNumber"],
+            size,
+            latency_ms,
+        )
+        if etag is None:
+            raise AssertionError(f"Failed upload part: {response}")
+        if journal:
+            # Journal is appended off the event loop.
+            await self.run_sync(journal.record_part, part["PartNumber"], etag)
+
+        return part["PartNumber"], etag
+
+    # pylint: disable=too-many-arguments
+    async def resume_upload_parts(
+        self,
+        bucket_name: str,
+        object_name: str,
+        upload_id: str,
+        get_parts: Callable[[], Iterable[dict]],
+        parts_in_flight: int = 0,
+        upload_info: dict = None,
+    ) -> list:
+        """
+        Upload parts with on disk journal and resume from uploaded parts on transient failure.
+
+        Upload is resumed up to multipart resume_attempts times if a part failed with retryable
+        error even after its retries, parts recorded in journal are not uploaded again. Journal
+        of the same upload id left on disk by earlier process is loaded, so the upload is also
+        resumed after crash. Journal is left on failure to be cleaned by
+        abort_multipart_uploads, else it is removed.
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object.
+        :param upload_id: upload id of the multipart upload.
+        :param get_parts: Function returning parts of the upload, called again on resume.
+        :param parts_in_flight: Maximum parts uploaded at once, default is of s3 config.
+        :param upload_info: Details of the upload recorded in new journal ex: Size, PartSize.
+        :return: Uploaded parts with PartNumber and ETag sorted by part number.
+        """
+        journal = MultipartJournal(bucket_name, object_name)
+        if await self.run_sync(journal.load) and journal.upload_id == upload_id:
+            self.log.info(
+                "Resuming upload %s of s3://%s/%s from journal with %s uploaded parts",
+                upload_id,
+                bucket_name,
+                object_name,
+                len(journal.parts),
+            )
+        else:
+            await self.run_sync(journal.start, upload_id, upload_info)
+        attempt = 0
+        while True:
+            try:
+                parts = await self.upload_parts(
+                    bucket_name, object_name, upload_id, get_parts(), parts_in_flight, journal
+                )
+                await self.run_sync(journal.remove)
+                return parts
+            except Exception as err:
+                attempt += 1
+                resume_attempts = MULTIPART_CFG.get("resume_attempts", 3)
+                if attempt > resume_attempts or not is_retryable_error(err):
+                    raise
+                increment_metrics("multipart", "resume", resumes=1, reused_parts=len(journal.parts))
+                self.log.warning(
+                    "Resuming upload %s of s3://%s/%s with %s uploaded parts, error: %s",
+                    upload_id,
+                    bucket_name,
+                    object_name,
+                    len(journal.parts),
+                    err,
+                )
+            await asyncio.sleep(
+                get_retry_delay(
+                    attempt - 1, S3_CFG.retry_delay, S3_CFG.get("retry_max_delay", 60)
+                )
+            )
+
+    def store_part_manifest(
+        self, bucket_name: str, object_name: str, algorithm: str, parts: Iterable[tuple]
+    ) -> list:
+        """
+        Store checksum manifest of the parts of uploaded object to validate them by validate_parts.
+
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object.
+        :param algorithm: Hash algorithm of the checksums.
+        :param parts: Size and checksum of the parts in part number order.
+        :return: Parts of manifest with PartNumber, Offset, Size and Checksum.
+        """
+        manifest, offset = [], 0
+        for part_number, (size, checksum) in enumerate(parts, 1):
+            manifest.append(
+                {"PartNumber": part_number, "Offset": offset, "Size": size, "Checksum": checksum}
+            )
+            offset += size
+        self.part_manifests[f"s3://{bucket_name}/{object_name}"] = {
+            "Algorithm": algorithm,
+            "Parts": manifest,
+        }
+
+        return manifest
+
+    @retries()
+    async def get_part_checksum(
+        self, bucket_name: str, object_name: str, part: dict, algorithm: str
+    ) -> str:
+        """
+        Read part of object as byte range and calculate its checksum.
+
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object.
+        :param part: Part of manifest with Offset and Size.
+        :param algorithm: Hash algorithm of the checksum.
+        :return: Checksum of the part.
+        """
+        file_hash = ChunkHasher(algorithm)
+        if not part["Size"]:
+            return await file_hash.hexdigest_async()
+        async with self.get_client() as client:
+            self.s3_url = s3_url = f"s3://{bucket_name}/{object_name}"
+            response = await client.get_object(
+                Bucket=bucket_name,
+                Key=object_name,
+                Range=f"bytes={part['Offset']}-{part['Offset'] + part['Size'] - 1}",
+            )
+            self.log.info(
+                "get_part_checksum: %s, PartNumber: %s, Response: %s",
+                s3_url,
+                part["PartNumber"],
+                response,
+            )
+            chunk_size = min(S3_CFG.chunk_size, part["Size"])
+            async with response["Body"] as stream:
+                reader = BodyReader(stream, response["ContentLength"])
+                # Chunk is read in one buffer while chunk in other buffer is being hashed.
+                with BUFFER_POOL.get_buffers(chunk_size, 2) as buffers:
+                    index = 0
+                    count = await reader.readinto(buffers[index])
+                    while count:
+                        await file_hash.update_async(buffers[index][:count])
+                        index ^= 1
+                        count = await reader.readinto(buffers[index])
+                    digest = await file_hash.hexdigest_async()
+
+        return digest
+
+    async def validate_parts(
+        self, bucket_name: str, object_name: str, parts_in_flight: int = 0
+    ) -> None:
+        """
+        Validate object by checksum of every part of its manifest, parts are read concurrently.
+
+        Manifest is removed once validated. All the parts are checked so that every corrupted
+        part is reported and not only the first one.
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object.
+        :param parts_in_flight: Maximum parts read at once, default is of s3 config.
+        """
+        s3_url = f"s3://{bucket_name}/{object_name}"
+        manifest = self.part_manifests.pop(s3_url, None)
+        if manifest is None:
+            raise ValueError(f"Part manifest of {s3_url} is not found")
+        semaphore = asyncio.Semaphore(
+            parts_in_flight or MULTIPART_CFG.get("parts_in_flight", 8)
+        )
+
+        async def check_part(part: dict) -> dict:
+            async with semaphore:
+                checksum = await self.get_part_checksum(
+                    bucket_name, object_name, part, manifest["Algorithm"]
+                )
+            return None if checksum == part["Checksum"] else dict(part, Actual=checksum)
+
+        corrupted = [
+            part
+            for part in await asyncio.gather(*map(check_part, manifest["Parts"]))
+            if part
+        ]
+        if corrupted:
+            raise AssertionError(
+                f"Failed to match checksum of {len(corrupted)} parts of {s3_url}: "
+                + ", ".join(
+                    f"PartNumber {part['PartNumber']} at offset {part['Offset']} of size "
+                    f"{part['Size']}: {part['Checksum']}, {part['Actual']}"
+                    for part in corrupted
+                )
+            )
+        self.log.info("Checksum of %s parts of %s matched", len(manifest["Parts"]), s3_url)
+
+    async def get_journal_upload_id(
+        self, bucket_name: str, object_name: str, upload_info: dict
+    ) -> str:
+        """
+        Get upload id of the journal left on disk by earlier upload of the object to resume it.
+
+        Upload is resumed only if the journal is of same upload details and the upload still
+        exists, else the journal is removed.
+        :param bucket_name: Name of the bucket.
+        :param object_name: Name of the object.
+        :param upload_info: Details of the upload ex: Size, PartSize.
+        :return: upload id or None if there is no upload to resume.
+        """
+        journal = MultipartJournal(bucket_name, object_name)
+        if not await self.run_sync(journal.load):
+            return None
+        if journal.info == upload_info:
+            try:
+                await self.list_parts(journal.upload_id, bucket_name, object_name)
+                return journal.upload_id
+            except ClientError as error:
+                self.log.warning(
+                    "Upload %s of journal %s is not resumable: %s",
+                    journal.upload_id,
+                    journal.path,
+                    error,
+                )
+        await self.run_sync(journal.remove)
+        return None
+
+    async def abort_multipart_uploads(self, bucket_name: str) -> int:
+        """
+        Abort leftover multipart uploads of the bucket and remove their journals.
+
+        :param bucket_name: Name of the bucket.
+        :return: Number of aborted uploads.
+        """
+        uploads = await self.list_multipart_uploads(bucket_name)
+        for upload in uploads:
+            await self.abort_multipart_upload(bucket_name, upload["Key"], upload["UploadId"])
+        for journal in await self.run_sync(MultipartJournal.list_journals, bucket_name):
+            await self.run_sync(journal.remove)
+        if uploads:
+            self.log.info("Aborted %s leftover uploads of s3://%s", len(uploads), bucket_name)
+
+        return len(uploads)
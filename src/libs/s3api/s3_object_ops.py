@@ -21,39 +21,240 @@
 
 """Python Library to perform object operations using aiobotocore module."""
 
-import hashlib
+import asyncio
+import io
 import os
+import time
+from collections import deque
+from functools import partial
 from typing import List
 
+import numpy as np
+from botocore.exceptions import IncompleteReadError
+
 from config import S3_CFG
+from src.commons.metrics import update_metrics
+from src.commons.utils.asyncio_utils import run_event_loop_until_complete
+from src.commons.utils.chunk_sizer import ChunkSizer
 from src.commons.utils.corio_utils import retries
-from src.libs.s3api.s3_restapi import S3RestApi
-
-
-class S3Object(S3RestApi):
-    """Class for object operations."""
+from src.commons.utils.data_generator import DataGenerator
+from src.commons.utils.data_generator import ObjectBody
+from src.commons.utils.hash_utils import SHA256
+from src.commons.utils.hash_utils import ChunkHasher
+from src.commons.utils.hash_utils import new_hash
+from src.libs.s3api.body_reader import BUFFER_POOL
+from src.libs.s3api.body_reader import BodyReader
+from src.libs.s3api.multipart_journal import MultipartJournal
+from src.libs.s3api.s3_bulk_delete_ops import S3BulkDelete
+from src.libs.s3api.s3_multipart_ops import S3MultiParts
+
+# Data validation modes of the downloaded object.
+CHECKSUM_VALIDATION = "checksum"
+REGENERATE_VALIDATION = "regenerate"
+
+ADAPTIVE_CHUNK_CFG = S3_CFG.get("adaptive_chunk_size") or {}
+# Read chunk size of the process adapted to bandwidth of get object reads, None if disabled.
+CHUNK_SIZER = (
+    ChunkSizer(
+        min_chunk_size=ADAPTIVE_CHUNK_CFG.get("min_chunk_size", 64 * 1024),
+        max_chunk_size=ADAPTIVE_CHUNK_CFG.get("max_chunk_size", 16 * 1024**2),
+        target_chunk_ms=ADAPTIVE_CHUNK_CFG.get("target_chunk_ms", 100),
+        default_chunk_size=S3_CFG.chunk_size,
+    )
+    if ADAPTIVE_CHUNK_CFG.get("enabled")
+    else None
+)
+
+
+class S3Object(S3MultiParts, S3BulkDelete):
+    """Class for object operations, large objects are uploaded using multipart operations."""
 
     def __init__(self, *args, **kwargs):
         """Initialize S3Object operations."""
         super().__init__(*args, **kwargs)
         self.s3_url = None
+        # Object data is generated in memory from seed and key instead of local files.
+        self.data_generator = DataGenerator(kwargs.get("seed"), kwargs.get("data_profile"))
+        # checksum: compare checksum of download with checksum of uploaded data.
+        # regenerate: compare download with data regenerated at same offset, no checksum state.
+        self.validation_mode = kwargs.get("validation_mode") or CHECKSUM_VALIDATION
+        if self.validation_mode not in (CHECKSUM_VALIDATION, REGENERATE_VALIDATION):
+            raise ValueError(f"Unsupported validation mode: {self.validation_mode}")
+        # Hash algorithm of checksums i.e. sha256, blake2b, md5(same as single part ETag), crc32c.
+        self.hash_algorithm = kwargs.get("hash_algorithm") or SHA256
+        new_hash(self.hash_algorithm)
+        # Objects larger than range_size are read as byte ranges, ranges_in_flight at once.
+        parallel_read = {
+            **(S3_CFG.get("parallel_read") or {}),
+            **(kwargs.get("parallel_read") or {}),
+        }
+        self.range_size = parallel_read.get("range_size", 8 * 1024**2)
+        self.ranges_in_flight = parallel_read.get("ranges_in_flight", 1)
+
+    @staticmethod
+    def get_chunk_size(chunk_size: int, content_length: int) -> int:
+        """
+        Get chunk size to read object body.
+
+        :param chunk_size: Chunk size given by caller, used as is if non zero.
+        :param content_length: Length of the object body.
+        """
+        if chunk_size:
+            return chunk_size
+        if CHUNK_SIZER:
+            return CHUNK_SIZER.get_chunk_size(content_length)
+        return S3_CFG.chunk_size
+
+    @staticmethod
+    def record_read(nbytes: int, seconds: float) -> None:
+        """
+        Update read bandwidth estimate of adaptive chunk size with completed body read.
+
+        :param nbytes: Number of bytes read.
+        :param seconds: Time taken to read the body.
+        """
+        if CHUNK_SIZER:
+            CHUNK_SIZER.record(nbytes, seconds)
+            update_metrics(
+                "read_chunk_size",
+                "get_object",
+                bandwidth_mbps=round(CHUNK_SIZER.bandwidth / 1024**2, 3),
+                chunk_size=CHUNK_SIZER.get_chunk_size(),
+            )
 
-    @retries()
     async def upload_object(self, bucket: str, key: str, **kwargs) -> dict:
         """
         Upload object to the Bucket, file_path or body is compulsory.
 
+        Object larger than multipart upload threshold is uploaded as multipart upload with parts
+        uploaded concurrently, else it is uploaded by put object.
+        :param bucket: Name of the bucket.
+        :param key: Name of the object.
+        :keyword file_path: Path of the file.
+        :keyword body: Content of Object i.e. bytes or file like object ex: ObjectBody.
+        :return: Response of the upload s3 object i.e. of put object or complete multipart upload.
+        """
+        size = self.get_upload_size(kwargs.get("body"), kwargs.get("file_path"))
+        if self.is_multipart_upload(size):
+            return await self.upload_multipart_object(bucket, key, size, **kwargs)
+        return await self.put_object(bucket, key, **kwargs)
+
+    @staticmethod
+    def get_upload_size(body=None, file_path: str = None) -> int:
+        """
+        Get size of the upload body or file, None if it is not known.
+
+        :param body: Content of Object i.e. bytes or file like object ex: ObjectBody.
+        :param file_path: Path of the file.
+        """
+        if body is None:
+            return os.path.getsize(file_path) if file_path and os.path.isfile(file_path) else None
+        if hasattr(body, "__len__"):
+            return len(body)
+        if isinstance(body, io.IOBase) and body.seekable():
+            size = body.seek(0, io.SEEK_END)
+            body.seek(0)
+            return size
+        return None
+
+    @staticmethod
+    def iter_body_parts(body, size: int, part_size: int):
+        """
+        Generate parts of upload body lazily as they are scheduled for upload.
+
+        Parts of generated body are bodies of generated data at offset of the part.
+        :param body: Content of Object i.e. bytes or seekable file like object ex: ObjectBody.
+        :param size: Size of the body.
+        :param part_size: Size of the part.
+        """
+        for part_number, offset in enumerate(range(0, size, part_size), 1):
+            length = min(part_size, size - offset)
+            if isinstance(body, ObjectBody):
+                part = body.generator.get_body(body.key, length, body.offset + offset)
+            elif isinstance(body, (bytes, bytearray, memoryview)):
+                part = bytes(body[offset : offset + length])
+            else:
+                body.seek(offset)
+                part = body.read(length)
+            yield {"PartNumber": part_number, "Body": part}
+
+    async def upload_multipart_object(self, bucket: str, key: str, size: int, **kwargs) -> dict:
+        """
+        Upload body or file as multipart upload with parts uploaded concurrently.
+
+        Upload is resumed from uploaded parts on transient failure of a part and aborted if it
+        still failed, upload left by failed abort is aborted by abort_multipart_uploads. Upload of
+        same size and part size left by crashed process is resumed from its journal.
+        :param bucket: Name of the bucket.
+        :param key: Name of the object.
+        :param size: Size of the body or file.
+        :keyword file_path: Path of the file.
+        :keyword body: Content of Object i.e. bytes or seekable file like object ex: ObjectBody.
+        :return: Response of the complete multipart upload.
+        """
+        part_size = self.get_part_size(size)
+        upload_info = {"Size": size, "PartSize": part_size}
+        upload_id = await self.get_journal_upload_id(bucket, key, upload_info)
+        if not upload_id:
+            upload_id = (await self.create_multipart_upload(bucket, key))["UploadId"]
+        try:
+            if kwargs.get("body") is not None:
+                parts = await self.resume_upload_parts(
+                    bucket,
+                    key,
+                    upload_id,
+                    partial(self.iter_body_parts, kwargs["body"], size, part_size),
+                    upload_info=upload_info,
+                )
+            else:
+                with open(kwargs["file_path"], "rb") as file_obj:
+                    parts = await self.resume_upload_parts(
+                        bucket,
+                        key,
+                        upload_id,
+                        partial(self.iter_body_parts, file_obj, size, part_size),
+                        upload_info=upload_info,
+                    )
+            response = await self.complete_multipart_upload(upload_id, parts, bucket, key)
+        except Exception:
+            try:
+                await self.abort_multipart_upload(bucket, key, upload_id)
+                await self.run_sync(MultipartJournal(bucket, key).remove)
+            except Exception as err:  # pylint: disable=broad-except
+                self.log.warning(
+                    "Failed to abort upload %s of s3://%s/%s: %s", upload_id, bucket, key, err
+                )
+            raise
+        self.log.info(
+            "upload_object s3://%s/%s, %s parts of %s bytes, Response: %s",
+            bucket,
+            key,
+            len(parts),
+            part_size,
+            response,
+        )
+
+        return response
+
+    @retries()
+    async def put_object(self, bucket: str, key: str, **kwargs) -> dict:
+        """
+        Upload object to the Bucket by put object, file_path or body is compulsory.
+
         :param bucket: Name of the bucket.
         :param key: Name of the object.
         :keyword file_path: Path of the file.
-        :keyword body: Content of Object
+        :keyword body: Content of Object i.e. bytes or file like object ex: ObjectBody.
         :return: Response of the upload s3 object.
         """
         self.s3_url = s3_url = f"s3://{bucket}/{key}"
         async with self.get_client() as s3client:
             body = kwargs.get("body", None)
             file_path = kwargs.get("file_path", None)
-            if body:
+            if body is not None:
+                if isinstance(body, io.IOBase) and body.seekable():
+                    # Rewind body on retry.
+                    body.seek(0)
                 response = await s3client.put_object(Body=body, Bucket=bucket, Key=key)
             elif file_path:
                 with open(file_path, "rb") as rb_obj:
@@ -66,6 +267,53 @@ class S3Object(S3RestApi):
 
         return response
 
+    async def upload_generated_object(self, bucket: str, key: str, size: int, **kwargs) -> dict:
+        """
+        Upload generated data and calculate its checksum in single pass.
+
+        Every chunk is generated once and fed to the hasher and the request body together, so the
+        data is not generated or read again to calculate checksum. Parts of multipart upload are
+        uploaded concurrently, so data is hashed in order off the event loop meanwhile.
+        :param bucket: Name of the bucket.
+        :param key: Name of the object.
+        :param size: Size of the object.
+        :keyword data_key: Key of the generated data, default is name of object.
+        :return: Response of the upload s3 object with checksum of the data as Checksum, checksum
+            is None in regenerate validation mode.
+        """
+        hasher = (
+            new_hash(self.hash_algorithm)
+            if self.validation_mode == CHECKSUM_VALIDATION
+            else None
+        )
+        data_key = kwargs.get("data_key") or key
+        if hasher and self.is_multipart_upload(size):
+            tasks = [
+                asyncio.ensure_future(
+                    self.upload_object(
+                        bucket, key, body=self.data_generator.get_body(data_key, size)
+                    )
+                ),
+                asyncio.ensure_future(self.get_data_checksum(data_key, size)),
+            ]
+            try:
+                response, checksum = await asyncio.gather(*tasks)
+            finally:
+                # Sibling of failed task is cancelled, its result or error is retrieved.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            response["Checksum"] = checksum
+        else:
+            body = self.data_generator.get_body(data_key, size, hasher=hasher)
+            response = await self.upload_object(bucket, key, body=body)
+            response["Checksum"] = body.hexdigest() if hasher else None
+        self.log.debug(
+            "upload_generated_object s3://%s/%s, %s: %s", bucket, key, self.hash_algorithm,
+            response["Checksum"],
+        )
+        return response
+
     @retries()
     async def list_objects(self, bucket: str) -> list:
         """
@@ -134,7 +382,6 @@ class S3Object(S3RestApi):
 
         return response
 
-    @retries()
     async def get_object(
         self, bucket: str, key: str, ranges: str = None, chunk_size: int = 0
     ) -> dict:
@@ -144,32 +391,39 @@ class S3Object(S3RestApi):
         :param bucket: Name of the bucket.
         :param key: Name of object.
         :param ranges: Byte range to be retrieved
-        :param chunk_size: get object in chunk sizes.
-        :return: response.
+        :param chunk_size: Not used, body is discarded as received. Kept for compatibility.
+        :return: response of get object, of complete object if read as parallel byte ranges.
+        """
+        if not ranges:
+            response = await self.head_parallel_read(bucket, key)
+            if response:
+                return await self.read_object_ranges(bucket, key, response["ContentLength"])
+        return await self.get_object_stream(bucket, key, ranges)
+
+    @retries()
+    async def get_object_stream(self, bucket: str, key: str, ranges: str = None) -> dict:
+        """
+        Get object or byte range of the object as single stream.
+
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :param ranges: Byte range to be retrieved
+        :return: response of get object.
         """
-        chunk_size = chunk_size if chunk_size else S3_CFG.chunk_size
         async with self.get_client() as s3client:
             self.s3_url = s3_url = f"s3://{bucket}/{key}"
             if ranges:
                 response = await s3client.get_object(Bucket=bucket, Key=key, Range=ranges)
-                async with response["Body"] as stream:
-                    chunk = await stream.read()
-                    self.log.debug("Reading length: %s", len(chunk))
             else:
-                self.log.info("Chunk size used %s", chunk_size)
                 response = await s3client.get_object(Bucket=bucket, Key=key)
-                async with response["Body"] as stream:
-                    chunk = await stream.read(chunk_size)
-                    content_length = len(chunk)
-                    while chunk:
-                        chunk = await stream.read(chunk_size)
-                        content_length += len(chunk)
-                    self.log.debug("Reading length: %s", content_length)
+            # Data is not used, so received chunks are discarded without copying them.
+            async with response["Body"] as stream:
+                content_length = await BodyReader(stream, response["ContentLength"]).discard()
+                self.log.debug("Reading length: %s", content_length)
             self.log.info("get_object %s Response: %s", s3_url, response)
 
         return response
 
-    @retries()
     async def download_object(
         self, bucket: str, key: str, file_path: str, chunk_size: int = 0
     ) -> dict:
@@ -179,21 +433,48 @@ class S3Object(S3RestApi):
         :param bucket: Name of the bucket.
         :param key: Name of object.
         :param file_path: Path of the file.
-        :param chunk_size: Download object in chunk sizes.
+        :param chunk_size: Download object in chunk sizes, default is adaptive chunk size.
+        :return: Response of download object, of complete object if read as parallel byte ranges.
+        """
+        response = await self.head_parallel_read(bucket, key)
+        if response:
+            with open(file_path, "wb+") as file_obj:
+                response = await self.read_object_ranges(
+                    bucket, key, response["ContentLength"], file_obj=file_obj
+                )
+            self.log.info("download_object s3://%s/%s Path: %s", bucket, key, file_path)
+            return response
+        return await self.download_object_stream(bucket, key, file_path, chunk_size)
+
+    @retries()
+    async def download_object_stream(
+        self, bucket: str, key: str, file_path: str, chunk_size: int = 0
+    ) -> dict:
+        """
+        Download Object as single stream.
+
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :param file_path: Path of the file.
+        :param chunk_size: Download object in chunk sizes, default is adaptive chunk size.
         :return: Response of download object.
         """
-        chunk_size = chunk_size if chunk_size else S3_CFG.chunk_size
-        self.log.info("Chunk size used %s", chunk_size)
         async with self.get_client() as s3client:
             self.s3_url = s3_url = f"s3://{bucket}/{key}"
             response = await s3client.get_object(Bucket=bucket, Key=key)
             self.log.info("download_object %s Response %s", s3_url, response)
+            chunk_size = self.get_chunk_size(chunk_size, response["ContentLength"])
+            self.log.info("Chunk size used %s", chunk_size)
             async with response["Body"] as stream:
-                chunk = await stream.read(chunk_size)
-                with open(file_path, "wb+") as file_obj:
-                    while len(chunk) > 0:
-                        file_obj.write(chunk)
-                        chunk = await stream.read(chunk_size)
+                reader = BodyReader(stream, response["ContentLength"])
+                start_time = time.perf_counter()
+                with BUFFER_POOL.get_buffers(chunk_size) as (buffer,):
+                    with open(file_path, "wb+") as file_obj:
+                        count = await reader.readinto(buffer)
+                        while count:
+                            file_obj.write(buffer[:count])
+                            count = await reader.readinto(buffer)
+                self.record_read(reader.amount_read, time.perf_counter() - start_time)
         if os.path.exists(file_path):
             self.log.info("download_object %s Path: %s Response %s", s3_url, file_path, response)
 
@@ -224,51 +505,285 @@ class S3Object(S3RestApi):
 
         return response
 
+    async def head_parallel_read(self, bucket: str, key: str, size: int = None) -> dict:
+        """
+        Get head of object if it is to be read as parallel byte ranges else None.
+
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :param size: Size of object if known, head object is not requested.
+        """
+        if self.ranges_in_flight <= 1 or (size is not None and size <= self.range_size):
+            return None
+        response = {"ContentLength": size} if size else await self.head_object(bucket, key)
+
+        return response if response["ContentLength"] > self.range_size else None
+
     @retries()
+    async def get_object_range_into(
+        self, bucket: str, key: str, start: int, buffer: memoryview
+    ) -> int:
+        """
+        Read byte range of object starting from start into buffer.
+
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :param start: Start of byte range, length of the range is length of buffer.
+        :param buffer: Buffer to be filled.
+        :return: Response of get object of the range without body.
+        """
+        async with self.get_client() as s3client:
+            ranges = f"bytes={start}-{start + len(buffer) - 1}"
+            response = await s3client.get_object(Bucket=bucket, Key=key, Range=ranges)
+            async with response.pop("Body") as stream:
+                count = await BodyReader(stream, response["ContentLength"]).readinto(buffer)
+        if count != len(buffer):
+            raise IncompleteReadError(actual_bytes=count, expected_bytes=len(buffer))
+
+        return response
+
+    async def read_object_ranges(self, bucket: str, key: str, size: int, **kwargs) -> str:
+        """
+        Read object as byte ranges of range size fetched concurrently, consumed in order.
+
+        Up to ranges_in_flight ranges are read at once, next range is started once the oldest
+        range is consumed. Consumed range is hashed off the event loop and its buffer is reused
+        after next range is hashed, so ranges_in_flight + 1 pooled buffers are used.
+        :param bucket: Name of the bucket.
+        :param key: Name of object.
+        :param size: Size of object.
+        :keyword file_obj: File to write data of object.
+        :keyword file_hash: ChunkHasher to hash data of object.
+        :return: Response of get object of first range as of complete object i.e. ContentLength
+            of object, without Body and ContentRange, with hex digest of file_hash as Checksum.
+        """
+        file_obj, file_hash = kwargs.get("file_obj"), kwargs.get("file_hash")
+        window = deque()
+        response = {}
+
+        async def consume_range() -> None:
+            buffer, task = window.popleft()
+            range_response = await task
+            if not response:
+                response.update(range_response)
+            if file_obj:
+                file_obj.write(buffer)
+            if file_hash:
+                await file_hash.update_async(buffer)
+
+        start_time = time.perf_counter()
+        with BUFFER_POOL.get_buffers(self.range_size, self.ranges_in_flight + 1) as buffers:
+            try:
+                for index, start in enumerate(range(0, size, self.range_size)):
+                    if len(window) == self.ranges_in_flight:
+                        await consume_range()
+                    buffer = buffers[index % len(buffers)][: min(self.range_size, size - start)]
+                    task = asyncio.ensure_future(
+                        self.get_object_range_into(bucket, key, start, buffer)
+                    )
+                    window.append((buffer, task))
+                while window:
+                    await consume_range()
+                digest = await file_hash.hexdigest_async() if file_hash else None
+            finally:
+                for _, task in window:
+                    task.cancel()
+                if window:
+                    await asyncio.wait([task for _, task in window])
+                if file_hash:
+                    # Buffers are released to the pool only after the submitted range is hashed.
+                    await file_hash.wait_async()
+        elapsed = time.perf_counter() - start_time
+        self.log.info(
+            "read_object_ranges s3://%s/%s, size: %s, ranges in flight: %s, %.3f MB/s",
+            bucket,
+            key,
+            size,
+            self.ranges_in_flight,
+            size / 1024**2 / elapsed if elapsed else 0,
+        )
+        response.pop("ContentRange", None)
+        response["ContentLength"] = size
+        response["Checksum"] = digest
+
+        return response
+
     async def get_s3object_checksum(
+        self, bucket: str, key: str, chunk_size: int = 0, ranges: str = None, size: int = None
+    ) -> str:
+        """
+        Read object in chunk and calculate checksum as per hash algorithm, default sha256.
+
+        Do not store the object in local storage. Object larger than range size is read as
+        parallel byte ranges if ranges_in_flight is more than one.
+        :param bucket: The name of the s3 bucket.
+        :param key: Name of object.
+        :param chunk_size: size to read the content of s3 object, default is adaptive chunk size.
+        :param ranges: number of bytes to be read
+        :param size: Size of object if known, to skip head object of parallel byte ranges read.
+        """
+        if not ranges:
+            response = await self.head_parallel_read(bucket, key, size)
+            if response:
+                response = await self.read_object_ranges(
+                    bucket,
+                    key,
+                    response["ContentLength"],
+                    file_hash=ChunkHasher(self.hash_algorithm),
+                )
+                return response["Checksum"]
+        return await self.get_s3object_stream_checksum(bucket, key, chunk_size, ranges)
+
+    @retries()
+    async def get_s3object_stream_checksum(
         self, bucket: str, key: str, chunk_size: int = 0, ranges: str = None
     ) -> str:
         """
-        Read object in chunk and calculate sha256.
+        Read object or byte range as single stream in chunk and calculate checksum.
 
-        Do not store the object in local storage.
         :param bucket: The name of the s3 bucket.
         :param key: Name of object.
-        :param chunk_size: size to read the content of s3 object.
+        :param chunk_size: size to read the content of s3 object, default is adaptive chunk size.
         :param ranges: number of bytes to be read
         """
-        chunk_size = chunk_size if chunk_size else S3_CFG.chunk_size
-        self.log.info("Chunk size used %s", chunk_size)
         async with self.get_client() as s3client:
             self.s3_url = s3_url = f"s3://{bucket}/{key}"
-            file_hash = hashlib.sha256()
+            # Chunk is hashed off the event loop while next chunk is read.
+            file_hash = ChunkHasher(self.hash_algorithm)
             if ranges:
                 response = await s3client.get_object(Bucket=bucket, Key=key, Range=ranges)
             else:
                 response = await s3client.get_object(Bucket=bucket, Key=key)
             self.log.info("get_s3object_checksum %s Response %s", s3_url, response)
+            chunk_size = self.get_chunk_size(chunk_size, response["ContentLength"])
+            self.log.info("Chunk size used %s", chunk_size)
             async with response["Body"] as stream:
-                chunk = await stream.read(chunk_size)
-                self.log.debug("Reading chunk length: %s", len(chunk))
-                while len(chunk) > 0:
-                    file_hash.update(chunk)
-                    chunk = await stream.read(chunk_size)
-            sha256_digest = file_hash.hexdigest()
-        self.log.debug("get_s3object_checksum %s, SHA-256: %s", s3_url, sha256_digest)
+                reader = BodyReader(stream, response["ContentLength"])
+                start_time = time.perf_counter()
+                # Chunk is read in one buffer while chunk in other buffer is being hashed.
+                with BUFFER_POOL.get_buffers(chunk_size, 2) as buffers:
+                    index = 0
+                    count = await reader.readinto(buffers[index])
+                    while count:
+                        await file_hash.update_async(buffers[index][:count])
+                        index ^= 1
+                        count = await reader.readinto(buffers[index])
+                    digest = await file_hash.hexdigest_async()
+                self.record_read(reader.amount_read, time.perf_counter() - start_time)
+        self.log.debug(
+            "get_s3object_checksum %s, %s: %s", s3_url, self.hash_algorithm, digest
+        )
+
+        return digest
+
+    async def get_data_checksum(self, key: str, size: int, offset: int = 0) -> str:
+        """
+        Get checksum of generated data of key, hashed off the event loop.
 
-        return sha256_digest
+        :param key: Key of the generated data.
+        :param size: Number of bytes.
+        :param offset: Starting offset.
+        """
+        file_hash = ChunkHasher(self.hash_algorithm)
+        for chunk in self.data_generator.iter_data(key, size, offset):
+            await file_hash.update_async(chunk)
+        return await file_hash.hexdigest_async()
+
+    @retries()
+    async def verify_s3object(
+        self, bucket: str, key: str, data_key: str = None, **kwargs
+    ) -> None:
+        """
+        Read object or byte range in chunk and compare it with regenerated data.
+
+        Expected data is regenerated chunk by chunk from data key at the same offset, so neither
+        uploaded data nor its checksum is kept and first corrupted offset is reported.
+        :param bucket: The name of the s3 bucket.
+        :param key: Name of object.
+        :param data_key: Key of the generated data, default is name of object.
+        :keyword size: Expected size of object or byte range.
+        :keyword ranges: Byte range to be read ex: bytes=0-99.
+        :keyword chunk_size: size to read the content of s3 object, default is adaptive chunk size.
+        """
+        ranges = kwargs.get("ranges")
+        offset = int(ranges.split("=")[1].split("-")[0]) if ranges else 0
+        async with self.get_client() as s3client:
+            self.s3_url = s3_url = f"s3://{bucket}/{key}"
+            if ranges:
+                response = await s3client.get_object(Bucket=bucket, Key=key, Range=ranges)
+            else:
+                response = await s3client.get_object(Bucket=bucket, Key=key)
+            self.log.info("verify_s3object %s Response %s", s3_url, response)
+            size = kwargs.get("size", response["ContentLength"])
+            if response["ContentLength"] != size:
+                raise AssertionError(
+                    f"Size of {s3_url} ({ranges}) does not match: expected {size}, "
+                    f"received {response['ContentLength']}."
+                )
+            expected = self.data_generator.get_body(data_key or key, offset + size)
+            expected.seek(offset)
+            chunk_size = self.get_chunk_size(kwargs.get("chunk_size"), size)
+            async with response["Body"] as stream:
+                reader = BodyReader(stream, response["ContentLength"])
+                start_time = time.perf_counter()
+                with BUFFER_POOL.get_buffers(chunk_size, 3) as (buffer, expected_buffer, diff):
+                    count = await reader.readinto(buffer)
+                    while count:
+                        expected.readinto(expected_buffer[:count])
+                        differs = np.not_equal(
+                            np.frombuffer(buffer[:count], dtype=np.uint8),
+                            np.frombuffer(expected_buffer[:count], dtype=np.uint8),
+                            out=np.frombuffer(diff[:count], dtype=np.bool_),
+                        )
+                        if differs.any():
+                            mismatch = int(differs.argmax())
+                            raise AssertionError(
+                                f"Data of {s3_url} does not match generated data at offset "
+                                f"{expected.tell() - count + mismatch}."
+                            )
+                        count = await reader.readinto(buffer)
+                self.record_read(reader.amount_read, time.perf_counter() - start_time)
+        self.log.debug("verify_s3object %s, %s bytes matched.", s3_url, size)
+
+    async def validate_s3object(self, bucket: str, key: str, size: int, **kwargs) -> None:
+        """
+        Validate data of object or byte range as per validation mode.
+
+        :param bucket: The name of the s3 bucket.
+        :param key: Name of object.
+        :param size: Size of object or byte range.
+        :keyword data_key: Key of the generated data, default is name of object.
+        :keyword offset: Start of byte range, complete object is validated if not given.
+        :keyword checksum: Checksum of uploaded data, generated from data key if not given.
+        """
+        data_key = kwargs.get("data_key") or key
+        offset = kwargs.get("offset")
+        ranges = f"bytes={offset}-{offset + size - 1}" if offset is not None else None
+        if self.validation_mode == REGENERATE_VALIDATION:
+            await self.verify_s3object(bucket, key, data_key, size=size, ranges=ranges)
+            return
+        checksum_in = kwargs.get("checksum") or await self.get_data_checksum(
+            data_key, size, offset or 0
+        )
+        checksum_out = await self.get_s3object_checksum(bucket, key, ranges=ranges, size=size)
+        if checksum_in != checksum_out:
+            raise AssertionError(
+                f"Checksum of s3://{bucket}/{key} ({ranges}) does not match: "
+                f"checksum_in: {checksum_in}, checksum_out: {checksum_out}."
+            )
 
     def checksum_file(self, file_path: str, chunk_size: int = 0):
         """
         Calculate checksum of given file_path by reading file chunk_size at a time.
 
+        Chunk is hashed on hash thread pool while next chunk is read.
         :param file_path: Local file path
         :param chunk_size: single chunk size to read the content of given file
         """
         chunk_size = chunk_size if chunk_size else S3_CFG.chunk_size
         self.log.info("Chunk size used %s", chunk_size)
         with open(file_path, "rb") as f_obj:
-            file_hash = hashlib.sha256()
+            file_hash = ChunkHasher(self.hash_algorithm)
             chunk = f_obj.read(chunk_size)
             self.log.debug("Reading chunk length: %s", len(chunk))
             while len(chunk) > 0:
@@ -281,7 +796,8 @@ class S3Object(S3RestApi):
         """
         Calculate checksum of read_size bytes starting from offset in given file_path.
 
-        Uses chunk_size=1MB if read_size > 1MB
+        Uses chunk_size=1MB if read_size > 1MB, chunk is hashed on hash thread pool while next
+        chunk is read.
         :param: file_path: File location
         :param: offset: Offset to start reading from
         :param: read_size: Size in bytes to read from offset
@@ -293,7 +809,7 @@ class S3Object(S3RestApi):
             raise IOError(f"{offset + read_size} is less than file size {file_size} ")
         chunk_size = read_size if read_size < chunk_size else chunk_size
         self.log.info("Chunk size used %s", chunk_size)
-        file_hash = hashlib.sha256()
+        file_hash = ChunkHasher(self.hash_algorithm)
         read_length = read_size
         with open(file_path, "rb") as f_obj:
             f_obj.seek(offset)
@@ -310,29 +826,43 @@ class S3Object(S3RestApi):
 
         return file_hash.hexdigest()
 
-    @retries(asyncio=False)
-    def delete_s3_objects(self, bucket_name, object_prefix=None):
+    async def delete_prefix_objects(
+        self, bucket: str, object_prefix: str = None, **kwargs
+    ) -> dict:
         """
         Delete all s3 objects based on prefix if given.
 
+        Listing pages are streamed into delete objects batches with bounded batches in flight,
+        keys failed to delete are reported.
+        :param bucket: Name of the s3 bucket.
+        :param object_prefix: prefix of s3 object to be deleted.
+        :keyword batch_size: Keys per delete objects request up to 1000, default is of s3 config.
+        :keyword batches_in_flight: Maximum batches deleted at once, default is of s3 config.
+        :return: Number of deleted objects and errors of the keys failed to delete.
+        """
+        self.s3_url = f"s3://{bucket}"
+        return await self.delete_keys(
+            bucket,
+            self.iter_key_pages(bucket, object_prefix or ""),
+            kwargs.get("batch_size", 0),
+            kwargs.get("batches_in_flight", 0),
+            operation="delete_s3_objects",
+        )
+
+    def delete_s3_objects(self, bucket_name, object_prefix=None, **kwargs):
+        """
+        Delete all s3 objects based on prefix if given from sync callers.
+
+        Runs delete_prefix_objects in its own event loop.
         :param bucket_name: Name of the s3 bucket.
         :param object_prefix: prefix of s3 object to be deleted.
+        :return: Number of deleted objects and errors of the keys failed to delete.
         """
-        self.s3_url = s3_url = f"s3://{bucket_name}"
-        s3_resource = self.get_boto3_resource().Bucket(bucket_name)
-        if object_prefix:
-            objects = s3_resource.objects.filter(Prefix=object_prefix)
-            objects_to_delete = [{"Key": o.key} for o in objects if o.key.startswith(object_prefix)]
-            response = s3_resource.meta.client.delete_objects(
-                Bucket=bucket_name, Delete={"Objects": objects_to_delete}
-            )
-            self.log.info(
-                "deleted all s3 object with prefix '%s' from '%s', response: %s",
-                object_prefix,
-                s3_url,
-                response,
-            )
-        else:
-            response = s3_resource.objects.all().delete()
-            self.log.info("deleted all s3 object from %s, response: %s", s3_url, response)
-        return response
+        return run_event_loop_until_complete(
+            self.log,
+            self.run_and_close_clients,
+            self.delete_prefix_objects,
+            bucket_name,
+            object_prefix,
+            **kwargs,
+        )
@@ -17,19 +17,12 @@
 #
 """Object crud operations in parallel for io stability workload using aiobotocore."""
 
-import os
 from time import perf_counter_ns
 
-import nest_asyncio
-
 from src.commons.utils import corio_utils
-from src.commons.utils.asyncio_utils import (
-    schedule_tasks,
-    run_event_loop_until_complete,
-)
+from src.commons.utils.asyncio_utils import schedule_tasks
 from src.libs.s3api import S3Api
-
-nest_asyncio.apply()
+from src.libs.s3api.s3_object_ops import CHECKSUM_VALIDATION
 
 
 class S3ApiParallelIO(S3Api):
@@ -95,12 +88,14 @@ class S3ApiParallelIO(S3Api):
             if self.io_ops_dict[bucket_name][key][
                 "key_size"
             ] == object_size and key.startswith(object_prefix):
-                checksum_in = self.io_ops_dict[bucket_name][key]["key_checksum"]
                 if validate:
-                    if checksum_in != await self.get_s3object_checksum(
-                        bucket_name, key
-                    ):
-                        raise AssertionError("Checksum are not equal.")
+                    await self.validate_s3object(
+                        bucket_name,
+                        key,
+                        object_size,
+                        data_key=self.io_ops_dict[bucket_name][key]["data_key"],
+                        checksum=self.io_ops_dict[bucket_name][key]["key_checksum"],
+                    )
                 else:
                     await self.get_object(bucket_name, key)
                 if key not in self.read_files[bucket_name]["keys"]:
@@ -193,13 +188,14 @@ class S3ApiParallelIO(S3Api):
                 key.startswith(object_prefix)
                 and self.io_ops_dict[bucket_name][key]["key_size"] == object_size
             ):
-                checksum_in = self.io_ops_dict[bucket_name][key]["key_checksum"]
-                checksum_dwn = await self.get_s3object_checksum(bucket_name, key)
-                assert checksum_in == checksum_dwn, (
-                    f"Checksum are not equal for {key}: checksum_in: {checksum_in}, "
-                    f"checksum_down: {checksum_dwn}."
+                await self.validate_s3object(
+                    bucket_name,
+                    key,
+                    object_size,
+                    data_key=self.io_ops_dict[bucket_name][key]["data_key"],
+                    checksum=self.io_ops_dict[bucket_name][key]["key_checksum"],
                 )
-                self.log.info("Check sum matched for object %s", key)
+                self.log.info("Data matched for object %s", key)
                 if key not in self.validated_files[bucket_name]["keys"]:
                     self.validated_files[bucket_name]["keys"].append(key)
 
@@ -243,25 +239,30 @@ class S3ApiParallelIO(S3Api):
         :param sessions: total number of sessions(samples) used to upload samples.
         """
         self.log.info("Writing data...")
+        # Data of all the samples is generated in memory from same data key.
         file_name = f"{object_prefix}-{perf_counter_ns()}"
-        file_path = corio_utils.create_file(file_name, object_size)
         self.log.info(
             "Object: '%s', object size: %s, Number of samples: %s",
             object_prefix,
             corio_utils.convert_size(object_size),
             sessions,
         )
-        checksum_in = self.checksum_file(file_path)
-        self.log.debug("Checksum of '%s' = %s", file_name, checksum_in)
+        # Data is regenerated to validate it in regenerate mode, checksum is not needed.
+        checksum_in = None
+        if self.validation_mode == CHECKSUM_VALIDATION:
+            checksum_in = await self.get_data_checksum(file_name, object_size)
+            self.log.debug("Checksum of '%s' = %s", file_name, checksum_in)
         kcnt = (
             len(self.io_ops_dict[bucket_name]) if bucket_name in self.io_ops_dict else 0
         ) + 1
 
         async def upload_s3object(**kwargs):
             """Upload s3 object."""
-            key = f"{object_prefix}-{perf_counter_ns()}-{checksum_in}-{kwargs.get('cntr')}"
+            key = f"{object_prefix}-{perf_counter_ns()}-{checksum_in or ''}-{kwargs.get('cntr')}"
             self.s3_url = s3_url = f"s3://{bucket_name}/{key}"
-            response = await self.upload_object(bucket_name, key, file_path=file_path)
+            response = await self.upload_object(
+                bucket_name, key, body=self.data_generator.get_body(file_name, object_size)
+            )
             self.log.info("Uploading s3 object: url: %s", s3_url)
             if bucket_name not in self.io_ops_dict:
                 self.io_ops_dict[bucket_name] = {
@@ -269,6 +270,7 @@ class S3ApiParallelIO(S3Api):
                         "s3url": s3_url,
                         "key_size": object_size,
                         "key_checksum": checksum_in,
+                        "data_key": file_name,
                         "bucket": bucket_name,
                         "key": key,
                         "etag": response["ETag"],
@@ -279,6 +281,7 @@ class S3ApiParallelIO(S3Api):
                     "s3url": s3_url,
                     "key_size": object_size,
                     "key_checksum": checksum_in,
+                    "data_key": file_name,
                     "bucket": bucket_name,
                     "key": key,
                     "etag": response["ETag"],
@@ -286,13 +289,12 @@ class S3ApiParallelIO(S3Api):
             self.log.info("s3://%s/%s uploaded successfully.", bucket_name, key)
 
         self.log.info(
-            "Scheduling to upload file %s, size %s, for samples %s ",
+            "Scheduling to upload object %s, size %s, for samples %s ",
             object_prefix,
-            file_path,
+            object_size,
             sessions,
         )
         await self.schedule_api_sessions(sessions, upload_s3object, cntr=kcnt)
-        os.remove(file_path)
 
     @staticmethod
     def get_session_distributions(samples, sessions):
@@ -317,25 +319,15 @@ class S3ApiParallelIO(S3Api):
             await schedule_tasks(self.log, tasks)
             self.log.info("completed tasks: %s.", tasks)
 
-    def create_sessions(self, func, *args, **kwargs):
-        """
-        Start workload execution.
-
-        :param func: Name of the function.
-        """
-        self.log.info("Execution started for %s", func.__name__)
-        run_event_loop_until_complete(self.log, func, *args, **kwargs)
-        self.log.info("Execution completed for %s", func.__name__)
-
-    def get_s3bucket(self, operations: str, bucket_name: str, obj_size: int):
+    async def get_s3bucket(self, operations: str, bucket_name: str, obj_size: int):
         """Get/Create the s3 io bucket."""
         buckets = [
             bkt
-            for bkt in self.list_s3_buckets()
+            for bkt in await self.list_buckets()
             if (bucket_name == bkt or bkt.startswith(f"iobkt-size{obj_size}-samples"))
         ]
         if operations == "write" and not buckets:
-            self.create_s3_bucket(bucket_name)
+            await self.create_bucket(bucket_name)
         else:
             if not buckets:
                 raise AssertionError(f"Bucket does not exists: {bucket_name}")
@@ -343,7 +335,7 @@ class S3ApiParallelIO(S3Api):
         return bucket_name
 
     # pylint: disable=too-many-branches, too-many-nested-blocks
-    def execute_workload(self, operations, sessions=1, **kwargs):
+    async def execute_workload(self, operations, sessions=1, **kwargs):
         """
         Execute s3 workload distribution.
 
@@ -365,10 +357,11 @@ class S3ApiParallelIO(S3Api):
                 )
                 object_prefix = kwargs.get("object_prefix", f"object-{obj_size}")
                 if operations == "write":
-                    bucket_name = self.get_s3bucket(operations, bucket_name, obj_size)
+                    bucket_name = await self.get_s3bucket(
+                        operations, bucket_name, obj_size
+                    )
                     for clients in self.get_session_distributions(num_sample, sessions):
-                        self.create_sessions(
-                            self.write_data,
+                        await self.write_data(
                             bucket_name=bucket_name,
                             object_size=obj_size,
                             object_prefix=object_prefix,
@@ -376,10 +369,11 @@ class S3ApiParallelIO(S3Api):
                         )
                 if operations == "read":
                     validate = kwargs.get("validate", False)
-                    bucket_name = self.get_s3bucket(operations, bucket_name, obj_size)
+                    bucket_name = await self.get_s3bucket(
+                        operations, bucket_name, obj_size
+                    )
                     for clients in self.get_session_distributions(num_sample, sessions):
-                        self.create_sessions(
-                            self.read_data,
+                        await self.read_data(
                             bucket_name=bucket_name,
                             object_size=obj_size,
                             object_prefix=object_prefix,
@@ -387,20 +381,22 @@ class S3ApiParallelIO(S3Api):
                             validate=validate,
                         )
                 if operations == "validate":
-                    bucket_name = self.get_s3bucket(operations, bucket_name, obj_size)
+                    bucket_name = await self.get_s3bucket(
+                        operations, bucket_name, obj_size
+                    )
                     for clients in self.get_session_distributions(num_sample, sessions):
-                        self.create_sessions(
-                            self.validate_data,
+                        await self.validate_data(
                             bucket_name=bucket_name,
                             object_size=obj_size,
                             object_prefix=object_prefix,
                             sessions=clients,
                         )
                 if operations == "delete":
-                    bucket_name = self.get_s3bucket(operations, bucket_name, obj_size)
+                    bucket_name = await self.get_s3bucket(
+                        operations, bucket_name, obj_size
+                    )
                     for clients in self.get_session_distributions(num_sample, sessions):
-                        self.create_sessions(
-                            self.delete_data,
+                        await self.delete_data(
                             bucket_name=bucket_name,
                             object_size=obj_size,
                             object_prefix=object_prefix,
@@ -418,4 +414,4 @@ class S3ApiParallelIO(S3Api):
             for clients in self.get_session_distributions(
                 len(self.io_ops_dict), sessions
             ):
-                self.create_sessions(self.cleanup_data, sessions=clients)
+                await self.cleanup_data(sessions=clients)
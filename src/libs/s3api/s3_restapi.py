@@ -21,8 +21,13 @@
 
 """RestAPI library using aiobotocore module."""
 
+import asyncio
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
 
 import boto3
 import urllib3
@@ -32,9 +37,25 @@ from botocore.config import Config
 
 from config import S3_CFG
 from src.commons.logger import get_logger
+from src.libs.s3api.circuit_breaker import get_circuit_breaker
+from src.libs.s3api.connection_pool import CONNECTION_POOL
+from src.libs.s3api.endpoint_balancer import get_endpoint_balancer
+from src.libs.s3api.http_connector import get_connector_args
+from src.libs.s3api.http_connector import register_connection_handlers
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Bounded thread pool and process wide boto3 clients used by sync s3 apis.
+SYNC_EXECUTOR = ThreadPoolExecutor(
+    max_workers=S3_CFG.get("sync_api_workers", 8), thread_name_prefix="s3sync"
+)
+BOTO3_CLIENTS = {}
+BOTO3_CLIENTS_LOCK = threading.Lock()
+
+# Payload signing modes of the request body i.e. upload_object, upload_part.
+SIGNED_PAYLOAD = "signed"
+UNSIGNED_PAYLOAD = "unsigned"
+
 
 # pylint: disable=too-many-instance-attributes
 class S3RestApi:
@@ -49,9 +70,12 @@ class S3RestApi:
         :param access_key: access key.
         :param secret_key: secret key.
         :param endpoint_url: endpoint url.
+        :param endpoints: endpoint urls used for load balancing of asyncio operations.
         :param s3_cert_path: s3 certificate path.
         :param region: region.
         :param aws_session_token: aws_session_token.
+        :param max_pool_connections: Maximum number of connections kept in client pool.
+        :param payload_signing: signed(SHA256 of body is signed) or unsigned(UNSIGNED-PAYLOAD).
         :param debug: debug mode.
         """
         self.access_key = access_key
@@ -60,6 +84,26 @@ class S3RestApi:
         self.aws_session_token = kwargs.get("aws_session_token", None)
         self.use_ssl = kwargs.get("use_ssl", S3_CFG.use_ssl)
         self.endpoint_url = kwargs.get("endpoint_url", S3_CFG.endpoint)
+        # All configured endpoints are used for load balancing if endpoint_url is one of them.
+        self.endpoints = kwargs.get("endpoints") or (
+            S3_CFG.endpoints if self.endpoint_url in S3_CFG.endpoints else [self.endpoint_url]
+        )
+        self.balancer = get_endpoint_balancer(self.endpoints)
+        self.max_pool_connections = kwargs.get(
+            "max_pool_connections", S3_CFG.max_pool_connections
+        )
+        self.payload_signing = kwargs.get(
+            "payload_signing", S3_CFG.get("payload_signing", SIGNED_PAYLOAD)
+        )
+        if self.payload_signing not in (SIGNED_PAYLOAD, UNSIGNED_PAYLOAD):
+            raise ValueError(f"Unsupported payload signing: {self.payload_signing}")
+        # Unsigned payload skips client side SHA256 of the request body, even over http.
+        self.s3_config = (
+            {"payload_signing_enabled": False}
+            if self.payload_signing == UNSIGNED_PAYLOAD
+            else None
+        )
+        self.session = get_session()
         self.log = get_logger(os.getenv("log_level") or logging.INFO, kwargs.get("test_id"))
         self.log_path = next(
             iter(
@@ -71,26 +115,113 @@ class S3RestApi:
             )
         )
 
-    def get_client(self, service_name="s3"):
+    def create_client(self, service_name="s3", endpoint_url=None):
         """Create s3 client session for asyncio operations."""
-        session = get_session()
-        return session.create_client(
+        return self.session.create_client(
             service_name=service_name,
             use_ssl=self.use_ssl,
             verify=False,
             aws_access_key_id=self.access_key,
             aws_secret_access_key=self.secret_key,
-            endpoint_url=self.endpoint_url,
+            endpoint_url=endpoint_url or self.endpoint_url,
             region_name=self.region,
             aws_session_token=self.aws_session_token,
             config=AioConfig(
                 connect_timeout=S3_CFG.connect_timeout,
                 read_timeout=S3_CFG.read_timeout,
                 retries={"max_attempts": S3_CFG.s3api_retry},
+                max_pool_connections=self.max_pool_connections,
+                s3=self.s3_config,
+                connector_args=get_connector_args(),
             ),
         )
 
+    async def open_client(self, service_name="s3", endpoint_url=None):
+        """
+        Create and open s3 client for asyncio operations with tuned aiohttp connector.
+
+        Connector is tuned by connector args of the client config and connection event handlers.
+        Client is closed by connection pool.
+        :param service_name: Name of the service.
+        :param endpoint_url: endpoint url.
+        """
+        client = await self.create_client(service_name, endpoint_url).__aenter__()
+        register_connection_handlers(client)
+        return client
+
+    @asynccontextmanager
+    async def get_client(self, service_name="s3"):
+        """
+        Get s3 client from process wide connection pool for asyncio operations.
+
+        Client is created once per event loop, service, credentials and endpoint, then shared by
+        all the sessions of the process so that connections are kept alive instead of new TCP/TLS
+        handshake per request. Endpoint is selected per request by endpoint balancer and its
+        connection slot is held till context exits. Endpoints with open circuit breaker are
+        skipped, request fails fast with CircuitBreakerOpenError if no endpoint is available.
+        :param service_name: Name of the service.
+        """
+        endpoint = self.balancer.get_endpoint(
+            exclude=[ept for ept in self.endpoints if get_circuit_breaker(ept).is_open()]
+        )
+        breaker = get_circuit_breaker(endpoint)
+        probe = breaker.before_request()
+        error = None
+        try:
+            async with CONNECTION_POOL.acquire(endpoint):
+                client = await CONNECTION_POOL.get_client(
+                    (service_name, self.access_key, self.secret_key, self.aws_session_token,
+                     self.payload_signing, endpoint),
+                    partial(self.open_client, service_name, endpoint),
+                )
+                start_time = self.balancer.start_request(endpoint)
+                try:
+                    yield client
+                except BaseException as err:
+                    error = err
+                    raise
+                finally:
+                    self.balancer.end_request(endpoint, start_time, error)
+        finally:
+            breaker.after_request(error, probe)
+
+    @staticmethod
+    async def close_clients() -> None:
+        """Close all pooled clients created in the running event loop."""
+        await CONNECTION_POOL.close()
+
+    async def run_and_close_clients(self, func, *args, **kwargs):
+        """Run coroutine function and close the clients cached by it on completion."""
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            await self.close_clients()
+
+    async def run_sync(self, func, *args, **kwargs):
+        """
+        Run sync s3 api on bounded thread pool without blocking the event loop.
+
+        :param func: Sync function ex: self.create_s3_bucket.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            SYNC_EXECUTOR, partial(func, *args, **kwargs)
+        )
+
     def get_boto3_client(self, service_name="s3"):
+        """
+        Get cached s3 client for without asyncio operations.
+
+        boto3 clients are thread safe, so client is created once per service, credentials and
+        endpoint and shared by all the threads of the process.
+        """
+        key = (service_name, self.access_key, self.secret_key, self.aws_session_token,
+               self.payload_signing, self.endpoint_url)
+        with BOTO3_CLIENTS_LOCK:
+            if key not in BOTO3_CLIENTS:
+                BOTO3_CLIENTS[key] = self.create_boto3_client(service_name)
+            return BOTO3_CLIENTS[key]
+
+    def create_boto3_client(self, service_name="s3"):
         """Create s3 client for without asyncio operations."""
         return boto3.client(
             service_name=service_name,
@@ -105,6 +236,8 @@ class S3RestApi:
                 connect_timeout=S3_CFG.connect_timeout,
                 read_timeout=S3_CFG.read_timeout,
                 retries={"max_attempts": S3_CFG.s3api_retry},
+                max_pool_connections=self.max_pool_connections,
+                s3=self.s3_config,
             ),
         )
 
@@ -123,6 +256,8 @@ class S3RestApi:
                 connect_timeout=S3_CFG.connect_timeout,
                 read_timeout=S3_CFG.read_timeout,
                 retries={"max_attempts": S3_CFG.s3api_retry},
+                max_pool_connections=self.max_pool_connections,
+                s3=self.s3_config,
             ),
         )
 
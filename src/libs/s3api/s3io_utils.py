@@ -25,7 +25,6 @@ from random import shuffle
 from time import perf_counter_ns
 from typing import Union
 
-from src.commons.utils import corio_utils
 from src.commons.utils.asyncio_utils import run_event_loop_until_complete
 from src.commons.utils.asyncio_utils import schedule_tasks
 from src.libs.s3api import S3Api
@@ -185,7 +184,7 @@ class S3ApiIOUtils(S3Api):
     def starts_sessions(self, func, *args, **kwargs) -> None:
         """Start workload execution on s3 bucket as per distribution data."""
         self.log.info("Execution started for %s", func.__name__)
-        run_event_loop_until_complete(self.log, func, *args, **kwargs)
+        run_event_loop_until_complete(self.log, self.run_and_close_clients, func, *args, **kwargs)
         self.log.info("Execution completed for %s", func.__name__)
 
     def get_object_size(self, object_size: Union[list, dict, int]) -> int:
@@ -209,19 +208,16 @@ class S3ApiIOUtils(S3Api):
             for _ in range(object_count):
                 file_size = self.get_object_size(objsize)
                 file_name = f"s3object-{file_size}bytes-{perf_counter_ns()}"
-                file_path = corio_utils.create_file(file_name, file_size)
-                checksum_in = self.checksum_file(file_path)
                 self.s3_url = f"s3://{bucket_name}/{file_name}"
-                response = await self.upload_object(bucket_name, key=file_name, file_path=file_path)
+                response = await self.upload_generated_object(bucket_name, file_name, file_size)
                 data["files"][file_name] = {
                     "s3url": self.s3_url,
                     "key_size": file_size,
-                    "key_checksum": checksum_in,
+                    "key_checksum": response["Checksum"],
                     "bucket": bucket_name,
                     "key": file_name,
                     "etag": response["ETag"],
                 }
-                self.remove_file(file_path)
 
         for _, values in distribution.items():
             for value in values:
@@ -309,15 +305,12 @@ class S3ApiIOUtils(S3Api):
             for _ in range(object_count):
                 file_size = self.get_object_size(objsize)
                 file_name = f"s3object-{file_size}bytes-{perf_counter_ns()}"
-                file_path = corio_utils.create_file(file_name, file_size)
-                checksum_in = self.checksum_file(file_path)
                 self.s3_url = f"s3://{bucket_name}/{file_name}"
-                response = await self.upload_object(bucket_name, key=file_name, file_path=file_path)
-                self.remove_file(file_path)
+                response = await self.upload_generated_object(bucket_name, file_name, file_size)
                 data["files"][file_name] = {
                     "s3url": self.s3_url,
                     "key_size": file_size,
-                    "key_checksum": checksum_in,
+                    "key_checksum": response["Checksum"],
                     "bucket": bucket_name,
                     "key": file_name,
                     "etag": response["ETag"],
@@ -366,15 +359,17 @@ class S3ApiIOUtils(S3Api):
             for _ in range(object_count):
                 file_name = random.choice(data["files"])  # nosec
                 file_size = self.get_object_size(objsize)
-                file_path = corio_utils.create_file(file_name, file_size)
-                checksum_in = self.checksum_file(file_path)
+                # Overwritten object gets new data i.e. data key differs from the object key.
+                data_key = f"{file_name}-{perf_counter_ns()}"
                 self.s3_url = f"s3://{bucket_name}/{file_name}"
-                response = await self.upload_object(bucket_name, key=file_name, file_path=file_path)
-                self.remove_file(file_path)
+                response = await self.upload_generated_object(
+                    bucket_name, file_name, file_size, data_key=data_key
+                )
                 data["files"][file_name] = {
                     "s3url": self.s3_url,
                     "key_size": file_size,
-                    "key_checksum": checksum_in,
+                    "key_checksum": response["Checksum"],
+                    "data_key": data_key,
                     "bucket": bucket_name,
                     "key": file_name,
                     "etag": response["ETag"],
@@ -20,3 +20,18 @@
 #
 
 """Unit tests package."""
+
+# Arguments of corio.py, config parses them while units using config are imported.
+CORIO_ARGS = [
+    "corio.py",
+    "-ti",
+    "workload",
+    "-sk",
+    "secret",
+    "-ak",
+    "access",
+    "-ep",
+    "localhost:9000",
+    "-us",
+    "False",
+]
@@ -0,0 +1,135 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for body reader and buffer pool."""
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+from botocore.exceptions import IncompleteReadError
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.libs.s3api.body_reader import BodyReader
+    from src.libs.s3api.body_reader import BufferPool
+
+
+class FakeStream:
+    """Body stream returning given chunks as received."""
+
+    def __init__(self, chunks: list):
+        """Initialize stream with chunks."""
+        self.chunks = list(chunks)
+
+    async def readany(self) -> bytes:
+        """Get next received chunk, empty at end of stream."""
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+class TestBodyReader(unittest.TestCase):
+    """Tests suite for BodyReader and BufferPool."""
+
+    def test_readinto(self):
+        """Test buffers are filled across received chunks."""
+        reader = BodyReader(FakeStream([b"abc", b"defgh", b"ij"]), content_length=10)
+        buffer = memoryview(bytearray(4))
+
+        async def read_all() -> list:
+            data = []
+            while True:
+                count = await reader.readinto(buffer)
+                if not count:
+                    return data
+                data.append(bytes(buffer[:count]))
+
+        self.assertEqual(asyncio.run(read_all()), [b"abcd", b"efgh", b"ij"])
+        self.assertEqual(reader.amount_read, 10)
+
+    def test_discard(self):
+        """Test remaining body is counted after partial read."""
+        reader = BodyReader(FakeStream([b"abc", b"defgh"]), content_length=8)
+
+        async def discard() -> int:
+            await reader.readinto(memoryview(bytearray(2)))
+            return await reader.discard()
+
+        self.assertEqual(asyncio.run(discard()), 6)
+
+    def test_incomplete_body(self):
+        """Test body shorter than content length is reported as incomplete read."""
+        reader = BodyReader(FakeStream([b"abc"]), content_length=10)
+        with self.assertRaises(IncompleteReadError):
+            asyncio.run(reader.discard())
+
+    def test_unknown_length(self):
+        """Test body of unknown length is read till end of stream."""
+        reader = BodyReader(FakeStream([b"abc", b"de"]))
+        self.assertEqual(asyncio.run(reader.discard()), 5)
+
+    def test_buffers_reused(self):
+        """Test buffers returned to pool are reused by next session of same size."""
+        pool = BufferPool()
+        with pool.get_buffers(16, 2) as buffers:
+            first = [buffer.obj for buffer in buffers]
+            self.assertEqual([len(buffer) for buffer in buffers], [16, 16])
+        with pool.get_buffers(16, 2) as buffers:
+            self.assertEqual({id(buffer.obj) for buffer in buffers}, {id(obj) for obj in first})
+            with pool.get_buffers(16) as others:
+                self.assertNotIn(id(others[0].obj), {id(obj) for obj in first})
+        with pool.get_buffers(32) as buffers:
+            self.assertEqual(len(buffers[0]), 32)
+
+    def test_size_classes(self):
+        """Test sizes are rounded up to power of two class and views are of requested size."""
+        pool = BufferPool()
+        with pool.get_buffers(100) as (buffer,):
+            self.assertEqual((len(buffer), len(buffer.obj)), (100, 128))
+            first = buffer.obj
+        with pool.get_buffers(120) as (buffer,):
+            self.assertIs(buffer.obj, first)
+            self.assertEqual(len(buffer), 120)
+        self.assertEqual(list(pool.free), [128])
+
+    def test_free_buffers_capped(self):
+        """Test free buffers are capped per size class and in total bytes."""
+        pool = BufferPool(max_buffer_size=1024, max_free_buffers=2, max_free_bytes=1536)
+        with pool.get_buffers(1024, 3):
+            pass
+        self.assertEqual((len(pool.free[1024]), pool.free_bytes), (1, 1024))
+        with pool.get_buffers(256, 3):
+            pass
+        self.assertEqual((len(pool.free[256]), pool.free_bytes), (2, 1536))
+        with pool.get_buffers(512, 2):
+            pass
+        self.assertEqual((len(pool.free[512]), pool.free_bytes), (0, 1536))
+
+    def test_large_buffers_not_pooled(self):
+        """Test buffers larger than max buffer size are allocated of exact size and released."""
+        pool = BufferPool(max_buffer_size=1024)
+        with pool.get_buffers(1500) as (buffer,):
+            self.assertEqual(len(buffer.obj), 1500)
+        self.assertEqual((pool.free, pool.free_bytes), ({}, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for circuit breaker."""
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.commons.exception import CircuitBreakerOpenError
+    from src.libs.s3api.circuit_breaker import CLOSED
+    from src.libs.s3api.circuit_breaker import CircuitBreaker
+    from src.libs.s3api.circuit_breaker import HALF_OPEN
+    from src.libs.s3api.circuit_breaker import OPEN
+
+ENDPOINT = "http://s3-0"
+SERVER_ERROR = ConnectionError("reset")
+
+
+class LegacyCancelledError(asyncio.CancelledError, Exception):
+    """CancelledError as of python 3.7 i.e. subclass of Exception."""
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Tests suite for CircuitBreaker."""
+
+    @staticmethod
+    def open_breaker(reset_timeout: float) -> CircuitBreaker:
+        """Get breaker opened by consecutive server failures."""
+        breaker = CircuitBreaker(ENDPOINT, failure_threshold=2, reset_timeout=reset_timeout)
+        for _ in range(2):
+            breaker.after_request(SERVER_ERROR, breaker.before_request())
+        return breaker
+
+    def test_open_on_consecutive_failures(self):
+        """Test breaker opens after failure_threshold failures and rejects requests."""
+        breaker = CircuitBreaker(ENDPOINT, failure_threshold=2, reset_timeout=60)
+        breaker.after_request(SERVER_ERROR, breaker.before_request())
+        self.assertEqual(breaker.state, CLOSED)
+        breaker.after_request(SERVER_ERROR, breaker.before_request())
+        self.assertEqual(breaker.state, OPEN)
+        with self.assertRaises(CircuitBreakerOpenError):
+            breaker.before_request()
+        self.assertEqual(breaker.stats["opened"], 1)
+        self.assertEqual(breaker.stats["rejected"], 1)
+
+    def test_success_resets_failures(self):
+        """Test successful request resets consecutive failures."""
+        breaker = CircuitBreaker(ENDPOINT, failure_threshold=2)
+        breaker.after_request(SERVER_ERROR, breaker.before_request())
+        breaker.after_request(None, breaker.before_request())
+        breaker.after_request(SERVER_ERROR, breaker.before_request())
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_client_errors_ignored(self):
+        """Test 4xx errors do not open breaker."""
+        breaker = CircuitBreaker(ENDPOINT, failure_threshold=1)
+        error = ClientError(
+            {"Error": {"Code": "NoSuchKey"}, "ResponseMetadata": {"HTTPStatusCode": 404}},
+            "GetObject",
+        )
+        for _ in range(3):
+            breaker.after_request(error, breaker.before_request())
+        self.assertEqual(breaker.state, CLOSED)
+
+    def test_single_probe_when_half_open(self):
+        """Test only one probe is allowed after reset timeout and its success closes breaker."""
+        breaker = self.open_breaker(reset_timeout=0)
+        self.assertTrue(breaker.before_request())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        with self.assertRaises(CircuitBreakerOpenError):
+            breaker.before_request()
+        breaker.after_request(None, probe=True)
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertFalse(breaker.before_request())
+
+    def test_probe_failure_reopens(self):
+        """Test failed probe opens breaker again."""
+        breaker = self.open_breaker(reset_timeout=60)
+        breaker.reset_timeout = 0
+        probe = breaker.before_request()
+        breaker.reset_timeout = 60
+        breaker.after_request(SERVER_ERROR, probe)
+        self.assertEqual(breaker.state, OPEN)
+        self.assertEqual(breaker.stats["opened"], 2)
+        with self.assertRaises(CircuitBreakerOpenError):
+            breaker.before_request()
+
+    def test_stale_request_result_ignored(self):
+        """Test result of request started before opening does not change half open breaker."""
+        breaker = self.open_breaker(reset_timeout=0)
+        self.assertTrue(breaker.before_request())
+        breaker.after_request(None)
+        breaker.after_request(SERVER_ERROR)
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertTrue(breaker.probing)
+
+    def test_cancelled_probe(self):
+        """Test cancelled probe allows next probe without changing state."""
+        for error in (asyncio.CancelledError(), LegacyCancelledError()):
+            breaker = self.open_breaker(reset_timeout=0)
+            breaker.after_request(error, breaker.before_request())
+            self.assertEqual(breaker.state, HALF_OPEN)
+            self.assertTrue(breaker.before_request())
+
+    def test_cancelled_request_ignored(self):
+        """Test cancelled request does not reset consecutive failures."""
+        breaker = CircuitBreaker(ENDPOINT, failure_threshold=2, reset_timeout=60)
+        breaker.after_request(SERVER_ERROR, breaker.before_request())
+        breaker.after_request(LegacyCancelledError(), breaker.before_request())
+        breaker.after_request(SERVER_ERROR, breaker.before_request())
+        self.assertEqual(breaker.state, OPEN)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for process wide s3 connection pool."""
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.libs.s3api.connection_pool import S3ConnectionPool
+
+ENDPOINT = "http://s3-0"
+KEY = ("s3", "access", "secret", ENDPOINT)
+
+
+class FakeClient:
+    """Client recording whether it is closed."""
+
+    def __init__(self):
+        """Initialize open client."""
+        self.closed = False
+
+    async def close(self):
+        """Close the client."""
+        self.closed = True
+
+
+class TestS3ConnectionPool(unittest.TestCase):
+    """Tests suite for S3ConnectionPool."""
+
+    def setUp(self):
+        """Create pool and fake client creator counting created clients."""
+        self.pool = S3ConnectionPool(max_connections_per_endpoint=2)
+        self.created = []
+        self.failures = []
+
+    async def create_client(self) -> FakeClient:
+        """Create client after a delay, fail with error of the attempt if any."""
+        await asyncio.sleep(0.01)
+        if self.failures:
+            raise self.failures.pop(0)
+        self.created.append(FakeClient())
+        return self.created[-1]
+
+    def test_client_shared(self):
+        """Test client is created once and shared by concurrent callers."""
+
+        async def get_clients() -> list:
+            return await asyncio.gather(
+                *(self.pool.get_client(KEY, self.create_client) for _ in range(5))
+            )
+
+        clients = asyncio.run(get_clients())
+        self.assertEqual(len(self.created), 1)
+        self.assertTrue(all(client is self.created[0] for client in clients))
+
+    def test_cancelled_waiter(self):
+        """Test cancelling first waiter does not cancel client creation for other callers."""
+
+        async def get_client_after_cancel() -> FakeClient:
+            first = asyncio.ensure_future(self.pool.get_client(KEY, self.create_client))
+            await asyncio.sleep(0)
+            first.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+            return await self.pool.get_client(KEY, self.create_client)
+
+        client = asyncio.run(get_client_after_cancel())
+        self.assertEqual(self.created, [client])
+
+    def test_failed_creation_evicted(self):
+        """Test failed client creation is not cached."""
+        self.failures.append(ConnectionError("refused"))
+
+        async def get_client_after_failure() -> FakeClient:
+            with self.assertRaises(ConnectionError):
+                await self.pool.get_client(KEY, self.create_client)
+            return await self.pool.get_client(KEY, self.create_client)
+
+        client = asyncio.run(get_client_after_failure())
+        self.assertEqual(self.created, [client])
+
+    def test_close(self):
+        """Test clients of the event loop are closed and evicted."""
+
+        async def get_and_close() -> FakeClient:
+            client = await self.pool.get_client(KEY, self.create_client)
+            await self.pool.close()
+            return client
+
+        client = asyncio.run(get_and_close())
+        self.assertTrue(client.closed)
+        self.assertEqual(self.pool.clients, {})
+
+    def test_connections_per_endpoint(self):
+        """Test in-flight requests per endpoint are capped and waiting is reported."""
+
+        async def request():
+            async with self.pool.acquire(ENDPOINT):
+                await asyncio.sleep(0.01)
+
+        async def requests():
+            await asyncio.gather(*(request() for _ in range(5)))
+
+        asyncio.run(requests())
+        stats = self.pool.stats[ENDPOINT]
+        self.assertEqual(stats["peak_in_use"], 2)
+        self.assertEqual(stats["peak_waiters"], 3)
+        self.assertEqual((stats["requests"], stats["in_use"], stats["waiters"]), (5, 0, 0))
+        self.assertGreater(stats["max_wait_ms"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for endpoint balancer."""
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.libs.s3api.endpoint_balancer import EndpointBalancer
+    from src.libs.s3api.endpoint_balancer import LEAST_OUTSTANDING
+
+ENDPOINTS = ["http://s3-0", "http://s3-1", "http://s3-2"]
+
+
+class TestEndpointBalancer(unittest.TestCase):
+    """Tests suite for EndpointBalancer."""
+
+    @staticmethod
+    def fail_requests(balancer: EndpointBalancer, endpoint: str, error: Exception, count: int):
+        """Complete count requests of endpoint with error."""
+        for _ in range(count):
+            balancer.end_request(endpoint, balancer.start_request(endpoint), error)
+
+    def test_round_robin(self):
+        """Test endpoints are selected in turn."""
+        balancer = EndpointBalancer(ENDPOINTS)
+        self.assertEqual([balancer.get_endpoint() for _ in range(6)], ENDPOINTS * 2)
+
+    def test_round_robin_exclude(self):
+        """Test excluded endpoint is skipped if others are available."""
+        balancer = EndpointBalancer(ENDPOINTS)
+        endpoints = [balancer.get_endpoint(exclude=[ENDPOINTS[0]]) for _ in range(4)]
+        self.assertNotIn(ENDPOINTS[0], endpoints)
+        self.assertEqual(balancer.get_endpoint(exclude=ENDPOINTS), ENDPOINTS[0])
+
+    def test_least_outstanding(self):
+        """Test endpoint with least requests in flight is selected."""
+        balancer = EndpointBalancer(ENDPOINTS, policy=LEAST_OUTSTANDING)
+        balancer.start_request(ENDPOINTS[0])
+        start_time = balancer.start_request(ENDPOINTS[1])
+        self.assertEqual(balancer.get_endpoint(), ENDPOINTS[2])
+        balancer.start_request(ENDPOINTS[2])
+        balancer.start_request(ENDPOINTS[2])
+        balancer.end_request(ENDPOINTS[1], start_time)
+        self.assertEqual(balancer.get_endpoint(), ENDPOINTS[1])
+
+    def test_eject_on_consecutive_failures(self):
+        """Test endpoint is ejected after eject_threshold consecutive server failures."""
+        balancer = EndpointBalancer(ENDPOINTS, eject_threshold=2, eject_duration=60)
+        self.fail_requests(balancer, ENDPOINTS[0], ConnectionError("reset"), 1)
+        self.assertFalse(balancer.is_ejected(ENDPOINTS[0]))
+        self.fail_requests(balancer, ENDPOINTS[0], ConnectionError("reset"), 1)
+        self.assertTrue(balancer.is_ejected(ENDPOINTS[0]))
+        self.assertEqual(balancer.stats[ENDPOINTS[0]]["ejections"], 1)
+        self.assertNotIn(ENDPOINTS[0], [balancer.get_endpoint() for _ in range(6)])
+
+    def test_success_resets_failures(self):
+        """Test successful request resets consecutive failures of endpoint."""
+        balancer = EndpointBalancer(ENDPOINTS, eject_threshold=2)
+        self.fail_requests(balancer, ENDPOINTS[0], ConnectionError("reset"), 1)
+        self.fail_requests(balancer, ENDPOINTS[0], None, 1)
+        self.fail_requests(balancer, ENDPOINTS[0], ConnectionError("reset"), 1)
+        self.assertFalse(balancer.is_ejected(ENDPOINTS[0]))
+        self.assertEqual(balancer.stats[ENDPOINTS[0]]["errors"], 2)
+
+    def test_cancelled_request_ignored(self):
+        """Test cancelled request does not reset consecutive failures."""
+        balancer = EndpointBalancer(ENDPOINTS, eject_threshold=2)
+        self.fail_requests(balancer, ENDPOINTS[0], ConnectionError("reset"), 1)
+        self.fail_requests(balancer, ENDPOINTS[0], asyncio.CancelledError(), 1)
+        self.fail_requests(balancer, ENDPOINTS[0], ConnectionError("reset"), 1)
+        self.assertTrue(balancer.is_ejected(ENDPOINTS[0]))
+
+    def test_client_errors_not_ejected(self):
+        """Test 4xx errors do not eject endpoint."""
+        balancer = EndpointBalancer(ENDPOINTS, eject_threshold=1)
+        error = ClientError(
+            {"Error": {"Code": "NoSuchKey"}, "ResponseMetadata": {"HTTPStatusCode": 404}},
+            "GetObject",
+        )
+        self.fail_requests(balancer, ENDPOINTS[0], error, 3)
+        self.assertFalse(balancer.is_ejected(ENDPOINTS[0]))
+
+    def test_all_endpoints_ejected(self):
+        """Test all endpoints are used if all of them are ejected."""
+        balancer = EndpointBalancer(ENDPOINTS, eject_threshold=1, eject_duration=60)
+        for endpoint in ENDPOINTS:
+            self.fail_requests(balancer, endpoint, ConnectionError("reset"), 1)
+        self.assertEqual([balancer.get_endpoint() for _ in range(3)], ENDPOINTS)
+
+    def test_single_endpoint_not_ejected(self):
+        """Test the only endpoint is never ejected."""
+        balancer = EndpointBalancer(ENDPOINTS[:1], eject_threshold=1)
+        self.fail_requests(balancer, ENDPOINTS[0], ConnectionError("reset"), 3)
+        self.assertFalse(balancer.is_ejected(ENDPOINTS[0]))
+
+    def test_invalid_arguments(self):
+        """Test balancer without endpoints or with unknown policy is rejected."""
+        with self.assertRaises(ValueError):
+            EndpointBalancer([])
+        with self.assertRaises(ValueError):
+            EndpointBalancer(ENDPOINTS, policy="random")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for connector settings of asyncio s3 clients."""
+
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from aiobotocore.config import AioConfig
+from botocore.hooks import HierarchicalEmitter
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from config import S3_CFG
+    from src.libs.s3api.http_connector import get_connector_args
+    from src.libs.s3api.http_connector import register_connection_handlers
+
+
+def get_client() -> SimpleNamespace:
+    """Get fake client with event emitter of botocore client."""
+    return SimpleNamespace(meta=SimpleNamespace(events=HierarchicalEmitter()))
+
+
+def send_request(client) -> dict:
+    """Emit before-send event of get object request and get headers of the request."""
+    request = SimpleNamespace(headers={})
+    client.meta.events.emit("before-send.s3.GetObject", request=request)
+    return request.headers
+
+
+class TestHttpConnector(unittest.TestCase):
+    """Tests suite for connector args and connection event handlers."""
+
+    def test_connector_args(self):
+        """Test connector args are as per connector config and accepted by AioConfig."""
+        connector = {"keepalive_timeout": 5, "use_dns_cache": False, "force_close": True}
+        with mock.patch.dict(S3_CFG, {"connector": connector}):
+            connector_args = get_connector_args()
+        self.assertEqual(connector_args, {"keepalive_timeout": 5, "use_dns_cache": False})
+        self.assertEqual(AioConfig(connector_args=connector_args).connector_args, connector_args)
+
+    def test_default_connector_args(self):
+        """Test default connector args without connector config."""
+        with mock.patch.dict(S3_CFG, {"connector": None}):
+            self.assertEqual(
+                get_connector_args(), {"keepalive_timeout": 12, "use_dns_cache": True}
+            )
+
+    def test_force_close(self):
+        """Test connection close header is added to every request only with force_close."""
+        for force_close in (True, False):
+            client = get_client()
+            with mock.patch.dict(S3_CFG, {"connector": {"force_close": force_close}}):
+                register_connection_handlers(client)
+            headers = send_request(client)
+            self.assertEqual(headers.get("Connection"), "close" if force_close else None)
+
+
+if __name__ == "__main__":
+    unittest.main()
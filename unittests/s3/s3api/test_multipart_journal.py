@@ -0,0 +1,117 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for multipart upload journal."""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.libs.s3api.multipart_journal import MultipartJournal
+
+BUCKET = "bucket-1"
+
+
+class TestMultipartJournal(unittest.TestCase):
+    """Tests suite for MultipartJournal."""
+
+    def setUp(self):
+        """Create journal directory of the test."""
+        journal_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(journal_dir.cleanup)
+        self.journal_dir = journal_dir.name
+
+    def get_journal(self, key: str = "object-1") -> MultipartJournal:
+        """Get journal of the key in journal directory of the test."""
+        return MultipartJournal(BUCKET, key, self.journal_dir)
+
+    def test_load_recorded_parts(self):
+        """Test upload id, upload details and parts are loaded from journal."""
+        journal = self.get_journal()
+        journal.start("upload-1", {"Size": 30, "PartSize": 10})
+        journal.record_part(2, "etag-2")
+        journal.record_part(1, "etag-1")
+        loaded = self.get_journal()
+        self.assertTrue(loaded.load())
+        self.assertEqual(loaded.upload_id, "upload-1")
+        self.assertEqual(loaded.info, {"Size": 30, "PartSize": 10})
+        self.assertEqual(loaded.parts, {1: "etag-1", 2: "etag-2"})
+
+    def test_start_replaces_journal(self):
+        """Test new upload replaces journal of earlier upload of the key."""
+        journal = self.get_journal()
+        journal.start("upload-1")
+        journal.record_part(1, "etag-1")
+        self.get_journal().start("upload-2")
+        self.assertTrue(journal.load())
+        self.assertEqual((journal.upload_id, journal.parts), ("upload-2", {}))
+
+    def test_load_missing_or_empty(self):
+        """Test missing, empty or corrupt journal is not loaded."""
+        journal = self.get_journal()
+        self.assertFalse(journal.load())
+        os.makedirs(self.journal_dir, exist_ok=True)
+        for content in ("", '{"Bucket": "bucket-1", "Ke'):
+            with open(journal.path, "w", encoding="utf-8") as journal_file:
+                journal_file.write(content)
+            self.assertFalse(journal.load())
+
+    def test_partial_part_skipped(self):
+        """Test partially written part left by crash is skipped."""
+        journal = self.get_journal()
+        journal.start("upload-1")
+        journal.record_part(1, "etag-1")
+        with open(journal.path, "a", encoding="utf-8") as journal_file:
+            journal_file.write('{"PartNumber": 2, "ET')
+        self.assertTrue(journal.load())
+        self.assertEqual(journal.parts, {1: "etag-1"})
+
+    def test_remove(self):
+        """Test journal is removed and removing again is ignored."""
+        journal = self.get_journal()
+        journal.start("upload-1")
+        journal.remove()
+        journal.remove()
+        self.assertFalse(os.path.exists(journal.path))
+
+    def test_list_journals(self):
+        """Test journals of the bucket are listed and unreadable journals are skipped."""
+        self.get_journal("object-1").start("upload-1")
+        self.get_journal("object-2").start("upload-2")
+        MultipartJournal("bucket-2", "object-3", self.journal_dir).start("upload-3")
+        for name, content in (("empty", ""), ("corrupt", "{"), ("keyless", "{}")):
+            with open(
+                os.path.join(self.journal_dir, f"{name}.journal"), "w", encoding="utf-8"
+            ) as journal_file:
+                journal_file.write(content)
+        journals = MultipartJournal.list_journals(BUCKET, self.journal_dir)
+        self.assertEqual(
+            sorted((journal.key, journal.upload_id) for journal in journals),
+            [("object-1", "upload-1"), ("object-2", "upload-2")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for validation modes of multipart workload."""
+
+import asyncio
+import hashlib
+import sys
+import unittest
+from unittest import mock
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from scripts.s3.s3api import multipart_operations
+    from src.libs.s3api.s3_multipart_ops import MULTIPART_CFG
+
+BUCKET = "bucket-1"
+KEY = "object-1"
+UPLOAD_ID = "upload-1"
+
+
+class TestMultipartValidation(unittest.TestCase):
+    """Tests suite for etag and sampled full validation of multipart workload."""
+
+    def get_workload(self, **kwargs):
+        """Get multipart workload of 4 parts with s3 requests replaced by fake server."""
+        workload = multipart_operations.TestMultiParts(
+            "access",
+            "secret",
+            "http://localhost:5000",
+            "unittest",
+            object_size=4000,
+            part_range={"start": 4, "end": 5},
+            seed=5,
+            **kwargs,
+        )
+        for name in (
+            "create_multipart_upload",
+            "resume_upload_parts",
+            "list_parts",
+            "list_multipart_uploads",
+            "complete_multipart_upload",
+            "head_object",
+            "get_s3object_checksum",
+        ):
+            setattr(workload, name, getattr(self, name))
+        return workload
+
+    def setUp(self):
+        """Uploaded parts and downloads of fake server."""
+        self.parts = {}
+        self.downloads = 0
+        self.corrupt = False
+
+    async def create_multipart_upload(self, bucket_name, obj_name) -> dict:
+        """Fake create multipart upload."""
+        return {"UploadId": UPLOAD_ID}
+
+    async def resume_upload_parts(self, bucket_name, object_name, upload_id, get_parts, *args):
+        """Fake upload of parts reading the part bodies."""
+        parts = []
+        for part in get_parts():
+            self.parts[part["PartNumber"]] = part["Body"].read()
+            parts.append({"PartNumber": part["PartNumber"], "ETag": f"etag-{part['PartNumber']}"})
+        return parts
+
+    async def list_parts(self, *args) -> list:
+        """Fake list parts."""
+        return []
+
+    async def list_multipart_uploads(self, *args) -> list:
+        """Fake list multipart uploads."""
+        return []
+
+    async def complete_multipart_upload(self, *args) -> dict:
+        """Fake complete multipart upload."""
+        return {}
+
+    def get_data(self) -> bytes:
+        """Get stored data, last byte is flipped if corrupted."""
+        data = b"".join(self.parts[number] for number in sorted(self.parts))
+        return data[:-1] + bytes([data[-1] ^ 1]) if self.corrupt else data
+
+    async def head_object(self, bucket, key) -> dict:
+        """Fake head object with ETag of multipart object as calculated by s3."""
+        md5s = [
+            hashlib.md5(self.parts[number]).digest() for number in sorted(self.parts)  # nosec
+        ]
+        if self.corrupt:
+            md5s[-1] = hashlib.md5(self.get_data()[-1000:]).digest()  # nosec
+        return {"ETag": f'"{hashlib.md5(b"".join(md5s)).hexdigest()}-{len(md5s)}"'}  # nosec
+
+    async def get_s3object_checksum(self, bucket, key, size=None) -> str:
+        """Fake download checksum of stored data."""
+        self.downloads += 1
+        return hashlib.sha256(self.get_data()).hexdigest()
+
+    @staticmethod
+    def upload_and_validate(workload) -> tuple:
+        """Upload multipart object and validate it."""
+
+        async def run() -> tuple:
+            upload = await workload.create_upload_list_completed_mpart(4, BUCKET, KEY, "copy-1")
+            await workload.validate_mpart_object(BUCKET, KEY, *upload)
+            return upload
+
+        return asyncio.run(run())
+
+    def test_etag_validation(self):
+        """Test etag mode validates ETag without checksum or download if not sampled."""
+        workload = self.get_workload(validation_mode="etag", full_validation_fraction=0)
+        with mock.patch.object(workload, "get_data_checksum") as get_data_checksum:
+            size, etag, checksum = self.upload_and_validate(workload)
+        get_data_checksum.assert_not_called()
+        self.assertEqual((size, checksum, self.downloads), (4000, None, 0))
+        self.assertTrue(etag.endswith('-4"'))
+        self.corrupt = True
+        with self.assertRaises(AssertionError):
+            self.upload_and_validate(workload)
+
+    def test_sampled_full_validation(self):
+        """Test sampled object is validated by checksum calculated while uploading."""
+        workload = self.get_workload(validation_mode="etag", full_validation_fraction=1)
+        _, _, checksum = self.upload_and_validate(workload)
+        self.assertEqual(checksum, hashlib.sha256(self.get_data()).hexdigest())
+        self.assertEqual(self.downloads, 1)
+
+    def test_checksum_validation(self):
+        """Test checksum mode validates every object by checksum and detects corruption."""
+        workload = self.get_workload(validation_mode="checksum", full_validation_fraction=0)
+        self.upload_and_validate(workload)
+        self.assertEqual(self.downloads, 1)
+        self.corrupt = True
+        with self.assertRaisesRegex(AssertionError, "checksum"):
+            self.upload_and_validate(workload)
+
+    def test_sampling_fraction(self):
+        """Test fraction of objects is sampled, same objects are sampled for same seed."""
+
+        def get_samples() -> list:
+            workload = self.get_workload(validation_mode="etag", full_validation_fraction=0.3)
+            return [workload.validation_sampler.random() < 0.3 for _ in range(200)]
+
+        samples = get_samples()
+        self.assertEqual(get_samples(), samples)
+        self.assertTrue(30 <= sum(samples) <= 90, sum(samples))
+
+    def test_default_fraction(self):
+        """Test fraction defaults to s3 config, fraction 0 is kept."""
+        with mock.patch.dict(MULTIPART_CFG, {"full_validation_fraction": 0.25}):
+            self.assertEqual(self.get_workload().full_validation_fraction, 0.25)
+            self.assertEqual(
+                self.get_workload(full_validation_fraction=0).full_validation_fraction, 0
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
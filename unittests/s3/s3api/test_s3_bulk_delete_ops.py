@@ -0,0 +1,129 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for batched delete of objects."""
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.libs.s3api.s3_bulk_delete_ops import S3BulkDelete
+
+BUCKET = "bucket-1"
+
+
+async def iter_pages(pages: list):
+    """Generate given pages of keys."""
+    for page in pages:
+        yield page
+
+
+class TestS3BulkDelete(unittest.TestCase):
+    """Tests suite for S3BulkDelete."""
+
+    def setUp(self):
+        """Replace delete_objects_batch by fake delete tracking batches in flight."""
+        self.s3api = S3BulkDelete("access", "secret")
+        self.batches = []
+        self.failed_keys = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.s3api.delete_objects_batch = self.delete_objects_batch
+
+    async def delete_objects_batch(self, bucket_name: str, keys: list) -> list:
+        """Fake delete of batch returning errors of failed keys."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.batches.append(keys)
+        await asyncio.sleep(0.001 * (len(self.batches) % 3))
+        self.in_flight -= 1
+        return [
+            {"Key": key, "Code": "AccessDenied", "Message": f"{bucket_name}/{key}"}
+            for key in keys
+            if key in self.failed_keys
+        ]
+
+    def delete_keys(self, pages: list, **kwargs) -> dict:
+        """Run delete_keys of pages of keys."""
+        return asyncio.run(self.s3api.delete_keys(BUCKET, iter_pages(pages), **kwargs))
+
+    def test_regroup_pages(self):
+        """Test keys of pages are regrouped in batches of batch_size."""
+        pages = [[f"key-{i}" for i in range(start, end)] for start, end in ((0, 3), (3, 7), (7, 9))]
+        result = self.delete_keys(pages, batch_size=4, batches_in_flight=2)
+        self.assertEqual(result, {"Deleted": 9, "Errors": []})
+        self.assertEqual(sorted(len(batch) for batch in self.batches), [1, 4, 4])
+        self.assertEqual(sorted(sum(self.batches, [])), sorted(sum(pages, [])))
+
+    def test_batch_size_limit(self):
+        """Test batch is not more than 1000 keys of delete objects request."""
+        pages = [[f"key-{i}" for i in range(2500)]]
+        result = self.delete_keys(pages, batch_size=5000, batches_in_flight=2)
+        self.assertEqual(result["Deleted"], 2500)
+        self.assertEqual(sorted(len(batch) for batch in self.batches), [500, 1000, 1000])
+
+    def test_batches_in_flight(self):
+        """Test number of batches deleted at once is bounded."""
+        pages = [[f"key-{i}" for i in range(100)]]
+        result = self.delete_keys(pages, batch_size=5, batches_in_flight=3)
+        self.assertEqual(result["Deleted"], 100)
+        self.assertEqual(len(self.batches), 20)
+        self.assertEqual(self.max_in_flight, 3)
+
+    def test_failed_keys(self):
+        """Test failed keys are returned as errors and not counted as deleted."""
+        self.failed_keys = {"key-1", "key-8"}
+        result = self.delete_keys([[f"key-{i}" for i in range(10)]], batch_size=4)
+        self.assertEqual(result["Deleted"], 8)
+        self.assertEqual(sorted(error["Key"] for error in result["Errors"]), ["key-1", "key-8"])
+
+    def test_empty_pages(self):
+        """Test nothing is deleted without keys."""
+        self.assertEqual(self.delete_keys([[], []]), {"Deleted": 0, "Errors": []})
+        self.assertEqual(self.batches, [])
+
+    def test_iter_key_pages(self):
+        """Test keys are listed page by page with continuation token."""
+        responses = {
+            None: {
+                "Contents": [{"Key": "key-0"}, {"Key": "key-1"}],
+                "IsTruncated": True,
+                "NextContinuationToken": "token-1",
+            },
+            "token-1": {"Contents": [{"Key": "key-2"}], "IsTruncated": False},
+        }
+
+        async def list_objects_page(bucket_name, prefix="", continuation_token=None):
+            self.assertEqual((bucket_name, prefix), (BUCKET, "key-"))
+            return responses[continuation_token]
+
+        async def list_pages() -> list:
+            return [page async for page in self.s3api.iter_key_pages(BUCKET, "key-")]
+
+        self.s3api.list_objects_page = list_objects_page
+        self.assertEqual(asyncio.run(list_pages()), [["key-0", "key-1"], ["key-2"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for concurrent and resumable upload of multipart parts."""
+
+import asyncio
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.libs.s3api.multipart_journal import MultipartJournal
+    from src.libs.s3api.s3_multipart_ops import S3MultiParts
+
+BUCKET = "bucket-1"
+KEY = "object-1"
+UPLOAD_ID = "upload-1"
+
+
+def get_client_error(status: int, code: str) -> ClientError:
+    """Get s3 client error of http status and error code."""
+    return ClientError(
+        {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}, "UploadPart"
+    )
+
+
+class TestS3MultiParts(unittest.TestCase):
+    """Tests suite for upload_parts and resume_upload_parts of S3MultiParts."""
+
+    def setUp(self):
+        """Replace upload_part by fake upload tracking parts in flight, journal in temp dir."""
+        self.s3api = S3MultiParts("access", "secret")
+        self.uploaded = []
+        self.failures = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.s3api.upload_part = self.upload_part
+        journal_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(journal_dir.cleanup)
+        self.journal_dir = journal_dir.name
+        for patcher in (
+            mock.patch(
+                "src.libs.s3api.multipart_journal.get_journal_dir", return_value=self.journal_dir
+            ),
+            mock.patch("src.libs.s3api.s3_multipart_ops.get_retry_delay", return_value=0),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    # pylint: disable=too-many-arguments,unused-argument
+    async def upload_part(self, body, bucket_name, object_name, upload_id, part_number):
+        """Fake upload of part failing with error of the part if any."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * (part_number % 3))
+            if part_number in self.failures:
+                raise self.failures.pop(part_number)
+        finally:
+            self.in_flight -= 1
+        self.uploaded.append(part_number)
+        return {"ETag": f"etag-{part_number}"}
+
+    @staticmethod
+    def get_parts(count: int, taken: list = None):
+        """Generate parts recording the number of parts taken."""
+        for number in range(1, count + 1):
+            if taken is not None:
+                taken.append(number)
+            yield {"PartNumber": number, "Body": b"x" * number}
+
+    def upload_parts(self, parts, parts_in_flight: int, journal: MultipartJournal = None):
+        """Run upload_parts of the upload."""
+        return asyncio.run(
+            self.s3api.upload_parts(BUCKET, KEY, UPLOAD_ID, parts, parts_in_flight, journal)
+        )
+
+    def resume_upload_parts(self, count: int, upload_info: dict = None):
+        """Run resume_upload_parts of the upload with count parts."""
+        return asyncio.run(
+            self.s3api.resume_upload_parts(
+                BUCKET, KEY, UPLOAD_ID, lambda: self.get_parts(count), 2, upload_info
+            )
+        )
+
+    def test_upload_window(self):
+        """Test parts are uploaded with bounded parts in flight and returned in order."""
+        parts = self.upload_parts(self.get_parts(10), parts_in_flight=3)
+        self.assertEqual(
+            parts, [{"PartNumber": num, "ETag": f"etag-{num}"} for num in range(1, 11)]
+        )
+        self.assertEqual(sorted(self.uploaded), list(range(1, 11)))
+        self.assertEqual(self.max_in_flight, 3)
+
+    def test_parts_taken_lazily(self):
+        """Test next part is taken only when a part in flight is uploaded."""
+        taken = []
+        backlog = []
+
+        async def upload_part(*args, **kwargs):
+            backlog.append(len(taken) - len(self.uploaded))
+            return await self.upload_part(*args, **kwargs)
+
+        self.s3api.upload_part = upload_part
+        self.upload_parts(self.get_parts(10, taken), parts_in_flight=2)
+        self.assertLessEqual(max(backlog), 2)
+
+    def test_failure_stops_upload(self):
+        """Test no part is started after failure and parts in flight are completed."""
+        self.failures[3] = get_client_error(404, "NoSuchUpload")
+        taken = []
+        with self.assertRaises(ClientError):
+            self.upload_parts(self.get_parts(10, taken), parts_in_flight=2)
+        self.assertLess(len(taken), 10)
+        self.assertEqual(sorted(self.uploaded + [3]), sorted(taken))
+        self.assertEqual(self.in_flight, 0)
+
+
+    def test_journal_parts_skipped(self):
+        """Test parts in journal are not uploaded again and uploaded parts are recorded."""
+        journal = MultipartJournal(BUCKET, KEY)
+        journal.start(UPLOAD_ID)
+        journal.record_part(2, "etag-2")
+        parts = self.upload_parts(self.get_parts(4), parts_in_flight=2, journal=journal)
+        self.assertEqual([part["ETag"] for part in parts], [f"etag-{num}" for num in range(1, 5)])
+        self.assertEqual(sorted(self.uploaded), [1, 3, 4])
+        journal = MultipartJournal(BUCKET, KEY)
+        self.assertTrue(journal.load())
+        self.assertEqual(sorted(journal.parts), [1, 2, 3, 4])
+
+    def test_resume_on_transient_failure(self):
+        """Test only failed part is uploaded again on resume and journal is removed."""
+        self.failures[3] = get_client_error(503, "ServiceUnavailable")
+        parts = self.resume_upload_parts(5, {"Size": 15})
+        self.assertEqual([part["PartNumber"] for part in parts], [1, 2, 3, 4, 5])
+        self.assertEqual(sorted(self.uploaded), [1, 2, 3, 4, 5])
+        self.assertFalse(os.listdir(self.journal_dir))
+
+    def test_fatal_failure_not_resumed(self):
+        """Test upload is not resumed on fatal error and journal is left for cleanup."""
+        self.failures[3] = get_client_error(404, "NoSuchUpload")
+        with self.assertRaises(ClientError):
+            self.resume_upload_parts(5, {"Size": 15})
+        journal = MultipartJournal(BUCKET, KEY)
+        self.assertTrue(journal.load())
+        self.assertEqual(journal.info, {"Size": 15})
+        self.assertEqual(sorted(journal.parts), sorted(self.uploaded))
+
+    def test_resume_from_journal_on_disk(self):
+        """Test upload left by earlier process is resumed from its journal."""
+        journal = MultipartJournal(BUCKET, KEY)
+        journal.start(UPLOAD_ID)
+        journal.record_part(1, "etag-1")
+        journal.record_part(4, "etag-4")
+        self.resume_upload_parts(4)
+        self.assertEqual(sorted(self.uploaded), [2, 3])
+
+    def test_journal_of_other_upload_replaced(self):
+        """Test journal of other upload id is replaced and all parts are uploaded."""
+        journal = MultipartJournal(BUCKET, KEY)
+        journal.start("upload-0")
+        journal.record_part(1, "etag-0")
+        parts = self.resume_upload_parts(3)
+        self.assertEqual(sorted(self.uploaded), [1, 2, 3])
+        self.assertEqual(parts[0]["ETag"], "etag-1")
+
+
+class TestPartManifest(unittest.TestCase):
+    """Tests suite for part checksum manifest and validate_parts of S3MultiParts."""
+
+    def setUp(self):
+        """Store manifest of 6 parts and replace get_part_checksum by fake range read."""
+        self.s3api = S3MultiParts("access", "secret")
+        self.data = os.urandom(5 * 100 + 30)
+        self.corrupted = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.s3api.get_part_checksum = self.get_part_checksum
+        sizes = [100] * 5 + [30]
+        self.manifest = self.s3api.store_part_manifest(
+            BUCKET,
+            KEY,
+            "md5",
+            (
+                (size, hashlib.md5(self.data[num * 100 : num * 100 + size]).hexdigest())  # nosec
+                for num, size in enumerate(sizes)
+            ),
+        )
+
+    async def get_part_checksum(self, bucket_name, object_name, part, algorithm) -> str:
+        """Fake checksum of part read as byte range, corrupted parts have other checksum."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * (part["PartNumber"] % 3))
+        finally:
+            self.in_flight -= 1
+        data = self.data[part["Offset"] : part["Offset"] + part["Size"]]
+        if part["PartNumber"] in self.corrupted:
+            data = data[1:]
+        return hashlib.new(algorithm, data).hexdigest()
+
+    def validate_parts(self, parts_in_flight: int = 2):
+        """Run validate_parts of the object."""
+        asyncio.run(self.s3api.validate_parts(BUCKET, KEY, parts_in_flight))
+
+    def test_manifest(self):
+        """Test manifest has part number and offset of every part."""
+        self.assertEqual(
+            [(part["PartNumber"], part["Offset"], part["Size"]) for part in self.manifest],
+            [(1, 0, 100), (2, 100, 100), (3, 200, 100), (4, 300, 100), (5, 400, 100), (6, 500, 30)],
+        )
+
+    def test_validate_parts(self):
+        """Test parts are validated concurrently and manifest is removed once validated."""
+        self.validate_parts(parts_in_flight=3)
+        self.assertEqual(self.max_in_flight, 3)
+        with self.assertRaises(ValueError):
+            self.validate_parts()
+
+    def test_corrupted_parts(self):
+        """Test every corrupted part is reported with its part number and offset."""
+        self.corrupted = {2, 6}
+        with self.assertRaises(AssertionError) as error:
+            self.validate_parts()
+        self.assertIn("2 parts", str(error.exception))
+        self.assertIn("PartNumber 2 at offset 100 of size 100", str(error.exception))
+        self.assertIn("PartNumber 6 at offset 500 of size 30", str(error.exception))
+
+    def test_empty_part(self):
+        """Test checksum of empty part is calculated without reading it."""
+        s3api = S3MultiParts("access", "secret")
+        part = {"PartNumber": 1, "Offset": 0, "Size": 0}
+        with mock.patch.object(s3api, "get_client") as get_client:
+            checksum = asyncio.run(s3api.get_part_checksum(BUCKET, KEY, part, "sha256"))
+        get_client.assert_not_called()
+        self.assertEqual(checksum, hashlib.sha256().hexdigest())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,358 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for s3 object operations of S3Object."""
+
+import asyncio
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.commons.utils.hash_utils import ChunkHasher
+    from src.libs.s3api.s3_multipart_ops import MAX_PARTS
+    from src.libs.s3api.s3_multipart_ops import MULTIPART_CFG
+    from src.libs.s3api.s3_object_ops import S3Object
+
+BUCKET = "bucket-1"
+KEY = "object-1"
+UPLOAD_ID = "upload-1"
+RANGE_SIZE = 256 * 1024
+
+
+class TestReadObjectRanges(unittest.TestCase):
+    """Tests suite for parallel byte range read of S3Object."""
+
+    def setUp(self):
+        """Replace get_object_range_into by fake range read tracking ranges in flight."""
+        self.s3api = S3Object(
+            "access", "secret", parallel_read={"range_size": RANGE_SIZE, "ranges_in_flight": 3}
+        )
+        self.data = os.urandom(10 * RANGE_SIZE + 5)
+        self.failed_start = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.s3api.get_object_range_into = self.get_object_range_into
+
+    async def get_object_range_into(self, bucket, key, start, buffer) -> dict:
+        """Fake range read, ranges are completed out of order."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001 * ((start // RANGE_SIZE) % 3))
+            if start == self.failed_start:
+                raise ConnectionError(f"reset s3://{bucket}/{key}")
+            buffer[:] = self.data[start : start + len(buffer)]
+            return {
+                "ContentLength": len(buffer),
+                "ContentRange": f"bytes {start}-{start + len(buffer) - 1}/{len(self.data)}",
+                "ETag": "etag-1",
+            }
+        finally:
+            self.in_flight -= 1
+
+    def test_ranges_assembled_in_order(self):
+        """Test ranges are written and hashed in order with bounded ranges in flight."""
+        file_obj = io.BytesIO()
+        response = asyncio.run(
+            self.s3api.read_object_ranges(
+                BUCKET, KEY, len(self.data), file_obj=file_obj, file_hash=ChunkHasher()
+            )
+        )
+        self.assertEqual(file_obj.getvalue(), self.data)
+        self.assertEqual(response["Checksum"], hashlib.sha256(self.data).hexdigest())
+        self.assertEqual(response["ContentLength"], len(self.data))
+        self.assertEqual(response["ETag"], "etag-1")
+        self.assertNotIn("ContentRange", response)
+        self.assertEqual(self.max_in_flight, 3)
+
+    def test_failed_range(self):
+        """Test failed range cancels pending ranges and digest is not calculated."""
+        self.failed_start = 4 * RANGE_SIZE
+        file_hash = ChunkHasher()
+        with mock.patch.object(file_hash, "hexdigest_async") as hexdigest_async:
+            with self.assertRaises(ConnectionError):
+                asyncio.run(
+                    self.s3api.read_object_ranges(
+                        BUCKET, KEY, len(self.data), file_hash=file_hash
+                    )
+                )
+        hexdigest_async.assert_not_called()
+        self.assertIsNone(file_hash.pending)
+        self.assertEqual(self.in_flight, 0)
+
+
+class TestChecksums(unittest.TestCase):
+    """Tests suite for checksums of generated data and local files."""
+
+    def setUp(self):
+        """Create s3 object operations and local file of data."""
+        self.s3api = S3Object("access", "secret", seed=7)
+        self.data = os.urandom(3 * 1024**2 + 7)
+        file_obj, self.file_path = tempfile.mkstemp()
+        with os.fdopen(file_obj, "wb") as file_out:
+            file_out.write(self.data)
+        self.addCleanup(os.remove, self.file_path)
+
+    def test_data_checksum(self):
+        """Test checksum of generated data is checksum of data of key at offset."""
+        size, offset = 2 * 1024**2 + 3, 100
+        self.assertEqual(
+            asyncio.run(self.s3api.get_data_checksum(KEY, size, offset)),
+            hashlib.sha256(self.s3api.data_generator.read(KEY, size, offset)).hexdigest(),
+        )
+
+    def test_checksum_file(self):
+        """Test checksum of file read in chunks."""
+        self.assertEqual(
+            self.s3api.checksum_file(self.file_path, 1024**2),
+            hashlib.sha256(self.data).hexdigest(),
+        )
+
+    def test_checksum_part_file(self):
+        """Test checksum of part of file read in chunks."""
+        offset, size = 1024**2 - 5, 1024**2 + 10
+        self.assertEqual(
+            self.s3api.checksum_part_file(self.file_path, offset, size, 512 * 1024),
+            hashlib.sha256(self.data[offset : offset + size]).hexdigest(),
+        )
+        with self.assertRaises(IOError):
+            self.s3api.checksum_part_file(self.file_path, offset, len(self.data))
+
+    def test_hash_algorithm(self):
+        """Test checksums are of configured hash algorithm and unknown algorithm is rejected."""
+        s3api = S3Object("access", "secret", seed=7, hash_algorithm="md5")
+        self.assertEqual(
+            asyncio.run(s3api.get_data_checksum(KEY, 1024)),
+            hashlib.md5(s3api.data_generator.read(KEY, 1024)).hexdigest(),  # nosec
+        )
+        self.assertEqual(s3api.checksum_file(self.file_path), hashlib.md5(self.data).hexdigest())
+        with self.assertRaises(ValueError):
+            S3Object("access", "secret", hash_algorithm="sha1")
+
+
+class TestUploadObject(unittest.TestCase):
+    """Tests suite for routing of upload_object to put object or multipart upload."""
+
+    def setUp(self):
+        """Replace s3 requests by fakes, upload threshold of 1000 bytes and parts of 300 bytes."""
+        self.s3api = S3Object("access", "secret", seed=7)
+        self.requests = []
+        self.parts = {}
+        self.failed_part = None
+        for name in (
+            "put_object",
+            "create_multipart_upload",
+            "upload_part",
+            "complete_multipart_upload",
+            "abort_multipart_upload",
+        ):
+            setattr(self.s3api, name, getattr(self, name))
+        journal_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(journal_dir.cleanup)
+        for patcher in (
+            mock.patch.dict(MULTIPART_CFG, {"upload_threshold": 1000, "part_size": 300}),
+            mock.patch(
+                "src.libs.s3api.multipart_journal.get_journal_dir", return_value=journal_dir.name
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def read_body(body) -> bytes:
+        """Read bytes or file like body."""
+        return bytes(body) if isinstance(body, (bytes, bytearray)) else body.read()
+
+    async def put_object(self, bucket, key, **kwargs) -> dict:
+        """Fake put object."""
+        self.requests.append("put_object")
+        self.parts[0] = self.read_body(kwargs["body"])
+        return {"ETag": f"etag-{bucket}-{key}"}
+
+    async def create_multipart_upload(self, bucket_name, obj_name) -> dict:
+        """Fake create multipart upload."""
+        self.requests.append("create_multipart_upload")
+        return {"UploadId": UPLOAD_ID}
+
+    # pylint: disable=too-many-arguments,unused-argument
+    async def upload_part(self, body, bucket_name, object_name, upload_id, part_number) -> dict:
+        """Fake upload part failing for failed part."""
+        if part_number == self.failed_part:
+            raise ClientError(
+                {"Error": {"Code": "AccessDenied"}, "ResponseMetadata": {"HTTPStatusCode": 403}},
+                "UploadPart",
+            )
+        self.parts[part_number] = self.read_body(body)
+        return {"ETag": f"etag-{part_number}"}
+
+    async def complete_multipart_upload(self, mpu_id, parts, bucket, object_name) -> dict:
+        """Fake complete multipart upload."""
+        self.requests.append("complete_multipart_upload")
+        self.assertEqual(mpu_id, UPLOAD_ID)
+        return {"ETag": "etag-multipart", "Parts": parts}
+
+    async def abort_multipart_upload(self, bucket_name, object_name, upload_id) -> dict:
+        """Fake abort multipart upload."""
+        self.requests.append("abort_multipart_upload")
+        return {}
+
+    def get_data(self) -> bytes:
+        """Get uploaded data in part number order."""
+        return b"".join(self.parts[number] for number in sorted(self.parts))
+
+    def test_put_object_below_threshold(self):
+        """Test object of threshold size is uploaded by put object."""
+        data = os.urandom(1000)
+        response = asyncio.run(self.s3api.upload_object(BUCKET, KEY, body=data))
+        self.assertEqual(response["ETag"], f"etag-{BUCKET}-{KEY}")
+        self.assertEqual(self.requests, ["put_object"])
+        self.assertEqual(self.get_data(), data)
+
+    def test_multipart_above_threshold(self):
+        """Test object larger than threshold is uploaded in parts of part size."""
+        data = os.urandom(1001)
+        response = asyncio.run(self.s3api.upload_object(BUCKET, KEY, body=data))
+        self.assertEqual(self.requests, ["create_multipart_upload", "complete_multipart_upload"])
+        self.assertEqual(response["ETag"], "etag-multipart")
+        self.assertEqual(
+            response["Parts"], [{"PartNumber": num, "ETag": f"etag-{num}"} for num in range(1, 5)]
+        )
+        self.assertEqual([len(self.parts[num]) for num in range(1, 5)], [300, 300, 300, 101])
+        self.assertEqual(self.get_data(), data)
+
+    def test_multipart_generated_body(self):
+        """Test parts of generated body are generated data at offset of the parts."""
+        body = self.s3api.data_generator.get_body(KEY, 1500, offset=10)
+        asyncio.run(self.s3api.upload_object(BUCKET, KEY, body=body))
+        self.assertEqual(len(self.parts), 5)
+        self.assertEqual(self.get_data(), self.s3api.data_generator.read(KEY, 1500, 10))
+
+    def test_multipart_file(self):
+        """Test file larger than threshold is uploaded in parts."""
+        data = os.urandom(1200)
+        file_obj, file_path = tempfile.mkstemp()
+        with os.fdopen(file_obj, "wb") as file_out:
+            file_out.write(data)
+        self.addCleanup(os.remove, file_path)
+        asyncio.run(self.s3api.upload_object(BUCKET, KEY, file_path=file_path))
+        self.assertEqual(len(self.parts), 4)
+        self.assertEqual(self.get_data(), data)
+
+    def test_failed_upload_aborted(self):
+        """Test multipart upload is aborted if a part failed."""
+        self.failed_part = 2
+        with self.assertRaises(ClientError):
+            asyncio.run(self.s3api.upload_object(BUCKET, KEY, body=os.urandom(2000)))
+        self.assertEqual(self.requests, ["create_multipart_upload", "abort_multipart_upload"])
+
+    def test_threshold_disabled(self):
+        """Test put object is used for any size if threshold is 0."""
+        with mock.patch.dict(MULTIPART_CFG, {"upload_threshold": 0}):
+            asyncio.run(self.s3api.upload_object(BUCKET, KEY, body=os.urandom(5000)))
+        self.assertEqual(self.requests, ["put_object"])
+
+    def test_part_size(self):
+        """Test part size is increased for object to fit in max parts."""
+        self.assertEqual(self.s3api.get_part_size(3000), 300)
+        self.assertEqual(self.s3api.get_part_size(300 * MAX_PARTS + 1), 301)
+
+
+class TestDeletePrefixObjects(unittest.TestCase):
+    """Tests suite for streaming batched deletion of objects by prefix."""
+
+    def setUp(self):
+        """Replace listing and delete objects by fake bucket of keys."""
+        self.s3api = S3Object("access", "secret")
+        self.keys = [f"logs/{num:04}" for num in range(2500)] + [f"data/{num}" for num in range(5)]
+        self.failed_keys = set()
+        self.batches = []
+        self.s3api.list_objects_page = self.list_objects_page
+        self.s3api.delete_objects_batch = self.delete_objects_batch
+
+    async def list_objects_page(self, bucket_name, prefix="", continuation_token=None) -> dict:
+        """Fake listing of 1000 keys per page, page is continued after last key of the token."""
+        keys = sorted(
+            key
+            for key in self.keys
+            if key.startswith(prefix) and key > (continuation_token or "")
+        )
+        response = {
+            "Contents": [{"Key": key} for key in keys[:1000]],
+            "IsTruncated": len(keys) > 1000,
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = keys[999]
+        return response
+
+    async def delete_objects_batch(self, bucket_name, keys) -> list:
+        """Fake delete objects batch, failed keys are not deleted."""
+        self.batches.append(len(keys))
+        errors = []
+        for key in keys:
+            if key in self.failed_keys:
+                errors.append({"Key": key, "Code": "AccessDenied", "Message": bucket_name})
+            else:
+                self.keys.remove(key)
+        return errors
+
+    def test_delete_prefix(self):
+        """Test objects of prefix are deleted by batches of batch size."""
+        result = asyncio.run(
+            self.s3api.delete_prefix_objects(
+                BUCKET, "logs/", batch_size=400, batches_in_flight=2
+            )
+        )
+        self.assertEqual(result, {"Deleted": 2500, "Errors": []})
+        self.assertEqual(self.keys, [f"data/{num}" for num in range(5)])
+        self.assertEqual(max(self.batches), 400)
+        self.assertEqual(sum(self.batches), 2500)
+
+    def test_delete_all(self):
+        """Test all objects are deleted without prefix."""
+        result = asyncio.run(self.s3api.delete_prefix_objects(BUCKET))
+        self.assertEqual(result["Deleted"], 2505)
+        self.assertEqual(self.keys, [])
+
+    def test_failed_keys(self):
+        """Test keys failed to delete are reported and kept."""
+        self.failed_keys = {"data/1", "data/3"}
+        result = asyncio.run(self.s3api.delete_prefix_objects(BUCKET, "data/"))
+        self.assertEqual(result["Deleted"], 3)
+        self.assertEqual(sorted(error["Key"] for error in result["Errors"]), ["data/1", "data/3"])
+        self.assertEqual(sorted(self.failed_keys), [key for key in self.keys if "data" in key])
+
+    def test_sync_delete(self):
+        """Test sync callers delete objects of prefix in own event loop."""
+        result = self.s3api.delete_s3_objects(BUCKET, "data/")
+        self.assertEqual(result, {"Deleted": 5, "Errors": []})
+        self.assertEqual(len(self.keys), 2500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,6 +21,7 @@
 
 """Unittest to test s3 parallel io ops lib."""
 
+import asyncio
 import unittest
 
 import sys
@@ -58,9 +59,13 @@ class TestS3ApiParallelIO(unittest.TestCase):
         cls.validate_distribution = {1024: 100, 2048: 50, 4096: 210}
         cls.partial_del_distribution = {1024: 100, 2048: 50, 4096: 210}
 
+    def execute_workload(self, **kwargs):
+        """Execute workload in new event loop and close its clients."""
+        asyncio.run(self.s3obj.run_and_close_clients(self.s3obj.execute_workload, **kwargs))
+
     def test_1_write_data(self):
         """Test write distribution."""
-        self.s3obj.execute_workload(
+        self.execute_workload(
             operations="write", sessions=5, distribution=self.write_distribution
         )
         for bucket in self.s3obj.io_ops_dict:
@@ -72,7 +77,7 @@ class TestS3ApiParallelIO(unittest.TestCase):
 
     def test_2_read_data(self):
         """Test read distribution."""
-        self.s3obj.execute_workload(
+        self.execute_workload(
             operations="read",
             sessions=5,
             distribution=self.read_distribution,
@@ -88,7 +93,7 @@ class TestS3ApiParallelIO(unittest.TestCase):
 
     def test_3_validate_data(self):
         """Test validate data."""
-        self.s3obj.execute_workload(
+        self.execute_workload(
             operations="validate", sessions=5, distribution=self.validate_distribution
         )
         for bucket in self.s3obj.validated_files:
@@ -100,7 +105,7 @@ class TestS3ApiParallelIO(unittest.TestCase):
 
     def test_4_partial_delete(self):
         """Test partial delete."""
-        self.s3obj.execute_workload(
+        self.execute_workload(
             operations="delete", sessions=5, distribution=self.partial_del_distribution
         )
         for bucket in self.s3obj.deleted_files:
@@ -118,7 +123,7 @@ class TestS3ApiParallelIO(unittest.TestCase):
                 if str(object_size) in bucket:
                     distribution[object_size] = len(self.s3obj.io_ops_dict[bucket])
         self.log.info(distribution)
-        self.s3obj.execute_workload(
+        self.execute_workload(
             operations="delete", sessions=5, distribution=distribution
         )
         for bucket in self.s3obj.io_ops_dict:
@@ -128,7 +133,7 @@ class TestS3ApiParallelIO(unittest.TestCase):
 
     def test_6_cleanup(self):
         """Test cleanup."""
-        self.s3obj.execute_workload(operations="cleanup", sessions=3)
+        self.execute_workload(operations="cleanup", sessions=3)
         list_buckets = self.s3obj.list_s3_buckets()
         self.log.info(list_buckets)
         assert len(list_buckets) == 0, f"Failed to cleanup data: {list_buckets}"
@@ -0,0 +1,76 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for adaptive chunk sizer."""
+
+import unittest
+
+from src.commons.utils.chunk_sizer import ChunkSizer
+from src.commons.utils.chunk_sizer import KIB
+from src.commons.utils.chunk_sizer import MIB
+
+
+class TestChunkSizer(unittest.TestCase):
+    """Tests suite for ChunkSizer."""
+
+    def test_default_chunk_size(self):
+        """Test default chunk size is used till bandwidth is estimated."""
+        self.assertEqual(ChunkSizer().get_chunk_size(), 4 * MIB)
+        self.assertEqual(ChunkSizer().get_chunk_size(1024 * MIB), 4 * MIB)
+
+    def test_object_size(self):
+        """Test chunk size is capped to object size rounded up to power of two and bounds."""
+        sizer = ChunkSizer()
+        self.assertEqual(sizer.get_chunk_size(100 * KIB), 128 * KIB)
+        self.assertEqual(sizer.get_chunk_size(1), 64 * KIB)
+        self.assertEqual(sizer.get_chunk_size(0), 64 * KIB)
+
+    def test_bandwidth_chunk_size(self):
+        """Test chunk size is data received in target time at estimated bandwidth."""
+        sizer = ChunkSizer(target_chunk_ms=100)
+        sizer.record(10 * MIB, 1)
+        self.assertEqual(sizer.get_chunk_size(), 1 * MIB)
+        sizer = ChunkSizer(target_chunk_ms=100)
+        sizer.record(1024 * MIB, 1)
+        self.assertEqual(sizer.get_chunk_size(), 16 * MIB)
+        sizer = ChunkSizer(target_chunk_ms=100)
+        sizer.record(100 * KIB, 1)
+        self.assertEqual(sizer.get_chunk_size(), 64 * KIB)
+
+    def test_moving_average(self):
+        """Test bandwidth is moving average of reads and small reads are skipped."""
+        sizer = ChunkSizer(smoothing=0.5)
+        sizer.record(10 * MIB, 1)
+        sizer.record(20 * MIB, 1)
+        self.assertEqual(sizer.bandwidth, 15 * MIB)
+        sizer.record(1 * KIB, 0.001)
+        sizer.record(10 * MIB, 0)
+        self.assertEqual(sizer.bandwidth, 15 * MIB)
+
+    def test_invalid_bounds(self):
+        """Test invalid chunk size bounds are rejected."""
+        with self.assertRaises(ValueError):
+            ChunkSizer(min_chunk_size=0)
+        with self.assertRaises(ValueError):
+            ChunkSizer(min_chunk_size=2 * MIB, max_chunk_size=MIB)
+
+
+if __name__ == "__main__":
+    unittest.main()
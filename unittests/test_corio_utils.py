@@ -0,0 +1,147 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for retries of s3 operations."""
+
+import asyncio
+import sys
+import unittest
+from unittest import mock
+
+from botocore.exceptions import ClientError
+from botocore.exceptions import IncompleteReadError
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.commons.utils import corio_utils
+    from src.commons.utils.corio_utils import RetryBudget
+    from src.commons.utils.corio_utils import get_retry_delay
+    from src.commons.utils.corio_utils import is_retryable_error
+    from src.commons.utils.corio_utils import retries
+
+
+def get_client_error(status: int, code: str = "") -> ClientError:
+    """Get s3 client error of http status and error code."""
+    return ClientError(
+        {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}, "GetObject"
+    )
+
+
+class TestRetries(unittest.TestCase):
+    """Tests suite for retry policy and retries wrapper."""
+
+    def setUp(self):
+        """Use fresh retry budget per test."""
+        patcher = mock.patch.object(corio_utils, "RETRY_BUDGET", RetryBudget(0.1, 100))
+        self.budget = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_retryable_errors(self):
+        """Test throttling, 5xx, connection failures and truncated bodies are retryable."""
+        for error in (
+            get_client_error(503, "ServiceUnavailable"),
+            get_client_error(429),
+            get_client_error(400, "SlowDown"),
+            ConnectionError("reset"),
+            asyncio.TimeoutError(),
+            IncompleteReadError(actual_bytes=1, expected_bytes=2),
+        ):
+            self.assertTrue(is_retryable_error(error), error)
+
+    def test_fatal_errors(self):
+        """Test 4xx and other errors are not retryable."""
+        for error in (
+            get_client_error(404, "NoSuchKey"),
+            get_client_error(403, "AccessDenied"),
+            ValueError("bad value"),
+        ):
+            self.assertFalse(is_retryable_error(error), error)
+
+    def test_retry_budget(self):
+        """Test retries are limited by reserve and refilled by calls."""
+        budget = RetryBudget(ratio=0.5, reserve=2)
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+        for _ in range(10):
+            budget.deposit()
+        self.assertEqual(budget.tokens, 2)
+
+    def test_retry_delay(self):
+        """Test delay is jittered within exponential backoff capped to max delay."""
+        for attempt in range(8):
+            for _ in range(20):
+                delay = get_retry_delay(attempt, 0.5, 10)
+                self.assertGreaterEqual(delay, 0)
+                self.assertLessEqual(delay, min(10, 0.5 * 2**attempt))
+
+    def test_retry_until_success(self):
+        """Test retryable failures are retried till the call succeeds."""
+        func = mock.Mock(
+            side_effect=[get_client_error(503), ConnectionError("reset"), "done"],
+            __name__="get_object",
+        )
+        self.assertEqual(retries(asyncio=False, max_retry=3, retry_delay=0)(func)(), "done")
+        self.assertEqual(func.call_count, 3)
+
+    def test_fatal_error_not_retried(self):
+        """Test fatal error is raised without retry."""
+        func = mock.Mock(side_effect=get_client_error(404, "NoSuchKey"), __name__="get_object")
+        with self.assertRaises(ClientError):
+            retries(asyncio=False, max_retry=3, retry_delay=0)(func)()
+        self.assertEqual(func.call_count, 1)
+
+    def test_retries_exhausted(self):
+        """Test error is raised after max_retry attempts."""
+        func = mock.Mock(side_effect=get_client_error(503), __name__="get_object")
+        with self.assertRaises(ClientError):
+            retries(asyncio=False, max_retry=2, retry_delay=0)(func)()
+        self.assertEqual(func.call_count, 2)
+
+    def test_retry_budget_exhausted(self):
+        """Test retryable error is raised once retry budget is exhausted."""
+        func = mock.Mock(side_effect=get_client_error(503), __name__="get_object")
+        with mock.patch.object(corio_utils, "RETRY_BUDGET", RetryBudget(0, 0)):
+            with self.assertRaises(ClientError):
+                retries(asyncio=False, max_retry=3, retry_delay=0)(func)()
+        self.assertEqual(func.call_count, 1)
+
+    def test_async_retries(self):
+        """Test coroutine is retried on retryable failure."""
+        attempts = []
+
+        @retries(max_retry=3, retry_delay=0)
+        async def get_object():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise IncompleteReadError(actual_bytes=1, expected_bytes=2)
+            return "done"
+
+        self.assertEqual(asyncio.run(get_object()), "done")
+        self.assertEqual(len(attempts), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
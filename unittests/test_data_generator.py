@@ -0,0 +1,148 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for data generator."""
+
+import hashlib
+import io
+import random
+import sys
+import unittest
+import zlib
+from unittest import mock
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.commons.utils.data_generator import BLOCK_SIZE
+    from src.commons.utils.data_generator import DataGenerator
+    from src.commons.utils.data_generator import TEXT_CHARS
+    from src.commons.utils.data_pool import get_data_pool
+    from src.commons.utils.hash_utils import new_hash
+
+
+class TestDataGenerator(unittest.TestCase):
+    """Tests suite for DataGenerator."""
+
+    def test_deterministic_data(self):
+        """Test same seed and key generate same data, other seed or key generate other data."""
+        data = DataGenerator(seed=7).read("object-1", 4096)
+        self.assertEqual(len(data), 4096)
+        self.assertEqual(DataGenerator(seed=7).read("object-1", 4096), data)
+        self.assertNotEqual(DataGenerator(seed=7).read("object-2", 4096), data)
+        self.assertNotEqual(DataGenerator(seed=8).read("object-1", 4096), data)
+
+    def test_read_at_offset(self):
+        """Test data at offset is same as the data read from start, across block boundary."""
+        generator = DataGenerator(seed=7)
+        data = generator.read("object-1", 2 * BLOCK_SIZE + 10)
+        for offset, size in ((0, 10), (5, 100), (BLOCK_SIZE - 100, 200), (BLOCK_SIZE + 3, 5)):
+            self.assertEqual(generator.read("object-1", size, offset), data[offset : offset + size])
+
+    def test_checksum(self):
+        """Test checksum is sha256 of the generated data."""
+        generator = DataGenerator(seed=7)
+        size = BLOCK_SIZE + 1
+        self.assertEqual(
+            generator.checksum("object-1", size),
+            hashlib.sha256(generator.read("object-1", size)).hexdigest(),
+        )
+
+    def test_object_body(self):
+        """Test body streams the generated data and is rewound on seek."""
+        generator = DataGenerator(seed=7)
+        size = BLOCK_SIZE + 100
+        body = generator.get_body("object-1", size, offset=10)
+        self.assertEqual(len(body), size)
+        chunks = iter(lambda: body.read(64 * 1024), b"")
+        self.assertEqual(b"".join(chunks), generator.read("object-1", size, 10))
+        body.seek(-100, io.SEEK_END)
+        self.assertEqual(body.read(), generator.read("object-1", 100, size - 90))
+        body.seek(0)
+        self.assertEqual(body.read(10), generator.read("object-1", 10, 10))
+
+
+    def test_object_body_hasher(self):
+        """Test body data is hashed once though it is read again after rewind."""
+        generator = DataGenerator(seed=7)
+        size = BLOCK_SIZE + 100
+        body = generator.get_body("object-1", size, hasher=new_hash())
+        body.read(1000)
+        body.seek(0)
+        body.read(BLOCK_SIZE)
+        self.assertEqual(body.hexdigest(), generator.checksum("object-1", size))
+        self.assertEqual(body.read(), generator.read("object-1", 100, BLOCK_SIZE))
+
+    def test_zero_profile(self):
+        """Test zero data profile generates only zero bytes."""
+        data = DataGenerator(seed=7, profile={"type": "zero"}).read("object-1", BLOCK_SIZE + 10)
+        self.assertEqual(data, bytes(BLOCK_SIZE + 10))
+
+    def test_text_profile(self):
+        """Test text data profile generates printable characters."""
+        data = DataGenerator(seed=7, profile={"type": "text"}).read("object-1", BLOCK_SIZE + 10)
+        self.assertTrue(set(data) <= set(TEXT_CHARS.tobytes()))
+
+    def test_compress_profile(self):
+        """Test compressible data is compressed about as per compression ratio."""
+        size = 2 * BLOCK_SIZE
+        random_data = DataGenerator(seed=7).read("object-1", size)
+        data = DataGenerator(seed=7, profile={"compress": 4}).read("object-1", size)
+        self.assertGreater(len(zlib.compress(random_data)), 0.99 * size)
+        self.assertLess(len(zlib.compress(data)), 0.5 * size)
+
+    def test_dedup_profile(self):
+        """Test dedupable data has duplicate blocks across keys, random data has none."""
+        blocks = 16
+
+        def get_blocks(generator: DataGenerator) -> list:
+            return [
+                generator.read(f"object-{key}", BLOCK_SIZE, index * BLOCK_SIZE)
+                for key in range(2)
+                for index in range(blocks)
+            ]
+
+        self.assertEqual(len(set(get_blocks(DataGenerator(seed=7)))), 2 * blocks)
+        dedup_blocks = get_blocks(DataGenerator(seed=7, profile={"dedup": 0.9}))
+        self.assertLess(len(set(dedup_blocks)), 2 * blocks)
+
+    def test_invalid_profile(self):
+        """Test unknown type and out of range ratios are rejected."""
+        for profile in ({"type": "image"}, {"compress": 0.5}, {"dedup": 1}, {"dedup": -0.1}):
+            with self.assertRaises(ValueError):
+                DataGenerator(seed=7, profile=profile)
+
+
+class TestDataPool(unittest.TestCase):
+    """Tests suite for DataPool."""
+
+    def test_random_data_keeps_global_random(self):
+        """Test random data offsets are not drawn from seeded global random of workload."""
+        pool = get_data_pool()
+        random.seed(11)
+        expected = [random.random() for _ in range(3)]
+        random.seed(11)
+        chunks = list(pool.iter_random_data(3 * 1024 + 1, chunk_size=1024))
+        self.assertEqual([len(chunk) for chunk in chunks], [1024, 1024, 1024, 1])
+        self.assertEqual([random.random() for _ in range(3)], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
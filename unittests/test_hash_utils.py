@@ -0,0 +1,152 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Affero General Public License for more details.
+# You should have received a copy of the GNU Affero General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+# For any questions about this software or licensing,
+# please email opensource@seagate.com or cortx-questions@seagate.com.
+#
+
+
+"""Unit tests for hashing of data integrity checks."""
+
+import asyncio
+import hashlib
+import os
+import sys
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from unittests import CORIO_ARGS
+
+with mock.patch.object(sys, "argv", CORIO_ARGS):
+    from src.commons.utils import hash_utils
+    from src.commons.utils.hash_utils import BLAKE2B
+    from src.commons.utils.hash_utils import CRC32C
+    from src.commons.utils.hash_utils import ChunkHasher
+    from src.commons.utils.hash_utils import MD5
+    from src.commons.utils.hash_utils import MIN_OFFLOAD_SIZE
+    from src.commons.utils.hash_utils import SHA256
+    from src.commons.utils.hash_utils import get_hash_algorithms
+    from src.commons.utils.hash_utils import new_hash
+
+
+class TestChunkHasher(unittest.TestCase):
+    """Tests suite for ChunkHasher."""
+
+    def setUp(self):
+        """Chunks smaller and larger than offload size."""
+        self.chunks = [
+            os.urandom(size) for size in (10, MIN_OFFLOAD_SIZE, 2 * MIN_OFFLOAD_SIZE + 1, 100)
+        ]
+        self.digest = hashlib.sha256(b"".join(self.chunks)).hexdigest()
+
+    def test_update(self):
+        """Test chunks are hashed in order."""
+        file_hash = ChunkHasher()
+        for chunk in self.chunks:
+            file_hash.update(chunk)
+        self.assertEqual(file_hash.hexdigest(), self.digest)
+
+    def test_update_async(self):
+        """Test chunks are hashed in order without blocking event loop."""
+
+        async def get_digest() -> str:
+            file_hash = ChunkHasher()
+            for chunk in self.chunks:
+                await file_hash.update_async(chunk)
+            return await file_hash.hexdigest_async()
+
+        self.assertEqual(asyncio.run(get_digest()), self.digest)
+
+    def test_wait_async(self):
+        """Test waiting for pending chunk does not finalize the digest."""
+
+        async def get_digest() -> str:
+            file_hash = ChunkHasher()
+            await file_hash.update_async(self.chunks[2])
+            self.assertIsNotNone(file_hash.pending)
+            await file_hash.wait_async()
+            self.assertIsNone(file_hash.pending)
+            await file_hash.update_async(self.chunks[3])
+            return await file_hash.hexdigest_async()
+
+        self.assertEqual(
+            asyncio.run(get_digest()),
+            hashlib.sha256(self.chunks[2] + self.chunks[3]).hexdigest(),
+        )
+
+    def test_offload(self):
+        """Test large chunks are hashed on hash thread pool and small chunks inline."""
+        threads = []
+        with mock.patch.object(
+            hash_utils,
+            "record_hashing",
+            side_effect=lambda *args: threads.append(threading.current_thread()),
+        ):
+            file_hash = ChunkHasher()
+            for chunk in self.chunks:
+                file_hash.update(chunk)
+            file_hash.hexdigest()
+        main_thread = threading.current_thread()
+        self.assertEqual([thread is main_thread for thread in threads], [True, False, False, True])
+        self.assertTrue(threads[1].name.startswith("hash"))
+
+
+class TestHashAlgorithms(unittest.TestCase):
+    """Tests suite for hash algorithms of integrity checks."""
+
+    def test_hashlib_algorithms(self):
+        """Test hashlib algorithms are hashed in chunks same as hashlib."""
+        data = os.urandom(MIN_OFFLOAD_SIZE + 10)
+        for name in (SHA256, BLAKE2B, MD5):
+            file_hash = ChunkHasher(name)
+            file_hash.update(data[:10])
+            file_hash.update(data[10:])
+            self.assertEqual(file_hash.hexdigest(), hashlib.new(name, data).hexdigest(), name)
+
+    def test_unsupported_algorithm(self):
+        """Test unknown algorithm is rejected."""
+        with self.assertRaises(ValueError):
+            new_hash("sha1")
+
+    def test_crc32c_not_installed(self):
+        """Test crc32c is rejected and not listed without crc32c package."""
+        with mock.patch.object(hash_utils, "crc32c", None):
+            with self.assertRaises(ValueError):
+                new_hash(CRC32C)
+            self.assertEqual(get_hash_algorithms(), [SHA256, BLAKE2B, MD5])
+
+    def test_crc32c_chained(self):
+        """Test crc32c checksum is chained across updates and formatted as 8 hex digits."""
+        fake_crc32c = SimpleNamespace(crc32c=lambda data, value: value * 31 + len(data))
+        with mock.patch.object(hash_utils, "crc32c", fake_crc32c):
+            file_hash = new_hash(CRC32C)
+            file_hash.update(b"abc")
+            file_hash.update(b"de")
+            self.assertEqual(file_hash.hexdigest(), f"{3 * 31 + 2:08x}")
+            self.assertIn(CRC32C, get_hash_algorithms())
+
+    @unittest.skipUnless(hash_utils.crc32c, "crc32c package is not installed")
+    def test_crc32c(self):
+        """Test crc32c check value."""
+        file_hash = new_hash(CRC32C)
+        file_hash.update(b"1234")
+        file_hash.update(b"56789")
+        self.assertEqual(file_hash.hexdigest(), "e3069283")
+
+
+if __name__ == "__main__":
+    unittest.main()
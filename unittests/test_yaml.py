@@ -189,6 +189,10 @@ class TestMasterConfig(unittest.TestCase):
         test_set_copy["test_1"]["sessions_per_node"] = master_config[
             "sessions_per_node"
         ]
+        test_set_copy["test_1"]["validation_mode"] = master_config["validation_mode"]
+        test_set_copy["test_1"]["data_profile"] = master_config["data_profile"]
+        test_set_copy["test_1"]["hash_algorithm"] = master_config["hash_algorithm"]
+        test_set_copy["test_1"]["parallel_read"] = master_config["parallel_read"]
         self.assertEqual(out["test_1"], test_set_copy["test_1"])
         self.assertNotEqual(id(out["test_1"]), id(test_set_copy["test_1"]))
 
@@ -210,6 +214,11 @@ class TestMasterConfig(unittest.TestCase):
         test_set_copy["test_1"]["sessions"] = master_config["sessions"]
         test_set_copy["test_1"]["part_range"] = master_config["part_range"]
         test_set_copy["test_1"]["object_size"] = master_config["object_size"]
+        test_set_copy["test_1"]["hash_algorithm"] = master_config["hash_algorithm"]
+        test_set_copy["test_1"]["parts_in_flight"] = master_config["parts_in_flight"]
+        test_set_copy["test_1"]["parallel_read"] = master_config["parallel_read"]
+        test_set_copy["test_1"]["validation_mode"] = master_config["validation_mode"]
+        test_set_copy["test_1"]["full_validation_fraction"] = master_config["full_validation_fraction"]
         self.assertEqual(out["test_1"], test_set_copy["test_1"])
         self.assertNotEqual(id(out["test_1"]), id(test_set_copy["test_1"]))
 
@@ -233,6 +242,11 @@ class TestMasterConfig(unittest.TestCase):
         test_set_copy["test_1"]["range_read"] = master_config["range_read"]
         test_set_copy["test_1"]["part_range"] = master_config["part_range"]
         test_set_copy["test_1"]["object_size"] = "5Gib"
+        test_set_copy["test_1"]["hash_algorithm"] = master_config["hash_algorithm"]
+        test_set_copy["test_1"]["parts_in_flight"] = master_config["parts_in_flight"]
+        test_set_copy["test_1"]["parallel_read"] = master_config["parallel_read"]
+        test_set_copy["test_1"]["validation_mode"] = master_config["validation_mode"]
+        test_set_copy["test_1"]["full_validation_fraction"] = master_config["full_validation_fraction"]
         self.assertEqual(out["test_1"], test_set_copy["test_1"])
         self.assertNotEqual(id(out["test_1"]), id(test_set_copy["test_1"]))
 
@@ -255,6 +269,11 @@ class TestMasterConfig(unittest.TestCase):
         test_set_copy["test_1"]["sessions"] = master_config["sessions"]
         test_set_copy["test_1"]["part_range"] = master_config["part_range"]
         test_set_copy["test_1"]["object_size"] = "12Mb"
+        test_set_copy["test_1"]["hash_algorithm"] = master_config["hash_algorithm"]
+        test_set_copy["test_1"]["parts_in_flight"] = master_config["parts_in_flight"]
+        test_set_copy["test_1"]["parallel_read"] = master_config["parallel_read"]
+        test_set_copy["test_1"]["validation_mode"] = master_config["validation_mode"]
+        test_set_copy["test_1"]["full_validation_fraction"] = master_config["full_validation_fraction"]
         self.assertEqual(out["test_1"], test_set_copy["test_1"])
         self.assertNotEqual(id(out["test_1"]), id(test_set_copy["test_1"]))
 
@@ -279,6 +298,11 @@ class TestMasterConfig(unittest.TestCase):
         test_set_copy["test_1"]["part_range"] = master_config["part_range"]
         test_set_copy["test_1"]["range_read"] = master_config["range_read"]
         test_set_copy["test_1"]["object_size"] = master_config["object_size"]
+        test_set_copy["test_1"]["hash_algorithm"] = master_config["hash_algorithm"]
+        test_set_copy["test_1"]["parts_in_flight"] = master_config["parts_in_flight"]
+        test_set_copy["test_1"]["parallel_read"] = master_config["parallel_read"]
+        test_set_copy["test_1"]["validation_mode"] = master_config["validation_mode"]
+        test_set_copy["test_1"]["full_validation_fraction"] = master_config["full_validation_fraction"]
         self.assertEqual(out["test_1"], test_set_copy["test_1"])
         self.assertNotEqual(id(out["test_1"]), id(test_set_copy["test_1"]))
 
@@ -303,6 +327,11 @@ class TestMasterConfig(unittest.TestCase):
         test_set_copy["test_1"]["sessions"] = master_config["sessions"]
         test_set_copy["test_1"]["part_range"] = {"start": 50, "end": 1000}
         test_set_copy["test_1"]["object_size"] = master_config["object_size"]
+        test_set_copy["test_1"]["hash_algorithm"] = master_config["hash_algorithm"]
+        test_set_copy["test_1"]["parts_in_flight"] = master_config["parts_in_flight"]
+        test_set_copy["test_1"]["parallel_read"] = master_config["parallel_read"]
+        test_set_copy["test_1"]["validation_mode"] = master_config["validation_mode"]
+        test_set_copy["test_1"]["full_validation_fraction"] = master_config["full_validation_fraction"]
         self.assertEqual(out["test_1"], test_set_copy["test_1"])
         self.assertNotEqual(id(out["test_1"]), id(test_set_copy["test_1"]))
 
@@ -327,6 +356,11 @@ class TestMasterConfig(unittest.TestCase):
         test_set_copy["test_1"]["sessions"] = master_config["sessions"]
         test_set_copy["test_1"]["part_range"] = {"start": 50, "end": 1000}
         test_set_copy["test_1"]["object_size"] = master_config["object_size"]
+        test_set_copy["test_1"]["hash_algorithm"] = master_config["hash_algorithm"]
+        test_set_copy["test_1"]["parts_in_flight"] = master_config["parts_in_flight"]
+        test_set_copy["test_1"]["parallel_read"] = master_config["parallel_read"]
+        test_set_copy["test_1"]["validation_mode"] = master_config["validation_mode"]
+        test_set_copy["test_1"]["full_validation_fraction"] = master_config["full_validation_fraction"]
         self.assertEqual(out["test_1"], test_set_copy["test_1"])
         self.assertNotEqual(id(out["test_1"]), id(test_set_copy["test_1"]))
 
@@ -351,6 +385,10 @@ class TestMasterConfig(unittest.TestCase):
         ]
         test_set_copy["test_1"]["range_read"] = "200bytes"
         test_set_copy["test_1"]["object_size"] = master_config["object_size"]
+        test_set_copy["test_1"]["validation_mode"] = master_config["validation_mode"]
+        test_set_copy["test_1"]["data_profile"] = master_config["data_profile"]
+        test_set_copy["test_1"]["hash_algorithm"] = master_config["hash_algorithm"]
+        test_set_copy["test_1"]["parallel_read"] = master_config["parallel_read"]
         self.assertEqual(out["test_1"], test_set_copy["test_1"])
         self.assertNotEqual(id(out["test_1"]), id(test_set_copy["test_1"]))
 
@@ -373,6 +411,10 @@ class TestMasterConfig(unittest.TestCase):
             "sessions_per_node"
         ]
         test_set_copy["test_1"]["object_size"] = master_config["object_size"]
+        test_set_copy["test_1"]["validation_mode"] = master_config["validation_mode"]
+        test_set_copy["test_1"]["data_profile"] = master_config["data_profile"]
+        test_set_copy["test_1"]["hash_algorithm"] = master_config["hash_algorithm"]
+        test_set_copy["test_1"]["parallel_read"] = master_config["parallel_read"]
         self.assertEqual(out["test_1"], test_set_copy["test_1"])
         self.assertNotEqual(id(out["test_1"]), id(test_set_copy["test_1"]))
 